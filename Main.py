@@ -1,11 +1,16 @@
 # Main.py
+import argparse
 import pygame
 from src import Game
 from tests import *
 
 def main():
+    parser = argparse.ArgumentParser(description="Tour Maudite")
+    parser.add_argument("--record", action="store_true", help="Enregistre chaque partie dans replays/ (relecture : python -m src.headless --replay FICHIER)")
+    args = parser.parse_args()
+
     pygame.init() # initialise tous les modules internes de Pygame
-    game = Game()
+    game = Game(record_replays=args.record)
     game.run()
     
 
@@ -1,14 +1,30 @@
 # config/settings.py
 import pygame
 
+class SilentSound:
+    """Son muet utilisé en mode sans fenêtre (mêmes méthodes que pygame.mixer.Sound)"""
+    def play(self, *args, **kwargs):
+        pass
+
+    def stop(self):
+        pass
+
+    def set_volume(self, volume):
+        pass
+
 class Settings:
-    def __init__(self, player_data):
+    def __init__(self, player_data, headless=False):
         # Configurations générales
+        self.headless = headless  # Simulation sans fenêtre ni son (tests, équilibrage)
         self.screen_width = 800
         self.screen_height = 600
         self.x0 = 0
         self.y0 = 0
-        self.fps = 60
+        self.fps = 60  # Fréquence d'affichage
+        # Simulation à pas fixe : tous les minuteurs du jeu comptent en ticks
+        # (les valeurs des entités sont réglées pour 60 ticks par seconde)
+        self.tick_rate = 60
+        self.max_ticks_per_frame = 5  # Rattrapage max si le rendu prend du retard
         self.title = "Tour Maudite"
 
         # Couleurs
@@ -20,6 +36,8 @@ class Settings:
         self.YELLOW = (255, 255, 0)
 
         self.ICON_PATH = "assets/images/icon.png"
+        self.REPLAY_DIR = "replays"
+        self.record_replays = False  # Enregistre chaque partie (python Main.py --record)
         self.PLAYER_DATA_PATH = "data/player_data.json"
 
         # Joueur
@@ -47,6 +65,21 @@ class Settings:
         self.WEAPON_TARGETING_RANGE = 500
         self.WEAPON_ARC_ANGLE = 15
 
+        # Budget des projectiles ennemis vivants : borne le temps d'image des gros patterns
+        self.ENEMY_PROJECTILE_BUDGET = 800
+        self.ENEMY_PROJECTILE_POLICY = "merge"  # "merge", "skip" ou "drop" (voir ProjectileBatch)
+        self.ENEMY_PROJECTILE_TRAIL_LIMIT = 400  # Au-delà, plus de traînées
+
+        # Ennemis : taille des vagues et séparation (évite qu'ils s'empilent)
+        self.WAVE_MAX_ENEMIES = 15
+        self.ENEMY_SEPARATION = 0.5  # Part du chevauchement résorbée par tick (0 : désactivée)
+        self.ENEMY_SEPARATION_MAX_PUSH = 3  # Poussée maximale par tick (px)
+        self.ENEMY_NEIGHBORS_PER_CELL = 4  # Voisins lus par cellule (9 cellules autour de chaque ennemi)
+
+        # Décisions lentes des ennemis (portée, flaques...) : une réflexion tous les N ticks
+        self.AI_THINK_INTERVAL = 4
+        self.AI_THINK_BUDGET_MS = 2.0  # Temps de réflexion max par tick, ignoré en simulation et en enregistrement
+
         # les perks déjà eu qu'on ne peut avoir a nouveau
         self.perks_only_once = []
         
@@ -76,6 +109,10 @@ class Settings:
         self.BORDER_WIDTH = 2
 
         self.master_volume = player_data["master_volume"]
+        self.SOUND_NAMES = (
+            "boom", "coins", "degat_1", "game_over", "game_start", "souris_on_button",
+            "spawn", "Tire_1", "Tire_2", "Tire_3", "Tire_4", "mort_enemy"
+        )
         # Si certains sons on un volume différent des autres en permanance 
         # val entre 0.0 et 1.0 au dixième
         self.sounds_volume_map = {
@@ -122,7 +159,8 @@ class Settings:
             "player_size_down":"taille du joueur -",
             "player_regen":"soigne le joueur",
             "multishot":"tire multiple +1",
-            "arc_shot":"tire en diagonale"
+            "arc_shot":"tire en diagonale",
+            "homing_shot":"tire à tête chercheuse"
         }
     
     def _init_fonts(self):
@@ -134,9 +172,29 @@ class Settings:
             "h4": pygame.font.Font(None, 18),
             "main_menu": pygame.font.SysFont(None, 60),
         }
+        # Registre par taille : une seule police par taille pour tout le jeu
+        self.fonts_by_size = {
+            48: self.font["h1"],
+            36: self.font["h2"],
+            24: self.font["h3"],
+            18: self.font["h4"],
+        }
+
+    def get_font(self, size):
+        """Police par défaut de la taille demandée (créée une seule fois)"""
+        font = self.fonts_by_size.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts_by_size[size] = font
+        return font
 
     def _init_sounds(self):
         """Initialise les sons"""
+        if self.headless:
+            # Aucun périphérique audio : des sons muets sous les mêmes noms
+            self.sounds = {key: SilentSound() for key in self.SOUND_NAMES}
+            return
+
         self.sounds = {
             "boom":pygame.mixer.Sound("assets/sounds/boom.mp3"),
             "coins":pygame.mixer.Sound("assets/sounds/coins.mp3"),
@@ -157,7 +215,8 @@ class Settings:
         self.master_volume = round(max(0, min(1, self.master_volume)), 2)
         self.player_data["master_volume"] = self.master_volume
 
-        pygame.mixer.music.set_volume(self.master_volume)
+        if not self.headless:
+            pygame.mixer.music.set_volume(self.master_volume)
         for key in self.sounds.keys():
             self.sounds[key].set_volume(self.master_volume * self.sounds_volume_map.get(key, 1))
 
@@ -166,6 +225,7 @@ class Settings:
         self.player_speed = player_data.get("player_speed", 5)
         self.player_size = player_data.get("player_size", 20)
         self.player_health = player_data.get("max_health", 100)
+        self.player_regen_power = player_data.get("regen_power", 0.1)
         self.player_data = player_data
         
         # Armes
@@ -185,4 +245,5 @@ class Settings:
                 sound.stop()
         
         # Arrêter la musique de fond (si il y en a)
-        pygame.mixer.music.stop()
\ No newline at end of file
+        if not self.headless:
+            pygame.mixer.music.stop()
\ No newline at end of file
@@ -0,0 +1,160 @@
+# src/batch.py
+"""
+Simulations en lot pour l'équilibrage : une partie sans fenêtre par seed,
+réparties sur plusieurs processus
+Utilisation : python -m src.batch --runs 1000 --seed 0 --out equilibrage.csv
+"""
+import os
+import argparse
+import csv
+import json
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from src.headless import HeadlessGame
+
+# Colonnes toujours présentes, avant les mesures par type d'ennemi et par source
+BASE_COLUMNS = ["seed", "floor", "wave", "ticks", "game_over", "death_cause", "score", "perks_chosen"]
+
+
+def simulate(seed, ticks, player_data=None):
+    """
+    Joue une partie complète et retourne sa ligne de résultats
+    Fonction de module : elle est envoyée aux processus de travail
+    """
+    game = HeadlessGame(seed=seed, player_data=player_data, autopilot=True)
+    report = game.run(ticks)
+    row = {
+        "seed": seed,
+        "floor": report["floor"],
+        "wave": report["wave"],
+        "ticks": report["ticks"],
+        "game_over": report["game_over"],
+        "score": report["score"],
+        "perks_chosen": report["perks_chosen"],
+    }
+    return row | game.scene.combat_log.summary(game.settings.tick_rate)
+
+
+def run_batch(runs, base_seed=0, ticks=36000, player_data=None, workers=None):
+    """
+    Simule `runs` parties (seeds base_seed, base_seed + 1, ...) sur `workers` processus
+    Chaque partie ne dépend que de sa seed : les lignes sont identiques quel que
+    soit le nombre de processus, et retournées dans l'ordre des seeds
+    """
+    seeds = range(base_seed, base_seed + runs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [simulate(seed, ticks, player_data) for seed in seeds]
+
+    # Gros paquets de seeds par envoi : peu d'allers-retours entre processus
+    chunksize = max(1, runs // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(simulate, seeds, repeat(ticks), repeat(player_data), chunksize=chunksize))
+
+
+def columns(rows):
+    """Colonnes de l'export : les colonnes de base puis les mesures rencontrées, triées"""
+    extra = sorted({key for row in rows for key in row} - set(BASE_COLUMNS))
+    return BASE_COLUMNS + extra
+
+
+def aggregate(rows, tick_rate=60):
+    """Résumé de toutes les parties : étages, temps pour tuer, dégâts par source, causes de mort"""
+    runs = len(rows)
+    floors = [row["floor"] for row in rows]
+    summary = {
+        "runs": runs,
+        "floor_mean": round(statistics.fmean(floors), 2),
+        "floor_median": statistics.median(floors),
+        "floor_max": max(floors),
+        "death_rate": round(sum(row["game_over"] for row in rows) / runs, 3),
+        "minutes_mean": round(statistics.fmean(row["ticks"] for row in rows) / tick_rate / 60, 2),
+    }
+    for floor in sorted(set(floors)):
+        summary[f"runs_floor_{floor}"] = floors.count(floor)
+
+    keys = columns(rows)
+    # Temps pour tuer : moyenne pondérée par le nombre d'ennemis tués
+    for key in keys:
+        if key.startswith("kills_"):
+            enemy_type = key[len("kills_"):]
+            kills = sum(row.get(key, 0) for row in rows)
+            ticks_weighted = sum(row.get(key, 0) * row.get(f"ttk_{enemy_type}", 0) for row in rows)
+            summary[f"kills_per_run_{enemy_type}"] = round(kills / runs, 2)
+            summary[f"ttk_{enemy_type}"] = round(ticks_weighted / kills, 3) if kills else ""
+    # Dégâts subis : moyenne par partie
+    for key in keys:
+        if key.startswith("damage_"):
+            summary[f"{key}_per_run"] = round(sum(row.get(key, 0) for row in rows) / runs, 2)
+    # Causes de mort
+    for row in rows:
+        if row["death_cause"]:
+            key = f"deaths_{row['death_cause']}"
+            summary[key] = summary.get(key, 0) + 1
+    return summary
+
+
+def write_rows(path, rows):
+    """Écrit une ligne par partie (CSV, ou Parquet si pyarrow est installé)"""
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("L'export Parquet nécessite pyarrow (pip install pyarrow), ou utilisez un fichier .csv")
+        ordered = [{key: row.get(key) for key in columns(rows)} for row in rows]
+        pyarrow.parquet.write_table(pyarrow.Table.from_pylist(ordered), path)
+        return
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns(rows), restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_summary(path, summary):
+    """Écrit le résumé en CSV (mesure, valeur)"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["metric", "value"])
+        writer.writerows(summary.items())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulations en lot de Tour Maudite (équilibrage)")
+    parser.add_argument("--runs", type=int, default=100, help="Nombre de parties (une seed par partie)")
+    parser.add_argument("--seed", type=int, default=0, help="Première seed")
+    parser.add_argument("--ticks", type=int, default=36000, help="Durée maximale d'une partie en ticks (60 par seconde de jeu)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (tous les cœurs par défaut)")
+    parser.add_argument("--player-data", default=None, help="Fichier JSON des données du joueur (défaut : data/default_player_data.json)")
+    parser.add_argument("--out", default="equilibrage.csv", help="Une ligne par partie (.csv ou .parquet)")
+    parser.add_argument("--summary", default=None, help="Résumé agrégé en CSV (affiché seulement par défaut)")
+    args = parser.parse_args(argv)
+
+    player_data = None
+    if args.player_data:
+        with open(args.player_data, 'r', encoding='utf-8') as f:
+            player_data = json.load(f)
+
+    start = time.perf_counter()
+    rows = run_batch(args.runs, args.seed, args.ticks, player_data, args.workers)
+    elapsed = time.perf_counter() - start
+
+    write_rows(args.out, rows)
+    summary = aggregate(rows)
+    if args.summary:
+        write_summary(args.summary, summary)
+
+    total_ticks = sum(row["ticks"] for row in rows)
+    summary["seconds"] = round(elapsed, 1)
+    summary["runs_per_second"] = round(args.runs / elapsed, 2) if elapsed > 0 else 0
+    summary["ticks_per_second"] = round(total_ticks / elapsed) if elapsed > 0 else 0
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
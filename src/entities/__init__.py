@@ -1,6 +1,8 @@
 # src/entities/__init__.py
 from .player import Player
 from .projectiles import Projectile, FireZone
+from .projectile_batch import ProjectileBatch
+from .projectile_renderer import ProjectileRenderer
 from .weapons import Weapon
 from .spawn_effect import SpawnEffect 
 
@@ -8,6 +10,8 @@ __all__ = [
     'FireZone',
     'Player',
     'Projectile',
+    'ProjectileBatch',
+    'ProjectileRenderer',
     'SpawnEffect',
     'Weapon' 
 ]
\ No newline at end of file
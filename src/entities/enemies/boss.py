@@ -2,58 +2,21 @@
 import pygame
 import math
 import random
+import numpy as np
 from .enemy import Enemy
-from ..projectiles import Projectile
-
-class SpecialProjectile:
-    """Classe de base pour les projectiles spéciaux du boss"""
-    
-    @staticmethod
-    def create_bouncing(x, y, dx, dy, damage, settings, bounces=3):
-        """Crée un projectile rebondissant sur les murs"""
-        projectile = Projectile(x, y, dx, dy, damage, settings, color=(100, 255, 100), radius=8)
-        projectile.bounces_remaining = bounces
-        projectile.is_bouncing = True
-        projectile.special_type = "bouncing"
-        return projectile
-    
-    @staticmethod
-    def create_accelerating(x, y, dx, dy, damage, settings, max_speed=10):
-        """Crée un projectile qui accélère progressivement"""
-        projectile = Projectile(x, y, dx * 0.5, dy * 0.5, damage, settings, color=(255, 150, 50), radius=6)
-        projectile.initial_speed = math.sqrt(dx**2 + dy**2) * 0.5
-        projectile.max_speed = max_speed
-        projectile.acceleration = 0.1
-        projectile.special_type = "accelerating"
-        return projectile
-    
-    @staticmethod
-    def create_splitting(x, y, dx, dy, damage, settings, splits=2):
-        """Crée un projectile qui se divise en plusieurs"""
-        projectile = Projectile(x, y, dx, dy, damage, settings, color=(150, 100, 255), radius=7)
-        projectile.will_split = True
-        projectile.splits_remaining = splits
-        projectile.split_timer = 60  # Se divise après 1 seconde
-        projectile.special_type = "splitting"
-        return projectile
-    
-    @staticmethod
-    def create_homing(x, y, dx, dy, damage, settings, player, turn_rate=0.05):
-        """Crée un projectile qui poursuit le joueur"""
-        projectile = Projectile(x, y, dx, dy, damage, settings, color=(255, 100, 150), radius=6)
-        projectile.target = player
-        projectile.turn_rate = turn_rate
-        projectile.special_type = "homing"
-        return projectile
-
+from src.utils.sprite_cache import circle_cache
+from src.utils.text_cache import text_cache
+from src.utils.rng import child_random
+from src.utils.pattern_cache import pattern_cache
+from src.systems.emission_scheduler import EmissionScheduler
 
 class RecursivePatternGenerator:
     """Générateur de patterns récursifs pour le boss"""
     
     @staticmethod
-    def generate_circle_recursive(x, y, depth, max_depth, angle_offset=0, projectile_types=None):
+    def generate_circle_recursive(x, y, depth, max_depth, angle_offset=0, projectile_types=None, rng=None):
         """
-        Génère un motif circulaire récursif
+        Génère un motif circulaire récursif (rng tire les types spéciaux parmi projectile_types)
         """
         if depth <= 0:
             return []
@@ -83,7 +46,7 @@ class RecursivePatternGenerator:
             # Type de projectile spécial
             projectile_type = None
             if projectile_types and i % 3 == 0:  # Un sur trois est spécial
-                projectile_type = random.choice(projectile_types)
+                projectile_type = rng.choice(projectile_types)
             
             result.append(('projectile', elem_x, elem_y, dx, dy, damage, projectile_type))
             
@@ -92,17 +55,17 @@ class RecursivePatternGenerator:
                 sub_result = RecursivePatternGenerator.generate_circle_recursive(
                     elem_x, elem_y, depth - 1, max_depth,
                     angle_offset + 0.5,
-                    projectile_types
+                    projectile_types,
+                    rng
                 )
                 result.extend(sub_result)
         
         return result
     
     @staticmethod
-    def generate_spiral_arms(x, y, arms=3, projectiles_per_arm=6, projectile_types=None):
-        """Génère un motif en spirale avec bras"""
+    def generate_spiral_arms(x, y, arms=3, projectiles_per_arm=6, projectile_types=None, current_time=0.0, rng=None):
+        """Génère un motif en spirale avec bras (current_time en secondes de simulation, rng comme pour le cercle)"""
         projectiles = []
-        current_time = pygame.time.get_ticks() * 0.001
         
         for arm in range(arms):
             base_angle = (2 * math.pi * arm / arms) + current_time * 0.3
@@ -123,17 +86,16 @@ class RecursivePatternGenerator:
                 # Type de projectile spécial
                 projectile_type = None
                 if projectile_types and i % 2 == 0:
-                    projectile_type = random.choice(projectile_types)
+                    projectile_type = rng.choice(projectile_types)
                 
                 projectiles.append(('projectile', px, py, dx, dy, 10, projectile_type))
         
         return projectiles
     
     @staticmethod
-    def generate_wave_pattern(x, y, waves=3, projectiles_per_wave=8):
-        """Génère un pattern en vague"""
+    def generate_wave_pattern(x, y, waves=3, projectiles_per_wave=8, current_time=0.0):
+        """Génère un pattern en vague (current_time en secondes de simulation)"""
         projectiles = []
-        current_time = pygame.time.get_ticks() * 0.001
         
         for wave in range(waves):
             wave_offset = wave * (math.pi / waves)
@@ -150,6 +112,75 @@ class RecursivePatternGenerator:
         
         return projectiles
 
+    @staticmethod
+    def _template(items):
+        """Template (tableaux NumPy) à partir des projectiles d'un générateur placé en (0, 0) sans rotation"""
+        _, x, y, dx, dy, damage, projectile_type = zip(*items)
+        return {
+            'x': np.array(x), 'y': np.array(y),
+            'dx': np.array(dx), 'dy': np.array(dy),
+            'damage': np.array(damage, dtype=np.float64),
+            'special': np.array([t is not None for t in projectile_type])  # Emplacements spéciaux
+        }
+    
+    @staticmethod
+    def circle_template(depth):
+        """Template du motif circulaire récursif (la rotation de angle_offset se fait au placement)"""
+        # Un seul type possible : chaque emplacement spécial est marqué, sans tirage du jeu
+        items = RecursivePatternGenerator.generate_circle_recursive(
+            0, 0, depth, depth, projectile_types=[True], rng=random.Random(0)
+        )
+        return RecursivePatternGenerator._template(items)
+    
+    @staticmethod
+    def spiral_template(arms, projectiles_per_arm):
+        """Template de la spirale (la rotation de current_time * 0.3 se fait au placement)"""
+        items = RecursivePatternGenerator.generate_spiral_arms(
+            0, 0, arms, projectiles_per_arm, projectile_types=[True], rng=random.Random(0)
+        )
+        return RecursivePatternGenerator._template(items)
+    
+    @staticmethod
+    def wave_template(waves, projectiles_per_wave):
+        """
+        Template de la vague : directions unitaires, et sin/cos de la phase de chaque
+        projectile (la vitesse 3 + 0.5 * sin(phase + 4 * current_time) varie avec le temps)
+        """
+        angle = np.tile(2 * np.pi * np.arange(projectiles_per_wave) / projectiles_per_wave, waves)
+        wave_offset = np.repeat(np.arange(waves) * (np.pi / waves), projectiles_per_wave)
+        n = angle.size
+        return {
+            'x': np.zeros(n), 'y': np.zeros(n),
+            'dx': np.cos(angle), 'dy': np.sin(angle),
+            'damage': np.full(n, 8.0),
+            'special': np.zeros(n, dtype=bool),
+            'phase_sin': np.sin(angle * 2 + wave_offset),
+            'phase_cos': np.cos(angle * 2 + wave_offset)
+        }
+    
+    @staticmethod
+    def burst_template(count):
+        """Template de l'explosion : directions unitaires régulières depuis le centre"""
+        angle = 2 * np.pi * np.arange(count) / count
+        return {
+            'x': np.zeros(count), 'y': np.zeros(count),
+            'dx': np.cos(angle), 'dy': np.sin(angle),
+            'damage': np.full(count, 6.0),
+            'special': np.zeros(count, dtype=bool)
+        }
+    
+    @staticmethod
+    def place(template, x, y, angle, scale=1.0):
+        """
+        Translate en (x, y) et tourne de `angle` un template ; scale (scalaire ou
+        tableau) multiplie les vitesses. Retourne (x, y, dx, dy)
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        ox, oy = template['x'], template['y']
+        vx, vy = template['dx'] * scale, template['dy'] * scale
+        return (x + ox * cos - oy * sin, y + ox * sin + oy * cos,
+                vx * cos - vy * sin, vx * sin + vy * cos)
+
 class BossDivisionSystem:
     """Gère la division du boss en deux"""
     
@@ -196,8 +227,9 @@ class BossDivisionSystem:
                 x, y, 
                 self.settings,
                 floor_number=1,
-                global_seed=hash(f"{original_boss.x}_{original_boss.y}_{i}"),
-                is_divided=True
+                global_seed=original_boss.rng.getrandbits(32),  # Dérivée du boss d'origine
+                is_divided=True,
+                emissions=original_boss.emissions  # Les salves de tous les bosses passent par la scène
             )
             
             # Réduire les stats
@@ -232,7 +264,7 @@ class BossPhase:
         self.active = False
         
         # Caractéristiques de la phase
-        self.attack_cooldown = max(50, 100 - (number * 15))  # Plus lent
+        self.attack_cooldown = max(50, 100 - (number * 15))  # En ticks, plus lent
         self.projectile_size = 7 + (number * 1)  # Taille augmentée
         self.damage_multiplier = 0.8 + ((number - 1) * 0.1)  # Réduit
         
@@ -257,9 +289,9 @@ class BossPhase:
             (255, 200, 50)      # Phase 4: Or
         ][min(number - 1, 3)]
     
-    def get_random_pattern(self):
-        """Retourne un pattern aléatoire"""
-        return random.choice(self.patterns)
+    def get_random_pattern(self, rng):
+        """Retourne un pattern aléatoire (tiré par le générateur du boss)"""
+        return rng.choice(self.patterns)
 
 
 class Boss(Enemy):
@@ -267,8 +299,24 @@ class Boss(Enemy):
     Boss avec système de division et patterns récursifs
     Nom: "Boss" (toujours)
     """
-    
-    def __init__(self, x, y, settings, floor_number=1, global_seed=None, is_divided=False):
+    # Projectiles spéciaux émis en lot :
+    # type -> (facteur de vitesse, couleur, rayon, options de ProjectileBatch.emit)
+    SPECIAL_EMISSION = {
+        'bouncing': (1.0, (100, 255, 100), 8, {'bounces': 2}),
+        'accelerating': (0.5, (255, 150, 50), 6, {'acceleration': 0.1, 'max_speed': 8}),
+        'splitting': (1.0, (150, 100, 255), 7, {'splits': 2, 'split_timer': 60}),
+        'homing': (1.0, (255, 100, 150), 6, {'turn_rate': 0.03}),
+    }
+    
+    # Déplacement : garde le joueur à distance (recule moins vite qu'il n'approche)
+    steering = "keep_distance"
+    keep_distance = 180  # Un peu plus loin pour donner de l'espace
+    keep_band = (0.8, 1.2)
+    retreat_factor = 0.7
+    screen_margin = 20
+    separation = 0.0  # Les autres ennemis s'écartent du boss, pas l'inverse
+    
+    def __init__(self, x, y, settings, floor_number=1, global_seed=0, is_divided=False, emissions=None):
         """
         Initialise le boss
         
@@ -276,8 +324,9 @@ class Boss(Enemy):
             x, y: Position
             settings: Configuration
             floor_number: Difficulté (1+)
-            global_seed: Seed aléatoire
+            global_seed: Seed du boss (tirée par la vague ou par le boss d'origine)
             is_divided: True si créé par division
+            emissions: Planificateur de salves de la scène (par défaut, le boss seul a le sien)
         """
         super().__init__(x, y, settings)
         
@@ -285,9 +334,8 @@ class Boss(Enemy):
         self.type = "boss"
         self.name = "Boss"
         
-        # Seed aléatoire
-        if global_seed is not None:
-            random.seed(global_seed + floor_number)
+        # Générateur propre au boss, dérivé de sa seed
+        self.rng = child_random(global_seed, f"boss/{floor_number}")
         
         # Statistiques adaptées
         self._init_stats(floor_number, is_divided)
@@ -296,7 +344,7 @@ class Boss(Enemy):
         self._init_appearance(floor_number)
         
         # Systèmes
-        self.special_projectile = SpecialProjectile()
+        self.emissions = emissions if emissions is not None else EmissionScheduler()  # Salves étalées sur plusieurs ticks
         self.division_system = BossDivisionSystem(settings)
         
         # Phases
@@ -319,6 +367,7 @@ class Boss(Enemy):
         
         # Animation
         self.pulse_timer = 0
+        self.ticks_alive = 0  # Horloge de simulation du boss (fait tourner les patterns)
         self.rotation_angle = 0
         
         # État
@@ -388,11 +437,25 @@ class Boss(Enemy):
     
     def update(self, player, enemy_projectiles=None):
         """
-        Met à jour le boss
+        Met à jour le boss seul : déplacement, comportement puis salves planifiées
+        (dans une scène, son planificateur est mis à jour une fois par tick par la scène)
         
         Returns:
             Tuple (None car pas d'ennemis, bosses_créés_par_division)
         """
+        self.move(player)
+        divisions = self.act(player, enemy_projectiles)
+        if enemy_projectiles is not None:
+            self.emissions.update(enemy_projectiles)
+        return None, divisions
+    
+    def act(self, player, projectiles=None, fire_zones=None, pending_zones=None):
+        """
+        Met à jour le boss après son déplacement
+        
+        Returns:
+            Bosses créés par division (ou None)
+        """
         # Stocker le joueur pour les projectiles qui poursuivent
         self.player = player
         
@@ -402,6 +465,8 @@ class Boss(Enemy):
         # Mise à jour de la division
         self.division_system.update()
         
+        self.ticks_alive += 1
+        
         # Mise à jour des animations
         self.pulse_timer += 0.05
         self.rotation_angle += 0.02
@@ -409,23 +474,18 @@ class Boss(Enemy):
         # Vérifier les phases
         self._check_phase_transition()
         
-        # Déplacement simple
-        self._simple_movement(player)
-        
-        # Garder dans l'écran
-        self._constrain_to_screen()
-        
         # Gestion des attaques
-        if enemy_projectiles is not None:
-            self._update_attacks(enemy_projectiles)
+        if projectiles is not None:
+            self._update_attacks(projectiles)
         
         # Vérifier la division
-        division_bosses = self.division_system.check_division(
+        return self.division_system.check_division(
             self, self.health, self.max_health
         )
-        
-        # Retourner les bosses de division (pas d'ennemis créés)
-        return None, division_bosses
+    
+    def _simulation_time(self):
+        """Temps de vie du boss en secondes de simulation"""
+        return self.ticks_alive / self.settings.tick_rate
     
     def _update_rage_mode(self):
         """Active le mode rage à 1/3 de vie"""
@@ -471,50 +531,25 @@ class Boss(Enemy):
         # Effet sonore
         self.settings.sounds["spawn"].play()
     
-    def _simple_movement(self, player):
-        """Déplacement simple vers le joueur"""
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = max(math.sqrt(dx*dx + dy*dy), 0.1)
-        
-        # Distance cible
-        target_distance = 180  # Un peu plus loin pour donner de l'espace
-        
-        if distance > target_distance * 1.2:
-            # Trop loin, s'approcher
-            self.x += (dx / distance) * self.speed
-            self.y += (dy / distance) * self.speed
-        elif distance < target_distance * 0.8:
-            # Trop près, s'éloigner un peu
-            self.x -= (dx / distance) * self.speed * 0.7
-            self.y -= (dy / distance) * self.speed * 0.7
-    
-    def _constrain_to_screen(self):
-        """Maintient dans l'écran"""
-        margin = self.radius + 20
-        self.x = max(margin, min(self.x, self.settings.screen_width - margin))
-        self.y = max(margin, min(self.y, self.settings.screen_height - margin))
-    
     def _update_attacks(self, enemy_projectiles):
         """Gère les attaques"""
         if self.attack_cooldown > 0:
             self.attack_cooldown -= 1
-            return
-        
-        # Choisir un pattern
-        phase = self.phases[self.current_phase - 1]
-        if self.current_pattern is None:
-            self.current_pattern = phase.get_random_pattern()
-        
-        # Exécuter l'attaque
-        self._execute_pattern(enemy_projectiles, phase)
-        
-        # Réinitialiser le cooldown
-        self.attack_cooldown = phase.attack_cooldown
-        if self.rage_mode:
-            self.attack_cooldown = max(30, phase.attack_cooldown // 2)
-        
-        self.current_pattern = None
+        else:
+            # Choisir un pattern
+            phase = self.phases[self.current_phase - 1]
+            if self.current_pattern is None:
+                self.current_pattern = phase.get_random_pattern(self.rng)
+            
+            # Exécuter l'attaque
+            self._execute_pattern(enemy_projectiles, phase)
+            
+            # Réinitialiser le cooldown
+            self.attack_cooldown = phase.attack_cooldown
+            if self.rage_mode:
+                self.attack_cooldown = max(30, phase.attack_cooldown // 2)
+            
+            self.current_pattern = None
     
     def _execute_pattern(self, enemy_projectiles, phase):
         """Exécute le pattern actuel"""
@@ -534,43 +569,17 @@ class Boss(Enemy):
     def _execute_circle_pattern(self, enemy_projectiles, phase):
         """Pattern circulaire récursif"""
         depth = min(3, self.current_phase)
+        template = pattern_cache.get(('circle', depth), RecursivePatternGenerator.circle_template, depth)
+        x, y, dx, dy = RecursivePatternGenerator.place(template, self.x, self.y, self.rotation_angle)
         
-        # Types de projectiles spéciaux
-        special_types = phase.special_projectiles if phase.special_projectiles else []
-        
-        pattern = RecursivePatternGenerator.generate_circle_recursive(
-            self.x, self.y,
-            depth=depth,
-            max_depth=depth,
-            angle_offset=self.rotation_angle,
-            projectile_types=special_types
-        )
+        # Taille augmentée
+        radius = phase.projectile_size
+        if self.rage_mode:
+            radius = int(radius * 1.4)
         
-        for item in pattern:
-            if item[0] == 'projectile':
-                _, x, y, dx, dy, damage, projectile_type = item
-                damage *= phase.damage_multiplier
-                if self.rage_mode:
-                    damage *= self.rage_damage_multiplier
-                
-                # Taille augmentée
-                radius = phase.projectile_size
-                if self.rage_mode:
-                    radius = int(radius * 1.4)
-                
-                # Créer le projectile spécial ou normal
-                if projectile_type and self.player:
-                    self._create_special_projectile(
-                        x, y, dx, dy, damage, phase.color, radius, 
-                        projectile_type, enemy_projectiles
-                    )
-                else:
-                    enemy_projectiles.append(Projectile(
-                        x, y, dx, dy, damage,
-                        settings=self.settings,
-                        color=phase.color,
-                        radius=radius
-                    ))
+        types = self._draw_special_types(template['special'], phase.special_projectiles)
+        self._emit_pattern(enemy_projectiles, types, x, y, dx, dy,
+                           self._scale_damage(template['damage'], phase), radius, phase.color)
     
     def _execute_spiral_pattern(self, enemy_projectiles, phase):
         """Pattern en spirale"""
@@ -578,96 +587,45 @@ class Boss(Enemy):
         if self.rage_mode:
             arms += 1
         
-        # Types de projectiles spéciaux
-        special_types = phase.special_projectiles if phase.special_projectiles else []
-        
-        pattern = RecursivePatternGenerator.generate_spiral_arms(
-            self.x, self.y,
-            arms=arms,
-            projectiles_per_arm=5,  # Réduit
-            projectile_types=special_types
-        )
+        template = pattern_cache.get(('spiral', arms, 5), RecursivePatternGenerator.spiral_template, arms, 5)
+        x, y, dx, dy = RecursivePatternGenerator.place(template, self.x, self.y, self._simulation_time() * 0.3)
         
-        for item in pattern:
-            if item[0] == 'projectile':
-                _, x, y, dx, dy, damage, projectile_type = item
-                damage *= phase.damage_multiplier
-                if self.rage_mode:
-                    damage *= self.rage_damage_multiplier
-                
-                radius = phase.projectile_size
-                
-                # Créer le projectile spécial ou normal
-                if projectile_type and self.player:
-                    self._create_special_projectile(
-                        x, y, dx, dy, damage, (255, 150, 100), radius, 
-                        projectile_type, enemy_projectiles
-                    )
-                else:
-                    enemy_projectiles.append(Projectile(
-                        x, y, dx, dy, damage,
-                        settings=self.settings,
-                        color=(255, 150, 100),
-                        radius=radius
-                    ))
+        types = self._draw_special_types(template['special'], phase.special_projectiles)
+        self._emit_pattern(enemy_projectiles, types, x, y, dx, dy,
+                           self._scale_damage(template['damage'], phase), phase.projectile_size, (255, 150, 100))
     
     def _execute_burst_pattern(self, enemy_projectiles, phase):
         """Explosion de projectiles"""
         projectiles_count = 6 + (self.current_phase * 2)  # Réduit
+        template = pattern_cache.get(('burst', projectiles_count), RecursivePatternGenerator.burst_template, projectiles_count)
         
+        # Tirages dans le même ordre qu'avant : vitesse puis projectile spécial, projectile par projectile
+        speed = np.empty(projectiles_count)
+        types = [None] * projectiles_count
         for i in range(projectiles_count):
-            angle = (2 * math.pi * i / projectiles_count) + self.rotation_angle
-            speed = 2.0 + random.random() * 1.0  # Réduit
-            
-            dx = math.cos(angle) * speed
-            dy = math.sin(angle) * speed
-            
-            damage = 6 * phase.damage_multiplier  # Réduit
-            if self.rage_mode:
-                damage *= self.rage_damage_multiplier
-            
-            radius = phase.projectile_size
+            speed[i] = 2.0 + self.rng.random() * 1.0  # Réduit
             
             # 25% de chance d'avoir un projectile spécial en phase 3+
-            projectile_type = None
-            if self.current_phase >= 3 and random.random() < 0.25 and self.player:
-                projectile_type = random.choice(phase.special_projectiles)
-            
-            if projectile_type:
-                self._create_special_projectile(
-                    self.x, self.y, dx, dy, damage, (255, 200, 50), radius, 
-                    projectile_type, enemy_projectiles
-                )
-            else:
-                enemy_projectiles.append(Projectile(
-                    self.x, self.y, dx, dy, damage,
-                    settings=self.settings,
-                    color=(255, 200, 50),
-                    radius=radius
-                ))
+            if self.current_phase >= 3 and self.rng.random() < 0.25 and self.player:
+                types[i] = self.rng.choice(phase.special_projectiles)
+        
+        x, y, dx, dy = RecursivePatternGenerator.place(template, self.x, self.y, self.rotation_angle, speed)
+        self._emit_pattern(enemy_projectiles, types, x, y, dx, dy,
+                           self._scale_damage(template['damage'], phase), phase.projectile_size, (255, 200, 50))
     
     def _execute_wave_pattern(self, enemy_projectiles, phase):
         """Pattern en vague"""
-        pattern = RecursivePatternGenerator.generate_wave_pattern(
-            self.x, self.y,
-            waves=2 + self.current_phase,
-            projectiles_per_wave=6
-        )
+        waves = 2 + self.current_phase
+        template = pattern_cache.get(('wave', waves, 6), RecursivePatternGenerator.wave_template, waves, 6)
         
-        for item in pattern:
-            if item[0] == 'projectile':
-                _, x, y, dx, dy, damage, _ = item
-                damage *= phase.damage_multiplier
-                if self.rage_mode:
-                    damage *= self.rage_damage_multiplier
-                
-                radius = phase.projectile_size
-                enemy_projectiles.append(Projectile(
-                    x, y, dx, dy, damage,
-                    settings=self.settings,
-                    color=(100, 200, 255),
-                    radius=radius
-                ))
+        # Effet de vague : sin(phase + 4t) développé sur les tables du template
+        current_time = self._simulation_time()
+        wave_height = (template['phase_sin'] * math.cos(4 * current_time)
+                       + template['phase_cos'] * math.sin(4 * current_time)) * 0.5
+        x, y, dx, dy = RecursivePatternGenerator.place(template, self.x, self.y, current_time, 3.0 + wave_height)
+        
+        self._emit_pattern(enemy_projectiles, [None] * len(x), x, y, dx, dy,
+                           self._scale_damage(template['damage'], phase), phase.projectile_size, (100, 200, 255))
     
     def _execute_mixed_pattern(self, enemy_projectiles, phase):
         """Mélange de patterns"""
@@ -675,8 +633,8 @@ class Boss(Enemy):
         patterns = ['circle', 'spiral', 'burst', 'wave']
         patterns.remove(self.current_pattern) if self.current_pattern in patterns else None
         
-        pattern1 = random.choice(patterns)
-        pattern2 = random.choice([p for p in patterns if p != pattern1])
+        pattern1 = self.rng.choice(patterns)
+        pattern2 = self.rng.choice([p for p in patterns if p != pattern1])
         
         # Sauvegarder le pattern actuel
         current = self.current_pattern
@@ -704,21 +662,53 @@ class Boss(Enemy):
         # Restaurer
         self.current_pattern = current
     
-    def _create_special_projectile(self, x, y, dx, dy, damage, color, radius, projectile_type, enemy_projectiles):
-        """Crée un projectile spécial"""
-        if projectile_type == 'bouncing':
-            projectile = SpecialProjectile.create_bouncing(x, y, dx, dy, damage, self.settings, bounces=2)
-        elif projectile_type == 'accelerating':
-            projectile = SpecialProjectile.create_accelerating(x, y, dx, dy, damage, self.settings, max_speed=8)
-        elif projectile_type == 'splitting':
-            projectile = SpecialProjectile.create_splitting(x, y, dx, dy, damage, self.settings, splits=2)
-        elif projectile_type == 'homing' and self.player:
-            projectile = SpecialProjectile.create_homing(x, y, dx, dy, damage, self.settings, self.player, turn_rate=0.03)
-        else:
-            # Fallback au projectile normal
-            projectile = Projectile(x, y, dx, dy, damage, self.settings, color=color, radius=radius)
+    def _scale_damage(self, damage, phase):
+        """Dégâts d'un template selon la phase et la rage"""
+        damage = damage * phase.damage_multiplier
+        if self.rage_mode:
+            damage = damage * self.rage_damage_multiplier
+        return damage
+    
+    def _draw_special_types(self, slots, special_types):
+        """Type de chaque emplacement spécial d'un template (mêmes tirages que les générateurs)"""
+        types = [None] * len(slots)
+        if special_types:
+            for i in np.flatnonzero(slots).tolist():
+                types[i] = self.rng.choice(special_types)
+        return types
+    
+    def _emit_pattern(self, enemy_projectiles, types, x, y, dx, dy, damage, radius, color):
+        """
+        Émet une salve placée : les projectiles spéciaux partent aussitôt, un emit
+        par type ; les normaux sont planifiés (au plus `budget` par tick)
+        """
+        radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), x.shape)
+        normal = np.ones(x.shape, dtype=bool)
+        if self.player:
+            by_type = {}
+            for i, projectile_type in enumerate(types):
+                if projectile_type is not None:
+                    by_type.setdefault(projectile_type, []).append(i)
+            for projectile_type, index in by_type.items():
+                normal[index] = False
+                if projectile_type not in self.SPECIAL_EMISSION:
+                    # Fallback au projectile normal
+                    enemy_projectiles.emit(x[index], y[index], dx[index], dy[index], damage[index],
+                                           radius=radius[index], color=color, source=self.type)
+                    continue
+                speed_factor, special_color, special_radius, options = self.SPECIAL_EMISSION[projectile_type]
+                target = self.player if projectile_type == 'homing' else None
+                enemy_projectiles.emit(
+                    x[index], y[index], dx[index] * speed_factor, dy[index] * speed_factor, damage[index],
+                    radius=special_radius, color=special_color, special=projectile_type,
+                    target=target, source=self.type, **options
+                )
         
-        enemy_projectiles.append(projectile)
+        origin = (self.player.x, self.player.y) if self.player else None
+        self.emissions.schedule(
+            x[normal], y[normal], dx[normal], dy[normal], damage[normal], radius[normal],
+            color, source=self.type, origin=origin
+        )
     
     def take_damage(self, amount):
         """
@@ -731,6 +721,8 @@ class Boss(Enemy):
         
         # Appliquer
         self.health -= actual_damage
+        # La rage (vitesse accrue) doit être connue avant le déplacement groupé du tick suivant
+        self._update_rage_mode()
         
         # Effet visuel
         self.pulse_timer += 0.3
@@ -757,14 +749,7 @@ class Boss(Enemy):
             rage_radius = main_radius + 10 + math.sin(current_time * 6) * 3
             rage_alpha = 80 + int(40 * math.sin(current_time * 4))
             
-            rage_surface = pygame.Surface((int(rage_radius*2), int(rage_radius*2)), pygame.SRCALPHA)
-            pygame.draw.circle(
-                rage_surface,
-                (255, 50, 50, rage_alpha),
-                (int(rage_radius), int(rage_radius)),
-                int(rage_radius)
-            )
-            screen.blit(rage_surface, (int(self.x - rage_radius), int(self.y - rage_radius)))
+            circle_cache.blit(screen, self.x, self.y, rage_radius, (255, 50, 50), rage_alpha)
         
         # Corps principal
         for i in range(3, 0, -1):
@@ -784,12 +769,7 @@ class Boss(Enemy):
                     int(phase_color[2] * blend + self.core_color[2] * (1 - blend))
                 )
             
-            layer_surface = pygame.Surface((int(radius*2), int(radius*2)), pygame.SRCALPHA)
-            pygame.draw.circle(
-                layer_surface, (*color, alpha),
-                (int(radius), int(radius)), int(radius)
-            )
-            screen.blit(layer_surface, (int(self.x - radius), int(self.y - radius)))
+            circle_cache.blit(screen, self.x, self.y, radius, color, alpha)
         
         # Cœur
         core_radius = main_radius * 0.3
@@ -819,12 +799,12 @@ class Boss(Enemy):
         # Texte
         if hasattr(self.settings, 'font') and self.settings.font:
             # Nom
-            name_text = self.settings.font["h3"].render(self.name, True, (255, 255, 255))
+            name_text = text_cache.render(self.settings.font["h3"], self.name, True, (255, 255, 255))
             name_rect = name_text.get_rect(center=(self.x, self.y - main_radius - 25))
             screen.blit(name_text, name_rect)
             
             # Phase
-            phase_text = self.settings.font["h4"].render(
+            phase_text = text_cache.render(self.settings.font["h4"], 
                 f"Phase {self.current_phase}", 
                 True, self.phases[self.current_phase - 1].color
             )
@@ -833,13 +813,13 @@ class Boss(Enemy):
             
             # Rage
             if self.rage_mode:
-                rage_text = self.settings.font["h4"].render("RAGE!", True, (255, 50, 50))
+                rage_text = text_cache.render(self.settings.font["h4"], "RAGE!", True, (255, 50, 50))
                 rage_rect = rage_text.get_rect(center=(self.x, self.y + main_radius + 20))
                 screen.blit(rage_text, rage_rect)
             
             # Division (seulement si pas encore divisé)
             if not self.is_divided_boss and self.division_system.can_divide and not self.division_system.has_divided:
-                div_text = self.settings.font["h4"].render("DIVISION DISPONIBLE", True, (255, 255, 0))
+                div_text = text_cache.render(self.settings.font["h4"], "DIVISION DISPONIBLE", True, (255, 255, 0))
                 div_rect = div_text.get_rect(center=(self.x, self.y + main_radius + 40))
                 screen.blit(div_text, div_rect)
         
@@ -911,7 +891,7 @@ class Boss(Enemy):
         
         # Texte
         if hasattr(self.settings, 'font') and self.settings.font:
-            health_text = self.settings.font["h4"].render(
+            health_text = text_cache.render(self.settings.font["h4"], 
                 f"{int(self.health)}/{self.max_health}", 
                 True, (255, 255, 255)
             )
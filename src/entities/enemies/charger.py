@@ -1,9 +1,10 @@
 # src/entities/enemies/charger.py 
 import pygame
-import math
 from .enemy import Enemy
 
 class Charger(Enemy):
+    steering = "seek"
+
     def __init__(self, x, y, settings):
         super().__init__(x, y, settings)
         self.type = "charger"
@@ -18,17 +19,6 @@ class Charger(Enemy):
         self.radius = 22
         self.attack_range = 0
     
-    def update(self, player, projectiles=None, pending_zones=None):
-        """Met à jour l'ennemi selon son type"""
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = max(math.sqrt(dx*dx + dy*dy), 0.1)
-        dx /= distance
-        dy /= distance
-        
-        self.x += dx * self.speed
-        self.y += dy * self.speed
-    
     def draw(self, screen): 
         """Dessine l'ennemi avec sa barre de vie"""
         super().draw(screen)
@@ -1,10 +1,16 @@
 # src/entities/enemies/destructeur.py 
 import pygame
 import math
+import numpy as np
 from .enemy import Enemy
-from ..projectiles import Projectile
 
 class Destructeur(Enemy):
+    steering = "seek"
+    stop_distance = 50  # Un huitième de sa portée : reste à distance de tir
+    melee = False
+    tracks_player = True
+    thinks = True
+
     def __init__(self, x, y, settings):
         super().__init__(x, y, settings)
         self.type = "destructeur"
@@ -23,61 +29,52 @@ class Destructeur(Enemy):
         self.projectile_speed = 5
         self.projectile_count = 12  # Nombre de projectiles dans le cercle
         self.last_shot_time = 0
+        self.in_range = False  # Joueur à portée à la dernière réflexion
     
-    def update(self, player, projectiles=None, pending_zones=None):
+    def think(self, player, fire_zones=None, pending_zones=None):
+        """Vérifie si le joueur est à portée"""
+        self.in_range = self.to_player[2] <= self.attack_range
+
+    def act(self, player, projectiles=None, fire_zones=None, pending_zones=None):
         """Met à jour l'ennemi selon son type"""
         if projectiles is None:
-            return
-            
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = max(math.sqrt(dx*dx + dy*dy), 0.1)
-        
-        # Se déplace vers le joueur s'il est trop loin
-        if distance > self.attack_range * 0.125:
-            norm_dx = dx / distance
-            norm_dy = dy / distance
-            
-            self.x += norm_dx * self.speed
-            self.y += norm_dy * self.speed
+            return None
         
         # Cooldown entre les tirs
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
         
         # Tire un cercle de projectiles quand le joueur est à portée
-        if (distance <= self.attack_range and 
-            self.shoot_cooldown <= 0):
+        if self.in_range and self.shoot_cooldown <= 0:
             
             self.shoot_circle(projectiles)
             self.shoot_cooldown = self.shoot_rate
+        return None
     
     def shoot_circle(self, projectiles):
         """Mini-boss : Tire un cercle complet de projectiles dans toutes les directions"""
-        angle_step = 2 * math.pi / self.projectile_count
+        angles = np.arange(self.projectile_count) * (2 * math.pi / self.projectile_count)
         
         self.settings.sounds["Tire_3"].play()
         
-        for i in range(self.projectile_count):
-            angle = i * angle_step
-            dx = math.cos(angle) * self.projectile_speed
-            dy = math.sin(angle) * self.projectile_speed
-            
-            # Couleur qui varie selon la direction
-            color_ratio = i / self.projectile_count
-            r = int(200 + 55 * math.sin(color_ratio * 2 * math.pi))
-            g = int(100 + 55 * math.cos(color_ratio * 2 * math.pi))
-            b = int(100 + 55 * math.sin(color_ratio * 3 * math.pi))
-            
-            projectiles.append(Projectile(
-                self.x, self.y,
-                dx,
-                dy,
-                self.damage,
-                self.settings,
-                color=(r, g, b, 220),  # Légèrement transparent
-                radius=7  # Projectile légèrement plus gros
-            ))
+        # Couleur qui varie selon la direction
+        color_ratio = np.arange(self.projectile_count) / self.projectile_count
+        colors = np.stack([
+            200 + 55 * np.sin(color_ratio * 2 * math.pi),
+            100 + 55 * np.cos(color_ratio * 2 * math.pi),
+            100 + 55 * np.sin(color_ratio * 3 * math.pi)
+        ], axis=1).astype(np.uint8)
+        
+        # Tout le cercle est émis en un seul lot
+        projectiles.emit(
+            self.x, self.y,
+            np.cos(angles) * self.projectile_speed,
+            np.sin(angles) * self.projectile_speed,
+            self.damage,
+            color=colors,
+            radius=7,  # Projectile légèrement plus gros
+            source=self.type
+        )
     
     def draw(self, screen):
         """Dessine l'ennemi avec sa barre de vie"""
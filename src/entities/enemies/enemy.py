@@ -1,19 +1,50 @@
 # src/entities/enemies/enemy.py 
 import pygame
+from src.systems.steering import SteeringSystem
 
 class Enemy:
     """
     Classe de base pour tous les ennemis
     Définit les propriétés et méthodes communes
     """
+    # Déplacement groupé par comportement (voir SteeringSystem), paramètres par type
+    steering = None  # "seek", "kite", "orbit", "keep_distance" ou None (immobile)
+    stop_distance = 0  # seek : n'avance plus en deçà de cette distance
+    retreat_factor = 1.0  # kite / keep_distance : vitesse de recul (fraction de speed)
+    screen_margin = None  # Marge au bord de l'écran en plus du rayon, None = pas tenu dans l'écran
+    tracks_player = False  # Reçoit to_player à chaque déplacement (distance lue par act)
+    melee = True  # Blesse le joueur au contact
+    separation = 1.0  # Poids cédé quand des ennemis se chevauchent (0 : ne s'écarte jamais)
+    explodes = False  # Explose près du joueur (géré par la scène)
+    thinks = False  # A des décisions lentes (think), espacées par l'AIScheduler
+
     def __init__(self, x, y, settings):
         self.x = x
         self.y = y
         self.settings = settings
+        self.handle = None  # Poignée dans le registre d'entités de la scène (EntityRegistry)
+        self.to_player = (0.0, 0.0, 0.0)  # (dx, dy, distance) vers le joueur avant le dernier déplacement (tracks_player)
+        self.think_epoch = None  # Reset de l'AIScheduler qui a attribué think_slot
+        self.think_slot = None  # Créneau de réflexion attribué par l'AIScheduler
+        self.think_deferred = None  # Tick du report de sa réflexion faute de budget, None si à jour
     
     def update(self, player, projectiles=None, pending_zones=None):
-        """Met à jour l'ennemi selon son type"""
-        pass
+        """Met à jour l'ennemi seul : déplacement, décision puis comportement"""
+        self.move(player)
+        if self.thinks:
+            self.think(player, pending_zones=pending_zones)
+        return self.act(player, projectiles, pending_zones=pending_zones)
+
+    def move(self, player):
+        """Déplace l'ennemi seul (en jeu, la scène déplace tous les ennemis en lot)"""
+        SteeringSystem.steer([self], player)
+
+    def think(self, player, fire_zones=None, pending_zones=None):
+        """Décisions lentes (portée, placement...), gardées jusqu'à la prochaine réflexion"""
+
+    def act(self, player, projectiles=None, fire_zones=None, pending_zones=None):
+        """Comportement après le déplacement (tirs, flaques...) ; retourne les ennemis créés ou None"""
+        return None
 
     def take_damage(self, amount):
         """Inflige des dégâts à l'ennemi"""
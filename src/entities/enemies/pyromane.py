@@ -1,7 +1,7 @@
 # src/entities/enemies/pyromane.py 
 import pygame
 import math
-import random
+from src.utils.rng import RngStreams
 from .enemy import Enemy
 from ..projectiles import FireZone
 
@@ -10,8 +10,13 @@ class Pyromane(Enemy):
     Ennemi pyromane - pose des zones de feu avec prévisualisation
     Se déplace en cercle autour du joueur
     """
-    def __init__(self, x, y, settings):
+    steering = "orbit"
+    screen_margin = 0
+    thinks = True
+
+    def __init__(self, x, y, settings, rng=None):
         super().__init__(x, y, settings)
+        self.random = (rng if rng is not None else RngStreams()).enemies  # Flux des ennemis de la scène
         self.type = "pyromane"       
         self.speed = 1.2
         self.health = 35
@@ -21,12 +26,13 @@ class Pyromane(Enemy):
         self.attack_range = 250
         self.damage = 0 
         self.fire_zone_cooldown = 0
-        self.fire_zone_rate = 210  # 3.5 secondes entre les attaques
+        self.fire_zone_wait = 0  # Ticks passés à attendre une réflexion, cooldown écoulé
+        self.fire_zone_rate = 210  # 3.5 secondes entre les attaques (en ticks)
         self.fire_zones_placed = 0
-        self.max_fire_zones = random.randint(1, 2)  # Entre 1 et 2 flaques par attaque
+        self.max_fire_zones = self.random.randint(1, 2)  # Entre 1 et 2 flaques par attaque
         
         # Mouvement circulaire
-        self.circle_angle = random.random() * 2 * math.pi
+        self.circle_angle = self.random.random() * 2 * math.pi
         self.circle_radius = 180
         self.circle_speed = 0.015
         
@@ -35,46 +41,18 @@ class Pyromane(Enemy):
         
         # Prévisualisation
         self.preview_cooldown = 0
-        self.preview_duration = 45  # 0.75s à 60 FPS (45 frames)
+        self.preview_duration = 45  # 0.75s à 60 ticks/s (45 ticks)
         self.active_previews = []  # Prévisualisations actives [(x, y, timer)]
 
 
     def update(self, player, fire_zones=None, pending_zones=None):
-        """Met à jour l'ennemi selon son type"""
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance_to_player = math.sqrt(dx*dx + dy*dy)
-        
-        if distance_to_player > self.circle_radius:
-            # Se rapprocher du cercle
-            norm_dx = dx / max(distance_to_player, 0.1)
-            norm_dy = dy / max(distance_to_player, 0.1)
-            self.x += norm_dx * self.speed
-            self.y += norm_dy * self.speed
-        else:
-            # Se déplacer en cercle autour du joueur
-            self.circle_angle += self.circle_speed
-            target_x = player.x + math.cos(self.circle_angle) * self.circle_radius
-            target_y = player.y + math.sin(self.circle_angle) * self.circle_radius
-            
-            move_x = target_x - self.x
-            move_y = target_y - self.y
-            move_dist = math.sqrt(move_x*move_x + move_y*move_y)
-            
-            if move_dist > 0:
-                move_x = move_x / move_dist * self.speed
-                move_y = move_y / move_dist * self.speed
-                self.x += move_x
-                self.y += move_y
-        
-        for preview in self.active_previews[:]:
-            preview[2] -= 1  # Décrémente le timer
-            if preview[2] <= 0:
-                # Timer terminé -> créer la flaque de feu
-                if fire_zones is not None:
-                    fire_zones.append(FireZone(preview[0], preview[1], self.settings))
-                self.active_previews.remove(preview)
-        
+        """Met à jour l'ennemi seul : déplacement, placement des flaques puis comportement"""
+        self.move(player)
+        self.think(player, fire_zones, pending_zones)
+        return self.act(player, fire_zones=fire_zones, pending_zones=pending_zones)
+
+    def think(self, player, fire_zones=None, pending_zones=None):
+        """Place les flaques de feu autour du joueur quand l'attaque est prête"""
         if (self.fire_zone_cooldown <= 0 and 
             fire_zones is not None and
             pending_zones is not None):
@@ -83,10 +61,10 @@ class Pyromane(Enemy):
             flame_positions = []
             for i in range(2):
                 # Position autour du joueur (éviter les positions trop proches)
-                angle = random.random() * 2 * math.pi
+                angle = self.random.random() * 2 * math.pi
                 min_dist = 60  # Distance minimale entre les deux flaques
                 max_dist = 120
-                flame_distance = random.randint(min_dist, max_dist)
+                flame_distance = self.random.randint(min_dist, max_dist)
                 
                 flame_x = player.x + math.cos(angle) * flame_distance
                 flame_y = player.y + math.sin(angle) * flame_distance
@@ -108,16 +86,27 @@ class Pyromane(Enemy):
                     'source': self  # Référence au Pyromane
                 })
             
-            self.fire_zone_cooldown = self.fire_zone_rate
+            # act décrémente dans le même tick (+1), l'attente d'une réflexion est rattrapée :
+            # une attaque tous les fire_zone_rate + 1 ticks, comme lorsque le placement était dans act
+            self.fire_zone_cooldown = max(1, self.fire_zone_rate + 1 - self.fire_zone_wait)
+            self.fire_zone_wait = 0
+
+    def act(self, player, projectiles=None, fire_zones=None, pending_zones=None):
+        """Met à jour l'ennemi selon son type"""
+        for preview in self.active_previews[:]:
+            preview[2] -= 1  # Décrémente le timer
+            if preview[2] <= 0:
+                # Timer terminé -> créer la flaque de feu
+                if fire_zones is not None:
+                    fire_zones.append(FireZone(preview[0], preview[1], self.settings))
+                self.active_previews.remove(preview)
         
-        elif self.fire_zone_cooldown > 0:
+        # Le placement attend la prochaine réflexion une fois le cooldown écoulé
+        if self.fire_zone_cooldown > 0:
             self.fire_zone_cooldown -= 1
-        
-        # Garde le Pyromane dans l'écran
-        self.x = max(self.radius, 
-                    min(self.x, self.settings.screen_width - self.radius))
-        self.y = max(self.radius, 
-                    min(self.y, self.settings.screen_height - self.radius))
+        else:
+            self.fire_zone_wait += 1
+        return None
     
     
     def draw(self, screen):
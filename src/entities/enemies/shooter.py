@@ -2,9 +2,14 @@
 import pygame
 import math
 from .enemy import Enemy
-from ..projectiles import Projectile
 
 class Shooter(Enemy):
+    steering = "kite"
+    kite_band = 100  # Recule quand le joueur est à moins de attack_range - kite_band
+    melee = False
+    tracks_player = True
+    thinks = True
+
     def __init__(self, x, y, settings):
         super().__init__(x, y, settings)
         self.type = "shooter"
@@ -20,31 +25,24 @@ class Shooter(Enemy):
         self.attack_range = 300  
         self.shoot_cooldown = 0
         self.shoot_rate = 60
+        self.can_shoot = False  # Joueur dans la bande de tir à la dernière réflexion
     
-    def update(self, player, projectiles=None, pending_zones=None):
+    def think(self, player, fire_zones=None, pending_zones=None):
+        """Vérifie si le joueur est dans la bande de tir"""
+        distance = self.to_player[2]
+        self.can_shoot = (distance <= self.attack_range and 
+                          distance >= self.attack_range - 150)
+
+    def act(self, player, projectiles=None, fire_zones=None, pending_zones=None):
         """Met à jour l'ennemi selon son type"""
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = max(math.sqrt(dx*dx + dy*dy), 0.1)
-        
-        if distance > self.attack_range:
-            # Trop loin, avance vers le joueur
-            self.x += (dx / distance) * self.speed
-            self.y += (dy / distance) * self.speed
-        elif distance < self.attack_range - 100:
-            # Trop proche, recule
-            self.x -= (dx / distance) * self.speed
-            self.y -= (dy / distance) * self.speed
-        
-        # Condition de tir
-        can_shoot = (distance <= self.attack_range and 
-                    distance >= self.attack_range - 150)
+        dx, dy, distance = self.to_player
         
-        if self.shoot_cooldown <= 0 and can_shoot:
+        if self.shoot_cooldown <= 0 and self.can_shoot:
             self.shoot(dx, dy, projectiles)
             self.shoot_cooldown = self.shoot_rate
         elif self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
+        return None
     
     
     def shoot(self, dx, dy, projectiles):
@@ -58,14 +56,14 @@ class Shooter(Enemy):
         dx /= distance
         dy /= distance
         
-        projectiles.append(Projectile(
+        projectiles.emit(
             self.x, self.y,
             dx * 7,
             dy * 7,
             self.damage,
-            self.settings,
-            color=(100, 200, 255)
-        ))
+            color=(100, 200, 255),
+            source=self.type
+        )
     
     def draw(self, screen):
         """Dessine l'ennemi avec sa barre de vie"""
@@ -1,9 +1,11 @@
 # src/entities/enemies/suicide.py 
 import pygame
-import math
 from .enemy import Enemy
 
 class Suicide(Enemy):
+    explodes = True
+    tracks_player = True
+
     def __init__(self, x, y, settings):
         super().__init__(x, y, settings)
         self.type = "suicide"
@@ -19,24 +21,19 @@ class Suicide(Enemy):
         self.is_exploding = False
         self.explosion_timer = 0
     
-    def update(self, player, projectiles=None, pending_zones=None):
+    @property
+    def steering(self):
+        """Fonce vers le joueur, s'immobilise pendant l'explosion"""
+        return None if self.is_exploding else "seek"
+    
+    def act(self, player, projectiles=None, fire_zones=None, pending_zones=None):
         """Met à jour l'ennemi selon son type"""
         if self.is_exploding:
             self.explosion_timer -= 1
-            return
-        
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = max(math.sqrt(dx*dx + dy*dy), 0.1)
-        dx /= distance
-        dy /= distance
-        
-        # Se déplace vers le joueur
-        self.x += dx * self.speed
-        self.y += dy * self.speed
+            return None
         
-        # Vérifie s'il est assez proche pour exploser
-        if distance < 50:
+        # Vérifie s'il était assez proche pour exploser (distance avant déplacement)
+        if self.to_player[2] < 50:
             self.is_exploding = True
             self.explosion_timer = 15
     
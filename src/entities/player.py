@@ -1,14 +1,17 @@
 # src/entities/player.py
 import pygame
 import math
-import random
+import numpy as np
+from src.utils.sprite_cache import circle_cache
+from src.systems.particles import ParticleSystem
+from src.utils.rng import RngStreams
 
 class Player:
     """
     Classe du joueur
     Gère le déplacement, la vie, le score et les interactions
     """
-    def __init__(self, x, y, settings, player_data):
+    def __init__(self, x, y, settings, player_data, rng=None):
         self.settings = settings
         self.x = x
         self.y = y
@@ -43,13 +46,14 @@ class Player:
         
         # Système de Dash
         self.dash_cooldown = 0
-        self.dash_cooldown_max = 180  # 3 secondes à 60 FPS
+        self.dash_cooldown_max = 180  # 3 secondes à 60 ticks/s
         self.is_dashing = False
         self.dash_timer = 0
-        self.dash_duration = 15  # 0.25s à 60 FPS
+        self.dash_duration = 15  # 0.25s à 60 ticks/s
         self.dash_speed_multiplier = player_data["dash_distance"]
-        self.dash_trail_particles = []
-        self.dash_afterimages = []
+        fx = (rng if rng is not None else RngStreams()).fx  # Flux cosmétique de la scène
+        self.dash_trail_particles = ParticleSystem(capacity=128, gravity=0.1, seed=fx.getrandbits(64))  # Légère gravité
+        self.dash_afterimages = ParticleSystem(capacity=16, growth=0.95, seed=fx.getrandbits(64))  # Rétrécissent en s'estompant
         self.dash_afterimage_timer = 0
         self.dash_color = (100, 200, 255)  # Bleu clair pour le dash
         
@@ -176,13 +180,7 @@ class Player:
         # Créer des afterimages
         self.dash_afterimage_timer += 1
         if self.dash_afterimage_timer >= 2:
-            self.dash_afterimages.append({
-                'x': self.x,
-                'y': self.y,
-                'timer': 15,
-                'size': self.size,
-                'color': self.dash_color
-            })
+            self.dash_afterimages.emit(self.x, self.y, life=15, size=self.size, color=self.dash_color)
             self.dash_afterimage_timer = 0
         
         # Créer des particules de traînée
@@ -217,71 +215,48 @@ class Player:
     
     def create_dash_blast(self):
         """Crée l'effet visuel de départ du dash"""
-        for i in range(20):
-            angle = random.random() * math.pi * 2
-            speed = random.uniform(3, 8)
-            self.dash_trail_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed,
-                'life': random.randint(15, 30),
-                'color': self.dash_color,
-                'size': random.uniform(2, 5)
-            })
+        self._emit_burst(20, (3, 8), (15, 31), (2, 5), self.dash_color)
     
     def create_trail_particles(self):
         """Crée des particules pendant le dash"""
-        for i in range(3):
-            angle = random.random() * math.pi * 2
-            offset_x = random.uniform(-self.size/2, self.size/2)
-            offset_y = random.uniform(-self.size/2, self.size/2)
-            
-            self.dash_trail_particles.append({
-                'x': self.x + offset_x,
-                'y': self.y + offset_y,
-                'dx': random.uniform(-0.5, 0.5),
-                'dy': random.uniform(-0.5, 0.5),
-                'life': random.randint(20, 40),
-                'color': self.dash_color,
-                'size': random.uniform(2, 4)
-            })
+        particles = self.dash_trail_particles
+        random = particles.random
+        half = self.size / 2
+        particles.emit(
+            self.x + random.uniform(-half, half, 3),
+            self.y + random.uniform(-half, half, 3),
+            random.uniform(-0.5, 0.5, 3),
+            random.uniform(-0.5, 0.5, 3),
+            life=random.integers(20, 41, 3),
+            fade=30,
+            size=random.uniform(2, 4, 3),
+            color=self.dash_color
+        )
     
     def create_dash_end_effect(self):
         """Crée l'effet visuel de fin du dash"""
-        for i in range(15):
-            angle = random.random() * math.pi * 2
-            speed = random.uniform(1, 4)
-            self.dash_trail_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed,
-                'life': random.randint(20, 35),
-                'color': (200, 230, 255),  # Bleu plus clair
-                'size': random.uniform(3, 6)
-            })
+        self._emit_burst(15, (1, 4), (20, 36), (3, 6), (200, 230, 255))  # Bleu plus clair
+    
+    def _emit_burst(self, count, speed, life, size, color):
+        """Gerbe de particules dans toutes les directions (bornes des tirages en tuples)"""
+        particles = self.dash_trail_particles
+        random = particles.random
+        angle = random.random(count) * math.pi * 2
+        speed = random.uniform(*speed, count)
+        particles.emit(
+            self.x, self.y,
+            np.cos(angle) * speed,
+            np.sin(angle) * speed,
+            life=random.integers(*life, count),
+            fade=30,
+            size=random.uniform(*size, count),
+            color=color
+        )
     
     def update_trail_particles(self):
-        """Met à jour les particules de traînée"""
-        for particle in self.dash_trail_particles[:]:
-            particle['x'] += particle['dx']
-            particle['y'] += particle['dy']
-            particle['life'] -= 1
-            
-            # Légère gravité
-            particle['dy'] += 0.1
-            
-            if particle['life'] <= 0:
-                self.dash_trail_particles.remove(particle)
-        
-        # Mettre à jour les afterimages
-        for afterimage in self.dash_afterimages[:]:
-            afterimage['timer'] -= 1
-            afterimage['size'] *= 0.95  # Rétrécit progressivement
-            
-            if afterimage['timer'] <= 0:
-                self.dash_afterimages.remove(afterimage)
+        """Met à jour les particules de traînée et les afterimages"""
+        self.dash_trail_particles.update()
+        self.dash_afterimages.update()
     
     def take_damage(self, amount):
         """Inflige des dégâts au joueur"""
@@ -300,65 +275,9 @@ class Player:
     
     def draw(self, screen):
         """Dessine le joueur avec effets visuels"""
-        # Dessiner les afterimages du dash (en premier)
-        for afterimage in self.dash_afterimages:
-            try:
-                # Calcul de l'alpha
-                alpha = int(255 * (afterimage['timer'] / 15.0))
-                alpha = max(0, min(255, alpha))
-                
-                # Récupérer la couleur de base
-                base_color = afterimage['color']
-                # Si la couleur a 4 éléments, on ne prend que les 3 premiers
-                if len(base_color) >= 3:
-                    r, g, b = base_color[:3]
-                else:
-                    r, g, b = 100, 200, 255  # couleur par défaut
-                
-                color_with_alpha = (r, g, b, alpha)
-                
-                afterimage_size = int(afterimage['size'])
-                if afterimage_size <= 0:
-                    continue
-                    
-                surf = pygame.Surface((afterimage_size*2, afterimage_size*2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, color_with_alpha, 
-                                 (afterimage_size, afterimage_size), 
-                                 afterimage_size)
-                screen.blit(surf, (int(afterimage['x'] - afterimage_size), 
-                                 int(afterimage['y'] - afterimage_size)))
-            except Exception as e:
-                print(f"Erreur lors du dessin d'une afterimage: {e}")
-                print(f"Données de l'afterimage: {afterimage}")
-                continue
-        
-        # Dessiner les particules de traînée
-        for particle in self.dash_trail_particles:
-            try:
-                alpha = int(255 * (particle['life'] / 30.0))
-                alpha = max(0, min(255, alpha))
-                
-                base_color = particle['color']
-                if len(base_color) >= 3:
-                    r, g, b = base_color[:3]
-                else:
-                    r, g, b = 100, 200, 255
-                
-                color_with_alpha = (r, g, b, alpha)
-                
-                particle_size = int(particle['size'])
-                if particle_size <= 0:
-                    continue
-                    
-                surf = pygame.Surface((particle_size*2, particle_size*2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, color_with_alpha, 
-                                 (particle_size, particle_size), 
-                                 particle_size)
-                screen.blit(surf, (int(particle['x'] - particle_size), 
-                                 int(particle['y'] - particle_size)))
-            except Exception as e:
-                print(f"Erreur particule: {e}")
-                continue
+        # Dessiner les afterimages du dash (en premier), puis les particules de traînée
+        self.dash_afterimages.draw(screen)
+        self.dash_trail_particles.draw(screen)
         
         # Déterminer la couleur du joueur (RGB seulement - pas d'alpha)
         if self.is_dashing:
@@ -381,19 +300,8 @@ class Player:
                 glow_size = self.size + i * 2
                 glow_alpha = 100 - i * 30
                 
-                # Créer surface pour le glow
-                glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
-                glow_color = (
-                    self.dash_color[0],
-                    self.dash_color[1],
-                    self.dash_color[2],
-                    glow_alpha
-                )
-                pygame.draw.circle(glow_surf, glow_color, 
-                                 (int(glow_size), int(glow_size)), 
-                                 int(glow_size))
-                screen.blit(glow_surf, (int(self.x - glow_size), 
-                                      int(self.y - glow_size)))
+                # Glow pré-rendu (cache partagé)
+                circle_cache.blit(screen, self.x, self.y, glow_size, self.dash_color, glow_alpha)
         
         # Dessiner le joueur
         pygame.draw.circle(screen, current_color, 
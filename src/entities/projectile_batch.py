@@ -0,0 +1,438 @@
+# src/entities/projectile_batch.py
+import math
+import numpy as np
+from .projectile_renderer import shared_renderer
+
+# Codes des projectiles spéciaux (stockés dans un tableau d'entiers)
+SPECIAL_NONE = 0
+SPECIAL_BOUNCING = 1
+SPECIAL_ACCELERATING = 2
+SPECIAL_SPLITTING = 3
+SPECIAL_HOMING = 4
+
+SPECIAL_CODES = {
+    None: SPECIAL_NONE,
+    "bouncing": SPECIAL_BOUNCING,
+    "accelerating": SPECIAL_ACCELERATING,
+    "splitting": SPECIAL_SPLITTING,
+    "homing": SPECIAL_HOMING
+}
+
+# Origine des projectiles ennemis (pour les dégâts subis par source)
+SOURCE_NAMES = ("inconnu", "shooter", "destructeur", "boss")
+SOURCE_CODES = {name: code for code, name in enumerate(SOURCE_NAMES)}
+
+TRAIL_LENGTH = 10  # Nombre maximal de points de traînée par projectile
+TARGETS_KEPT = 16  # Au-delà, les cibles plus poursuivies sont oubliées
+
+# Politiques de dépassement du budget de projectiles
+BUDGET_POLICIES = ("merge", "skip", "drop")
+
+
+class ProjectileBatch:
+    """
+    Moteur de projectiles en structure de tableaux (un tableau NumPy par attribut)
+    Toutes les mises à jour (déplacement, accélération, poursuite, rebonds,
+    sortie d'écran) sont faites en une passe vectorisée sur le lot entier
+    Les objets Projectile restent utilisables comme "fiche" via append()
+    Budget (optionnel) : au-delà de trail_limit projectiles vivants les traînées
+    (cosmétiques) ne sont plus enregistrées ; une émission qui dépasserait
+    `budget` est dégradée selon la politique :
+    - "merge" : les projectiles de direction voisine sont fusionnés en plus gros
+    - "skip" : les projectiles les plus faibles de l'émission sont ignorés
+    - "drop" : l'excédent est ignoré
+    Ce qui ne tient toujours pas est ignoré ; chaque décision est comptée dans budget_stats
+    Avec un registre (EntityRegistry), une cible enregistrée est gardée par sa
+    poignée : une cible retirée est détectée et ses projectiles cessent de la poursuivre
+    """
+    # nom -> (dtype, forme par projectile)
+    FIELDS = {
+        'x': (np.float64, ()),
+        'y': (np.float64, ()),
+        'dx': (np.float64, ()),
+        'dy': (np.float64, ()),
+        'radius': (np.float64, ()),
+        'damage': (np.float64, ()),
+        'lifetime': (np.int32, ()),
+        'bouncing': (np.bool_, ()),
+        'bounces': (np.int32, ()),
+        'special': (np.uint8, ()),
+        'acceleration': (np.float64, ()),
+        'max_speed': (np.float64, ()),
+        'turn_rate': (np.float64, ()),
+        'target': (np.int32, ()),  # Index dans self.targets, -1 si aucune cible
+        'will_split': (np.bool_, ()),
+        'splits': (np.int32, ()),
+        'split_timer': (np.int32, ()),
+        'multishot': (np.bool_, ()),
+        'source': (np.uint8, ()),  # Code de SOURCE_NAMES
+        'color': (np.uint8, (3,)),
+        'trail_color': (np.uint8, (3,)),
+        'trail': (np.float64, (TRAIL_LENGTH, 2)),
+        'trail_count': (np.int32, ()),
+        'trail_timer': (np.int32, ()),
+    }
+
+    def __init__(self, settings, capacity=256, budget=None, policy="merge", trail_limit=None, registry=None):
+        if policy not in BUDGET_POLICIES:
+            raise ValueError(f"Politique de budget inconnue : {policy}")
+        self.settings = settings
+        self.count = 0
+        self.capacity = 0
+        self.targets = []  # Cibles des projectiles qui poursuivent (objets ou poignées du registre)
+        self.registry = registry
+        self.high_water = 0  # Pic de projectiles vivants (pour dimensionner capacity)
+        self.grows = 0  # Nombre d'agrandissements après la création
+        self.budget = budget  # Projectiles vivants au plus (None : illimité)
+        self.policy = policy
+        self.trail_limit = trail_limit  # Au-delà, plus de traînées (None : toujours)
+        self.budget_stats = {"merged": 0, "skipped": 0, "dropped": 0, "trailless_ticks": 0}
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity):
+        """Agrandit les tableaux en conservant les projectiles existants"""
+        for name, (dtype, shape) in self.FIELDS.items():
+            new_array = np.zeros((capacity,) + shape, dtype=dtype)
+            if self.capacity:
+                new_array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, new_array)
+        self.capacity = capacity
+
+    def _target_index(self, target):
+        """Retourne l'index d'une cible (l'ajoute si nécessaire)"""
+        if target is None:
+            return -1
+        handle = getattr(target, 'handle', None)
+        if self.registry is not None and handle is not None:
+            target = handle
+        for i, known in enumerate(self.targets):
+            if known is target or (type(known) is int and known == target):
+                return i
+        self.targets.append(target)
+        return len(self.targets) - 1
+
+    def _compact_targets(self, n):
+        """Oublie les cibles qu'aucun projectile vivant ne poursuit plus (renumérote les autres)"""
+        target = self.target[:n]
+        chased = target >= 0
+        live = np.flatnonzero(np.bincount(target[chased], minlength=len(self.targets)))
+        if live.size == len(self.targets):
+            return
+        renumber = np.full(len(self.targets), -1, dtype=np.int32)
+        renumber[live] = np.arange(live.size, dtype=np.int32)
+        target[chased] = renumber[target[chased]]
+        self.targets = [self.targets[i] for i in live.tolist()]
+
+    def _resolve_targets(self):
+        """Objets des cibles ; une poignée périmée donne None"""
+        return [self.registry.get(t) if type(t) is int else t for t in self.targets]
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Supprime tous les projectiles"""
+        self.count = 0
+        self.targets.clear()
+
+    def emit(self, x, y, dx, dy, damage, radius=5, color=(255, 255, 0), special=None,
+             is_multishot=False, lifetime=90, bounces=0, acceleration=0, max_speed=0,
+             turn_rate=0, splits=0, split_timer=0, target=None, source=None):
+        """
+        Ajoute un ou plusieurs projectiles d'un coup
+        x, y, dx, dy, damage, radius et color acceptent des scalaires ou des tableaux
+        Retourne le nombre de projectiles ajoutés
+        """
+        x, y, dx, dy, damage, radius = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64),
+            np.asarray(dx, dtype=np.float64), np.asarray(dy, dtype=np.float64),
+            np.asarray(damage, dtype=np.float64), np.asarray(radius, dtype=np.float64)
+        )
+        n = x.size
+        if n == 0:
+            return 0
+        if self.budget is not None and self.count + n > self.budget:
+            x, y, dx, dy, damage, radius, color = self._apply_budget(
+                x.ravel(), y.ravel(), dx.ravel(), dy.ravel(), damage.ravel(), radius.ravel(), color
+            )
+            n = x.size
+            if n == 0:
+                return 0
+
+        if self.count + n > self.capacity:
+            new_capacity = self.capacity
+            while self.count + n > new_capacity:
+                new_capacity *= 2
+            self._grow(new_capacity)
+            self.grows += 1
+
+        s = slice(self.count, self.count + n)
+        self.x[s] = x.ravel()
+        self.y[s] = y.ravel()
+        self.dx[s] = dx.ravel()
+        self.dy[s] = dy.ravel()
+        self.damage[s] = damage.ravel()
+        self.radius[s] = radius.ravel()
+        self.lifetime[s] = lifetime
+        self.bouncing[s] = bounces > 0
+        self.bounces[s] = bounces
+        self.special[s] = SPECIAL_CODES.get(special, SPECIAL_NONE)
+        self.acceleration[s] = acceleration
+        self.max_speed[s] = max_speed
+        self.turn_rate[s] = turn_rate
+        self.target[s] = self._target_index(target)
+        self.will_split[s] = splits > 0
+        self.splits[s] = splits
+        self.split_timer[s] = split_timer
+        self.multishot[s] = is_multishot
+        self.source[s] = SOURCE_CODES.get(source, 0)
+        # Une couleur commune (r, g, b[, a]) ou une couleur par projectile
+        color = np.asarray(color)[..., :3]
+        self.color[s] = color
+        # Les traînées sont jaunes, sauf pour le multishot qui garde sa couleur
+        self.trail_color[s] = color if is_multishot else (255, 255, 0)
+        self.trail_count[s] = 0
+        self.trail_timer[s] = 0
+
+        self.count += n
+        if self.count > self.high_water:
+            self.high_water = self.count
+        return n
+
+    def _apply_budget(self, x, y, dx, dy, damage, radius, color):
+        """Dégrade une émission qui dépasserait le budget ; retourne ce qui reste à émettre"""
+        n = x.size
+        room = max(0, self.budget - self.count)
+        stats = self.budget_stats
+        color = np.asarray(color)
+        per_projectile = color.ndim == 2
+
+        if room == 0:
+            stats["dropped"] += n
+            keep = np.empty(0, dtype=np.intp)
+        elif self.policy == "merge":
+            # Groupes consécutifs de projectiles triés par direction : un projectile par groupe
+            group = -(-n // room)
+            order = np.argsort(np.arctan2(dy, dx), kind='stable')
+            starts = np.arange(0, n, group)
+            sizes = np.diff(np.append(starts, n))
+
+            def mean(values):
+                return np.add.reduceat(values[order], starts) / sizes
+
+            first = order[starts]
+            merged_x, merged_y, merged_dx, merged_dy = mean(x), mean(y), mean(dx), mean(dy)
+            # Plus gros (surface cumulée, au plus le double) mais pas plus dangereux
+            merged_radius = np.minimum(mean(radius) * np.sqrt(sizes), 2 * np.maximum.reduceat(radius[order], starts))
+            merged_damage = np.maximum.reduceat(damage[order], starts)
+            stats["merged"] += n - starts.size
+            if per_projectile:
+                color = color[first]
+            return merged_x, merged_y, merged_dx, merged_dy, merged_damage, merged_radius, color
+        elif self.policy == "skip":
+            # Les plus forts d'abord ; l'ordre d'émission est gardé
+            keep = np.sort(np.argsort(-damage, kind='stable')[:room])
+            stats["skipped"] += n - room
+        else:
+            keep = np.arange(room)
+            stats["dropped"] += n - room
+
+        if per_projectile:
+            color = color[keep]
+        return x[keep], y[keep], dx[keep], dy[keep], damage[keep], radius[keep], color
+
+    def append(self, projectile, source=None):
+        """Ajoute un objet Projectile (copie de ses attributs dans les tableaux)"""
+        self.emit(
+            projectile.x, projectile.y, projectile.dx, projectile.dy,
+            projectile.damage,
+            radius=projectile.radius,
+            color=projectile.color,
+            special=projectile.special_type,
+            is_multishot=projectile.is_multishot,
+            lifetime=projectile.lifetime,
+            bounces=projectile.bounces_remaining if projectile.is_bouncing else 0,
+            acceleration=projectile.acceleration,
+            max_speed=projectile.max_speed,
+            turn_rate=projectile.turn_rate,
+            splits=projectile.splits_remaining if projectile.will_split else 0,
+            split_timer=projectile.split_timer,
+            target=projectile.target,
+            source=source
+        )
+
+    def extend(self, projectiles):
+        """Ajoute une liste d'objets Projectile"""
+        for projectile in projectiles:
+            self.append(projectile)
+
+    def update(self):
+        """Met à jour tous les projectiles en une passe vectorisée"""
+        n = self.count
+        if n == 0:
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        dx, dy = self.dx[:n], self.dy[:n]
+        special = self.special[:n]
+
+        self._update_accelerating(n, special)
+        self._update_homing(n, special)
+        self._update_splitting(n)
+
+        # Déplacement normal
+        x += dx
+        y += dy
+        self.lifetime[:n] -= 1
+
+        self._handle_bouncing(n)
+        if self.trail_limit is not None and n > self.trail_limit:
+            # Trop de projectiles : les traînées sont sacrifiées en premier
+            self.trail_count[:n] = 0
+            self.budget_stats["trailless_ticks"] += 1
+        else:
+            self._update_trails(n)
+
+        # Sortie d'écran (sauf pour les rebondissants)
+        out = ((x < 0) | (x > self.settings.screen_width) |
+               (y < 0) | (y > self.settings.screen_height))
+        can_leave = ~self.bouncing[:n] | (self.bounces[:n] <= 0)
+        self.lifetime[:n][out & can_leave] = 0
+
+        self.compact()
+
+    def _update_accelerating(self, n, special):
+        """Accélère les projectiles jusqu'à leur vitesse maximale"""
+        mask = special == SPECIAL_ACCELERATING
+        if not mask.any():
+            return
+        speed = np.hypot(self.dx[:n], self.dy[:n])
+        mask &= (speed < self.max_speed[:n]) & (speed > 0)
+        factor = 1 + self.acceleration[:n][mask] / speed[mask]
+        self.dx[:n][mask] *= factor
+        self.dy[:n][mask] *= factor
+
+    def _update_homing(self, n, special):
+        """Oriente les projectiles qui poursuivent vers leur cible"""
+        if len(self.targets) > TARGETS_KEPT:
+            # Une cible par ennemi visé (tirs du joueur) : la liste ne garde que les cibles poursuivies
+            self._compact_targets(n)
+        idx = np.flatnonzero((special == SPECIAL_HOMING) & (self.target[:n] >= 0))
+        if idx.size == 0:
+            return
+
+        targets = self._resolve_targets()
+        stale = [i for i, t in enumerate(targets) if t is None]
+        if stale:
+            # Cible retirée : ses projectiles continuent tout droit
+            lost = np.isin(self.target[idx], stale)
+            self.target[idx[lost]] = -1
+            idx = idx[~lost]
+            if idx.size == 0:
+                return
+        target_x = np.array([0.0 if t is None else t.x for t in targets])[self.target[idx]]
+        target_y = np.array([0.0 if t is None else t.y for t in targets])[self.target[idx]]
+        to_x = target_x - self.x[idx]
+        to_y = target_y - self.y[idx]
+        keep = (to_x != 0) | (to_y != 0)
+        idx, to_x, to_y = idx[keep], to_x[keep], to_y[keep]
+
+        dx, dy = self.dx[idx], self.dy[idx]
+        current_angle = np.arctan2(dy, dx)
+        # Différence d'angle normalisée entre -pi et pi
+        angle_diff = (np.arctan2(to_y, to_x) - current_angle + math.pi) % (2 * math.pi) - math.pi
+        turn_rate = self.turn_rate[idx]
+        new_angle = current_angle + np.clip(angle_diff, -turn_rate, turn_rate)
+
+        speed = np.hypot(dx, dy)
+        self.dx[idx] = np.cos(new_angle) * speed
+        self.dy[idx] = np.sin(new_angle) * speed
+
+    def _update_splitting(self, n):
+        """Décompte le minuteur des projectiles qui vont se diviser"""
+        mask = self.will_split[:n] & (self.splits[:n] > 0)
+        self.split_timer[:n][mask] -= 1
+        self.will_split[:n][mask & (self.split_timer[:n] <= 0)] = False
+
+    def _handle_bouncing(self, n):
+        """Fait rebondir les projectiles sur les bords (perte d'énergie de 20%)"""
+        idx = np.flatnonzero(self.bouncing[:n])
+        if idx.size == 0:
+            return
+
+        x, y = self.x[idx], self.y[idx]
+        dx, dy = self.dx[idx], self.dy[idx]
+        r = self.radius[idx]
+        width = self.settings.screen_width
+        height = self.settings.screen_height
+
+        left = x <= r
+        right = ~left & (x >= width - r)
+        top = y <= r
+        bottom = ~top & (y >= height - r)
+
+        x = np.where(left, r, np.where(right, width - r, x))
+        dx = np.where(left, np.abs(dx) * 0.8, np.where(right, -np.abs(dx) * 0.8, dx))
+        y = np.where(top, r, np.where(bottom, height - r, y))
+        dy = np.where(top, np.abs(dy) * 0.8, np.where(bottom, -np.abs(dy) * 0.8, dy))
+
+        self.x[idx], self.y[idx] = x, y
+        self.dx[idx], self.dy[idx] = dx, dy
+
+        bounced = left | right | top | bottom
+        self.bounces[idx] -= bounced
+        self.bouncing[idx] = self.bounces[idx] > 0
+
+    def _update_trails(self, n):
+        """Enregistre un point de traînée toutes les 2 (multishot) ou 3 ticks"""
+        self.trail_timer[:n] += 1
+        interval = np.where(self.multishot[:n], 2, 3)
+        idx = np.flatnonzero(self.trail_timer[:n] >= interval)
+        if idx.size == 0:
+            return
+
+        trail = self.trail[idx]
+        trail[:, 1:] = trail[:, :-1]
+        trail[:, 0, 0] = self.x[idx]
+        trail[:, 0, 1] = self.y[idx]
+        self.trail[idx] = trail
+        # 10 points (20 ticks) pour le multishot, 5 points (15 ticks) sinon
+        max_points = np.where(self.multishot[idx], TRAIL_LENGTH, TRAIL_LENGTH // 2)
+        self.trail_count[idx] = np.minimum(self.trail_count[idx] + 1, max_points)
+        self.trail_timer[idx] = 0
+
+    def stats(self):
+        """Compteurs du lot (pour le profilage et le dimensionnement)"""
+        return {
+            "count": self.count,
+            "capacity": self.capacity,
+            "high_water": self.high_water,
+            "grows": self.grows
+        } | self.budget_stats
+
+    def compact(self):
+        """Retire les projectiles morts en gardant l'ordre des vivants"""
+        n = self.count
+        alive = self.lifetime[:n] > 0
+        m = int(alive.sum())
+        if m == n:
+            return
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:m] = array[:n][alive]
+        self.count = m
+
+    def collide_circle(self, x, y, radius):
+        """Index (croissants) des projectiles vivants qui touchent le cercle donné"""
+        n = self.count
+        reach = radius + self.radius[:n]
+        hit = ((self.x[:n] - x) ** 2 + (self.y[:n] - y) ** 2 < reach * reach) & (self.lifetime[:n] > 0)
+        return np.flatnonzero(hit)
+
+    def kill(self, indices):
+        """Marque des projectiles comme morts (retirés au prochain compact)"""
+        self.lifetime[indices] = 0
+
+    def draw(self, screen, renderer=None):
+        """Dessine les traînées puis les projectiles (rendu groupé)"""
+        (renderer or shared_renderer).draw(screen, (self,))
@@ -0,0 +1,93 @@
+# src/entities/projectile_renderer.py
+import numpy as np
+import pygame
+
+class ProjectileRenderer:
+    """
+    Rendu groupé des lots de projectiles
+    Un sprite est pré-rendu par couple (couleur, rayon), puis chaque couche
+    (toutes les traînées, puis tous les projectiles) est dessinée en un seul
+    appel Surface.blits (ou fblits quand il existe)
+    """
+    def __init__(self, max_sprites=1024):
+        self.sprites = {}  # (r, g, b, rayon) -> surface
+        self.max_sprites = max_sprites
+        self.blit_count = 0  # Nombre de blits de la dernière image
+
+    def sprite(self, color, radius):
+        """Sprite d'un cercle plein, identique à pygame.draw.circle(écran, couleur, centre, rayon)"""
+        key = (int(color[0]), int(color[1]), int(color[2]), int(radius))
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if len(self.sprites) >= self.max_sprites:
+                self.sprites.clear()
+            radius = key[3]
+            # Sprite opaque avec couleur de transparence (RLE) : bien plus rapide qu'un blit alpha
+            colorkey = (255, 0, 255) if key[:3] != (255, 0, 255) else (0, 0, 0)
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+            sprite.fill(colorkey)
+            pygame.draw.circle(sprite, key[:3], (radius, radius), radius)
+            sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+            if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            self.sprites[key] = sprite
+        return sprite
+
+    def _layer(self, colors, radii, xs, ys):
+        """Séquence (sprite, position) d'une couche : un sprite par clé unique"""
+        if len(radii) == 0:
+            return []
+        # Clé entière (r, g, b, rayon) : np.unique 1D est bien plus rapide que sur des lignes
+        colors = colors.astype(np.int64)
+        keys = (colors[:, 0] << 40) | (colors[:, 1] << 32) | (colors[:, 2] << 24) | np.clip(radii, 0, 0xFFFFFF)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sprites = [
+            self.sprite(((key >> 40) & 0xFF, (key >> 32) & 0xFF, (key >> 24) & 0xFF), key & 0xFFFFFF)
+            for key in unique_keys.tolist()
+        ]
+
+        # Même arrondi que pygame.draw.circle(écran, couleur, (int(x), int(y)), rayon)
+        left = (xs.astype(np.int64) - radii).tolist()
+        top = (ys.astype(np.int64) - radii).tolist()
+        return list(zip(map(sprites.__getitem__, inverse.ravel().tolist()), zip(left, top)))
+
+    def _blit_layer(self, screen, sequence):
+        if not sequence:
+            return
+        self.blit_count += len(sequence)
+        fblits = getattr(screen, "fblits", None)
+        if fblits is not None:
+            fblits(sequence)
+        else:
+            screen.blits(sequence, doreturn=False)
+
+    def draw(self, screen, batches):
+        """Dessine les traînées de tous les lots, puis tous les projectiles"""
+        self.blit_count = 0
+        trails = []
+        bodies = []
+        for batch in batches:
+            n = batch.count
+            if n == 0:
+                continue
+            radius = batch.radius[:n].astype(np.int64)
+
+            # Points de traînée valides (trail_count premiers points de chaque projectile)
+            valid = np.arange(batch.trail.shape[1])[None, :] < batch.trail_count[:n, None]
+            owners = np.nonzero(valid)[0]
+            if owners.size:
+                points = batch.trail[:n][valid]
+                trails.extend(self._layer(
+                    batch.trail_color[owners],
+                    np.maximum(1, radius[owners] // 2),
+                    points[:, 0], points[:, 1]
+                ))
+
+            bodies.extend(self._layer(batch.color[:n], radius, batch.x[:n], batch.y[:n]))
+
+        self._blit_layer(screen, trails)
+        self._blit_layer(screen, bodies)
+
+
+# Renderer utilisé par ProjectileBatch.draw quand aucun n'est fourni
+shared_renderer = ProjectileRenderer()
@@ -1,14 +1,18 @@
 # src/entities/projectiles.py 
 import pygame
-import random
 import math
+import itertools
+import numpy as np
+from src.utils.sprite_cache import circle_cache
+from src.utils.rng import RngStreams
+from src.systems.particles import ParticleSystem
 
 class Projectile:
     """
-    Projectile tiré par le joueur ou les ennemis
-    Gère le mouvement, la durée de vie et les effets visuels
+    Fiche d'un projectile : ProjectileBatch.append copie ses attributs dans les tableaux du lot,
+    où tous les projectiles vivent (déplacement, effets spéciaux, traînées)
     """
-    def __init__(self, x, y, dx, dy, damage, settings, color=(255, 255, 0), radius=5, is_multishot=False):
+    def __init__(self, x, y, dx, dy, damage, color=(255, 255, 0), radius=5, is_multishot=False):
         self.x = x
         self.y = y
         self.dx = dx
@@ -16,8 +20,7 @@ class Projectile:
         self.damage = damage
         self.radius = radius
         self.color = color
-        self.lifetime = 90  # frames avant disparition (augmenté)
-        self.settings = settings
+        self.lifetime = 90  # ticks avant disparition (augmenté)
         self.is_multishot = is_multishot
         
         # Propriétés pour projectiles spéciaux
@@ -35,301 +38,189 @@ class Projectile:
         # Pour projectiles qui poursuivent
         self.target = None
         self.turn_rate = 0
-        
-        # Effet visuel spécial pour le multishot
-        self.trail_particles = []
-        self.trail_timer = 0
-        self.sparkle_timer = 0
-    
-    def update(self):
-        """Met à jour la position du projectile"""
-        # Gestion des projectiles spéciaux
-        if self.special_type == "accelerating":
-            self._update_accelerating()
-        elif self.special_type == "homing" and self.target:
-            self._update_homing()
-        elif self.special_type == "splitting":
-            self._update_splitting()
-        
-        # Déplacement normal
-        self.x += self.dx
-        self.y += self.dy
-        self.lifetime -= 1
-        
-        # Gestion du rebond
-        if self.is_bouncing:
-            self._handle_bouncing()
-        
-        # Effets de particules différents selon le type
-        self.trail_timer += 1
-        if self.trail_timer >= (2 if self.is_multishot else 3):
-            particle_color = self.color if self.is_multishot else (255, 255, 0)
-            alpha = 180 if self.is_multishot else 150
-            self.trail_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'life': 20 if self.is_multishot else 15,
-                'color': particle_color,
-                'alpha': alpha
-            })
-            self.trail_timer = 0
-        
-        # Effet "d'étincelles" pour multishot
-        if self.is_multishot:
-            self.sparkle_timer += 1
-            if self.sparkle_timer >= 5:
-                self.trail_particles.append({
-                    'x': self.x + random.randint(-3, 3),
-                    'y': self.y + random.randint(-3, 3),
-                    'life': 10,
-                    'color': (255, 255, 200),
-                    'alpha': 200
-                })
-                self.sparkle_timer = 0
-        
-        # Met à jour les particules
-        for particle in self.trail_particles[:]:
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.trail_particles.remove(particle)
-        
-        # Vérifie les bords de l'écran (sauf pour les rebondissants)
-        if (self.x < 0 or self.x > self.settings.screen_width or 
-            self.y < 0 or self.y > self.settings.screen_height):
-            if not self.is_bouncing or self.bounces_remaining <= 0:
-                self.lifetime = 0
+
+
+# Gradients de couleur pour les flammes
+FIRE_GRADIENT = [
+    (255, 255, 200, 255),  # Centre blanc-jaune
+    (255, 200, 100, 220),  # Jaune vif
+    (255, 150, 50, 200),   # Orange
+    (255, 100, 0, 180),    # Orange foncé
+    (200, 50, 0, 150),     # Rouge-orange
+    (150, 30, 0, 120)      # Rouge sombre
+]
+FIRE_COLORS = np.array([color[:3] for color in FIRE_GRADIENT], dtype=np.uint8)
+FIRE_ALPHAS = np.array([color[3] for color in FIRE_GRADIENT], dtype=np.float64)
+
+
+class FireEffects:
+    """
+    Particules des zones de feu d'une scène : un système par effet (flammes, étincelles,
+    fumée), partagé par toutes ses zones, chaque particule portant le numéro de sa zone.
+    Les tirages cosmétiques des zones (pulsations, étincelles) se font dans le flux fx de la scène
+    """
+    def __init__(self, rng=None):
+        self.random = (rng if rng is not None else RngStreams()).fx
+        self.flames = ParticleSystem(capacity=256, seed=self.random.getrandbits(64))
+        self.sparks = ParticleSystem(capacity=256, gravity=0.05, seed=self.random.getrandbits(64))  # Gravité légère
+        self.smoke = ParticleSystem(  # Dérive et grossit en s'estompant
+            capacity=128, jitter=(0.02, 0.01), growth=1.02, seed=self.random.getrandbits(64)
+        )
+        self.numbers = itertools.count(1)  # Numéro de la prochaine zone
     
-    def _update_accelerating(self):
-        """Met à jour un projectile qui accélère"""
-        current_speed = math.sqrt(self.dx**2 + self.dy**2)
-        if current_speed < self.max_speed:
-            # Normaliser la direction
-            if current_speed > 0:
-                self.dx *= 1 + self.acceleration / current_speed
-                self.dy *= 1 + self.acceleration / current_speed
+    def emit_flames(self, x, y, owner):
+        """Flammes autour des centres (x, y) : elles montent en ondulant et rapetissent avec leur vie"""
+        count = np.size(x)
+        random = self.flames.random
+        angle = random.random(count) * 2 * math.pi
+        dist = random.uniform(10, 40, count)
+        color_index = random.integers(0, len(FIRE_GRADIENT), count)
+        self.flames.emit(
+            x + np.cos(angle) * dist,
+            y + np.sin(angle) * dist,
+            0,
+            -random.uniform(0.3, 1.0, count) * 0.1,
+            life=random.integers(40, 101, count),
+            max_life=100,
+            fade=100,
+            size=random.uniform(4, 10, count),
+            shrink=0.3,
+            color=FIRE_COLORS[color_index],
+            alpha=FIRE_ALPHAS[color_index] * 0.7,
+            wiggle=random.uniform(0.5, 2.0, count),
+            wiggle_speed=random.uniform(0.05, 0.15, count),
+            owner=owner
+        )
     
-    def _update_homing(self):
-        """Met à jour un projectile qui poursuit sa cible"""
-        if not self.target:
+    def update(self, fire_zones):
+        """Met à jour les particules de toutes les zones de feu (une fois par tick)"""
+        self.sparks.update()
+        self.smoke.update()
+        extinguished = self.flames.update()
+        if extinguished.size == 0 or not fire_zones:
             return
         
-        # Calcul de l'angle vers la cible
-        dx_target = self.target.x - self.x
-        dy_target = self.target.y - self.y
-        distance = math.sqrt(dx_target**2 + dy_target**2)
-        
-        if distance > 0:
-            # Angle actuel du projectile
-            current_angle = math.atan2(self.dy, self.dx)
-            
-            # Angle vers la cible
-            target_angle = math.atan2(dy_target, dx_target)
-            
-            # Différence d'angle (normalisée entre -pi et pi)
-            angle_diff = target_angle - current_angle
-            while angle_diff > math.pi:
-                angle_diff -= 2 * math.pi
-            while angle_diff < -math.pi:
-                angle_diff += 2 * math.pi
-            
-            # Ajuster l'angle
-            turn_amount = min(abs(angle_diff), self.turn_rate)
-            if angle_diff < 0:
-                turn_amount = -turn_amount
-            
-            new_angle = current_angle + turn_amount
-            
-            # Mettre à jour la vitesse
-            speed = math.sqrt(self.dx**2 + self.dy**2)
-            self.dx = math.cos(new_angle) * speed
-            self.dy = math.sin(new_angle) * speed
+        # Chaque flamme éteinte d'une zone encore active est remplacée (un seul emit)
+        zones = {zone.number: zone for zone in fire_zones}
+        owners = [owner for owner in extinguished.tolist() if owner in zones]
+        if owners:
+            self.emit_flames(
+                np.array([zones[owner].x for owner in owners], dtype=np.float64),
+                np.array([zones[owner].y for owner in owners], dtype=np.float64),
+                owners
+            )
     
-    def _update_splitting(self):
-        """Met à jour un projectile qui va se diviser"""
-        if self.will_split and self.splits_remaining > 0:
-            self.split_timer -= 1
-            if self.split_timer <= 0:
-                self.will_split = False  
+    def draw(self, screen, fire_zones):
+        """Dessine la fumée, les zones, puis les flammes (et leur petit glow) et les étincelles"""
+        self.smoke.draw(screen)
+        for fire_zone in fire_zones:
+            fire_zone.draw(screen)
+        self.flames.draw(screen)
+        self.flames.draw(screen, grow=2, alpha_scale=0.3)
+        self.sparks.draw(screen)
     
-    def _handle_bouncing(self):
-        """Gère le rebond du projectile"""
-        bounced = False
-        
-        if self.x <= self.radius:
-            self.x = self.radius
-            self.dx = abs(self.dx) * 0.8  # Perte d'énergie au rebond
-            bounced = True
-        elif self.x >= self.settings.screen_width - self.radius:
-            self.x = self.settings.screen_width - self.radius
-            self.dx = -abs(self.dx) * 0.8
-            bounced = True
-        
-        if self.y <= self.radius:
-            self.y = self.radius
-            self.dy = abs(self.dy) * 0.8
-            bounced = True
-        elif self.y >= self.settings.screen_height - self.radius:
-            self.y = self.settings.screen_height - self.radius
-            self.dy = -abs(self.dy) * 0.8
-            bounced = True
-        
-        if bounced:
-            self.bounces_remaining -= 1
-            if self.bounces_remaining <= 0:
-                self.is_bouncing = False
+    def release(self, number):
+        """Retire les particules de la zone `number` (zone éteinte ou retirée)"""
+        self.flames.kill_owner(number)
+        self.sparks.kill_owner(number)
+        self.smoke.kill_owner(number)
     
-    def create_split_projectiles(self):
-        """Crée les projectiles résultant d'une division"""
-        if not self.will_split or self.splits_remaining <= 0:
-            return []
-        
-        projectiles = []
-        speed = math.sqrt(self.dx**2 + self.dy**2)
-        
-        for i in range(2):
-            # Angle légèrement décalé
-            angle = math.atan2(self.dy, self.dx) + (math.pi/6 if i == 0 else -math.pi/6)
-            dx = math.cos(angle) * speed * 0.7
-            dy = math.sin(angle) * speed * 0.7
-            
-            # Créer un nouveau projectile (plus petit)
-            new_projectile = Projectile(
-                self.x, self.y, dx, dy, 
-                self.damage * 0.6,  # Moins de dégâts
-                self.settings,
-                color=self.color,
-                radius=max(3, self.radius - 2)
-            )
-            
-            projectiles.append(new_projectile)
-        
-        return projectiles
-    
-    def is_alive(self):
-        return self.lifetime > 0
+    def clear(self):
+        """Supprime les particules de toutes les zones (nouvelle partie)"""
+        self.flames.clear()
+        self.sparks.clear()
+        self.smoke.clear()
     
-    def draw(self, screen):
-        """Dessine le projectile et sa traînée"""
-        # Dessine la traînée
-        for particle in self.trail_particles:
-            alpha = int(particle['alpha'] * (particle['life'] / 20))
-            size = max(1, self.radius // 2)
-            pygame.draw.circle(screen, 
-                             (particle['color'][0], particle['color'][1], particle['color'][2], alpha),
-                             (int(particle['x']), int(particle['y'])), 
-                             size)
-        
-        # Dessine le projectile principal
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+    def __len__(self):
+        """Nombre de particules de toutes les zones de feu (pour le profileur)"""
+        return len(self.flames) + len(self.sparks) + len(self.smoke)
 
 
 class FireZone:
-    """Zone de feu posée par le pyromane - Version améliorée visuellement"""
-    def __init__(self, x, y, settings):
+    """
+    Zone de feu posée par le pyromane - Version améliorée visuellement
+    Ses particules vivent dans les FireEffects de la scène (effects) ; sans effets, la zone n'en a pas
+    """
+    def __init__(self, x, y, settings, effects=None):
         self.x = x
         self.y = y
         self.base_radius = 50
         self.radius = self.base_radius
-        self.duration = 300  # 5 secondes à 60 FPS
+        self.duration = 300  # 5 secondes à 60 ticks/s
         self.damage_per_tick = 3
         self.lifetime = self.duration
         self.settings = settings
-        self.last_damage_time = 0
-        self.spawn_time = pygame.time.get_ticks()
+        self.damage_interval = 6  # Ticks entre deux dégâts (100 ms)
+        self.damage_cooldown = 0
         
         # Animations avancées
         self.pulse_timer = 0
         self.wave_timer = 0
         self.heat_distortion_timer = 0
         
-        # Particules de flamme (système avancé)
-        self.flame_particles = []
-        self.spark_particles = []
-        self.smoke_particles = []
+        # Numéro des particules de la zone dans les systèmes partagés de la scène
+        self.effects = effects
+        self.number = next(effects.numbers) if effects is not None else 0
         
-        # Effet de pulsation multiple
+        # Effet de pulsation multiple (phases tirées dans le flux fx de la scène)
+        fx = effects.random if effects is not None else None
         self.pulse_layers = [
-            {'radius': 25, 'speed': 0.08, 'offset': random.random() * math.pi * 2},
-            {'radius': 35, 'speed': 0.12, 'offset': random.random() * math.pi * 2},
-            {'radius': 45, 'speed': 0.15, 'offset': random.random() * math.pi * 2}
+            {'radius': radius, 'speed': speed, 'offset': fx.random() * math.pi * 2 if fx else 0.0}
+            for radius, speed in ((25, 0.08), (35, 0.12), (45, 0.15))
         ]
         
         # Gradients de couleur pour les flammes
-        self.fire_gradient = [
-            (255, 255, 200, 255),  # Centre blanc-jaune
-            (255, 200, 100, 220),  # Jaune vif
-            (255, 150, 50, 200),   # Orange
-            (255, 100, 0, 180),    # Orange foncé
-            (200, 50, 0, 150),     # Rouge-orange
-            (150, 30, 0, 120)      # Rouge sombre
-        ]
+        self.fire_gradient = FIRE_GRADIENT
         
         # Initialiser les particules
-        self._initialize_particles()
+        if effects is not None:
+            self._initialize_particles()
     
     def _initialize_particles(self):
         """Initialise les particules de flamme, d'étincelles et de fumée"""
-        # Particules de flamme principale
-        for _ in range(40):
-            angle = random.random() * 2 * math.pi
-            dist = random.uniform(10, 40)
-            speed = random.uniform(0.8, 2.5)
-            size = random.uniform(4, 10)
-            
-            self.flame_particles.append({
-                'x': self.x + math.cos(angle) * dist,
-                'y': self.y + math.sin(angle) * dist,
-                'base_x': self.x + math.cos(angle) * dist,
-                'base_y': self.y + math.sin(angle) * dist,
-                'size': size,
-                'max_size': size,
-                'life': random.randint(40, 100),
-                'max_life': 100,
-                'speed': speed,
-                'speed_variation': random.uniform(0.95, 1.05),
-                'angle': angle,
-                'wiggle_speed': random.uniform(0.05, 0.15),
-                'wiggle_amount': random.uniform(0.5, 2.0),
-                'rise_speed': random.uniform(0.3, 1.0),
-                'color_index': random.randint(0, len(self.fire_gradient)-1)
-            })
-        
-        # Particules d'étincelles
-        for _ in range(20):
-            angle = random.random() * 2 * math.pi
-            speed = random.uniform(2.0, 5.0)
-            
-            self.spark_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed * 0.5 - random.uniform(1.0, 2.0),
-                'size': random.uniform(1.5, 3.5),
-                'life': random.randint(20, 50),
-                'color': (255, 255, 200, 255),
-                'trail': []
-            })
+        self.effects.emit_flames(np.full(40, float(self.x)), np.full(40, float(self.y)), self.number)
+        self._emit_sparks(20)
         
         # Particules de fumée
-        for _ in range(15):
-            angle = random.random() * 2 * math.pi
-            dist = random.uniform(20, 45)
-            
-            self.smoke_particles.append({
-                'x': self.x + math.cos(angle) * dist,
-                'y': self.y + math.sin(angle) * dist,
-                'dx': random.uniform(-0.3, 0.3),
-                'dy': random.uniform(-0.8, -0.3),
-                'size': random.uniform(8, 15),
-                'life': random.randint(80, 150),
-                'max_life': 150,
-                'color': (80, 80, 80, 180),
-                'fade_start': random.randint(50, 100)
-            })
+        smoke = self.effects.smoke
+        random = smoke.random
+        angle = random.random(15) * 2 * math.pi
+        dist = random.uniform(20, 45, 15)
+        smoke.emit(
+            self.x + np.cos(angle) * dist,
+            self.y + np.sin(angle) * dist,
+            random.uniform(-0.3, 0.3, 15),
+            random.uniform(-0.8, -0.3, 15),
+            life=random.integers(80, 151, 15),
+            fade=random.integers(50, 101, 15),
+            size=random.uniform(8, 15, 15),
+            color=(80, 80, 80),
+            alpha=180,
+            owner=self.number
+        )
+    
+    def _emit_sparks(self, count):
+        """Étincelles projetées depuis le centre"""
+        sparks = self.effects.sparks
+        random = sparks.random
+        angle = random.random(count) * 2 * math.pi
+        speed = random.uniform(2.0, 5.0, count)
+        sparks.emit(
+            self.x, self.y,
+            np.cos(angle) * speed,
+            np.sin(angle) * speed * 0.5 - random.uniform(1.0, 2.0, count),
+            life=random.integers(20, 51, count),
+            fade=50,
+            size=random.uniform(1.5, 3.5, count),
+            color=(255, 255, 200),
+            owner=self.number
+        )
     
     def update(self):
         """Met à jour la zone de feu avec toutes ses animations"""
         self.lifetime -= 1
+        if self.damage_cooldown > 0:
+            self.damage_cooldown -= 1
         self.pulse_timer += 0.05
         self.wave_timer += 0.03
         self.heat_distortion_timer += 0.02
@@ -342,124 +233,57 @@ class FireZone:
         for layer in self.pulse_layers:
             layer['offset'] += layer['speed'] * 0.05
         
-        # Mettre à jour les particules de flamme
-        for particle in self.flame_particles[:]:
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                # Réinitialiser la particule
-                angle = random.random() * 2 * math.pi
-                dist = random.uniform(10, 40)
-                particle['x'] = self.x + math.cos(angle) * dist
-                particle['y'] = self.y + math.sin(angle) * dist
-                particle['base_x'] = particle['x']
-                particle['base_y'] = particle['y']
-                particle['life'] = random.randint(40, 100)
-                particle['size'] = random.uniform(4, 10)
-                particle['max_size'] = particle['size']
-                particle['color_index'] = random.randint(0, len(self.fire_gradient)-1)
-            else:
-                # Animation de la particule
-                wiggle = math.sin(particle['life'] * particle['wiggle_speed']) * particle['wiggle_amount']
-                particle['x'] = particle['base_x'] + wiggle
-                particle['y'] = particle['base_y'] - (100 - particle['life']) * particle['rise_speed'] * 0.1
-                
-                # Taille qui pulse avec la vie
-                life_ratio = particle['life'] / particle['max_life']
-                particle['size'] = particle['max_size'] * (0.3 + 0.7 * life_ratio)
-        
-        # Mettre à jour les étincelles
-        for spark in self.spark_particles[:]:
-            spark['life'] -= 1
-            
-            if spark['life'] <= 0:
-                self.spark_particles.remove(spark)
-            else:
-                spark['x'] += spark['dx']
-                spark['y'] += spark['dy']
-                spark['dy'] += 0.05  # Gravité légère
-                
-                # Ajouter à la traînée
-                spark['trail'].append((spark['x'], spark['y']))
-                if len(spark['trail']) > 5:
-                    spark['trail'].pop(0)
-        
-        # Ajouter de nouvelles étincelles occasionnellement
-        if random.random() < 0.1 and len(self.spark_particles) < 30:
-            angle = random.random() * 2 * math.pi
-            speed = random.uniform(2.0, 5.0)
-            
-            self.spark_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed * 0.5 - random.uniform(1.0, 2.0),
-                'size': random.uniform(1.5, 3.5),
-                'life': random.randint(20, 50),
-                'color': (255, 255, 200, 255),
-                'trail': []
-            })
-        
-        # Mettre à jour la fumée
-        for smoke in self.smoke_particles[:]:
-            smoke['life'] -= 1
-            
-            if smoke['life'] <= 0:
-                self.smoke_particles.remove(smoke)
-            else:
-                smoke['x'] += smoke['dx']
-                smoke['y'] += smoke['dy']
-                smoke['dx'] += random.uniform(-0.02, 0.02)
-                smoke['dy'] += random.uniform(-0.01, 0.01)
-                
-                # La fumée grossit et s'estompe
-                if smoke['life'] < smoke['fade_start']:
-                    smoke['size'] *= 1.02
+        # Nouvelles étincelles occasionnellement (les particules de toutes les
+        # zones sont mises à jour ensemble par FireEffects.update)
+        if self.effects is not None and self.effects.random.random() < 0.1:
+            self._emit_sparks(1)
         
         return self.lifetime > 0
     
+    def release_particles(self):
+        """Retire les particules de la zone (zone éteinte ou retirée)"""
+        if self.effects is not None:
+            self.effects.release(self.number)
+    
     def check_damage(self, player):
         """Vérifie si le joueur est dans la zone et inflige des dégâts"""
         distance = math.sqrt((self.x - player.x)**2 + (self.y - player.y)**2)
-        current_time = pygame.time.get_ticks()
         
         if distance < self.radius:
-            if current_time - self.last_damage_time >= 100:
+            if self.damage_cooldown <= 0:
                 player.take_damage(self.damage_per_tick)
-                self.last_damage_time = current_time
+                self.damage_cooldown = self.damage_interval
                 
                 # Créer des étincelles supplémentaires quand le joueur prend des dégâts
-                for _ in range(3):
-                    angle = random.random() * 2 * math.pi
-                    self.spark_particles.append({
-                        'x': player.x,
-                        'y': player.y,
-                        'dx': math.cos(angle) * random.uniform(2.0, 4.0),
-                        'dy': math.sin(angle) * random.uniform(2.0, 4.0),
-                        'size': random.uniform(2.0, 4.0),
-                        'life': random.randint(15, 35),
-                        'color': (255, 255, 200, 255),
-                        'trail': []
-                    })
+                if self.effects is not None:
+                    self._emit_hit_sparks(player)
                 
                 return True
         return False
     
+    def _emit_hit_sparks(self, player):
+        """Étincelles sur le joueur touché"""
+        sparks = self.effects.sparks
+        random = sparks.random
+        angle = random.random(3) * 2 * math.pi
+        sparks.emit(
+            player.x, player.y,
+            np.cos(angle) * random.uniform(2.0, 4.0, 3),
+            np.sin(angle) * random.uniform(2.0, 4.0, 3),
+            life=random.integers(15, 36, 3),
+            fade=50,
+            size=random.uniform(2.0, 4.0, 3),
+            color=(255, 255, 200),
+            owner=self.number
+        )
+    
     def draw(self, screen):
-        """Dessine la zone de feu avec des effets visuels simplifiés"""
+        """
+        Dessine la zone de feu avec des effets visuels simplifiés
+        (ses particules sont dessinées avec celles des autres zones par FireEffects.draw)
+        """
         current_time = pygame.time.get_ticks()
         
-        # Fumée
-        for smoke in self.smoke_particles:
-            if smoke['life'] > 0:
-                alpha = int(180 * (smoke['life'] / smoke['max_life']))
-                if smoke['life'] < smoke['fade_start']:
-                    alpha = int(180 * (smoke['life'] / smoke['fade_start']))
-                color = (smoke['color'][0], smoke['color'][1], smoke['color'][2], alpha)
-                pygame.draw.circle(screen, color,
-                                (int(smoke['x']), int(smoke['y'])),
-                                int(smoke['size']))
-        
         # Flammes
         pulse = math.sin(self.pulse_timer) * 8
         base_radius = self.base_radius + pulse
@@ -471,48 +295,11 @@ class FireZone:
             color = self.fire_gradient[color_idx]
             alpha = int(color[3] * (0.4 + 0.6 * (i/3)))
             
-            temp_surface = pygame.Surface((int(radius*2), int(radius*2)), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (color[0], color[1], color[2], alpha), 
-                            (int(radius), int(radius)), int(radius))
-            screen.blit(temp_surface, (int(self.x - radius), int(self.y - radius)))
-        
-        # Particules de Flammes
-        for particle in self.flame_particles:
-            if particle['life'] > 0:
-                life_ratio = particle['life'] / particle['max_life']
-                color = self.fire_gradient[particle['color_index']]
-                alpha = int(color[3] * life_ratio * 0.7)
-                
-                # Particule avec un simple glow
-                pygame.draw.circle(screen, (color[0], color[1], color[2], alpha),
-                                (int(particle['x']), int(particle['y'])),
-                                int(particle['size']))
-                
-                # Petit glow autour
-                glow_size = particle['size'] + 2
-                glow_alpha = int(alpha * 0.3)
-                pygame.draw.circle(screen, (color[0], color[1], color[2], glow_alpha),
-                                (int(particle['x']), int(particle['y'])),
-                                int(glow_size))
-        
-        # Etincelle
-        for spark in self.spark_particles:
-            if spark['life'] > 0:
-                spark_alpha = int(255 * (spark['life'] / 50))
-                spark_color = (spark['color'][0], spark['color'][1], spark['color'][2], spark_alpha)
-                pygame.draw.circle(screen, spark_color,
-                                (int(spark['x']), int(spark['y'])),
-                                int(spark['size']))
+            circle_cache.blit(screen, self.x, self.y, radius, color, alpha)
         
         # Contour Simple
         glow_radius = base_radius + 4
         glow_alpha = 20
-        glow_color = (255, 150, 50, glow_alpha)
+        glow_color = (255, 150, 50)
         
-        temp_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(temp_surface, glow_color, 
-                        (glow_radius, glow_radius), 
-                        glow_radius, 2)
-        screen.blit(temp_surface, 
-                (int(self.x - glow_radius), 
-                int(self.y - glow_radius)))
\ No newline at end of file
+        circle_cache.blit(screen, self.x, self.y, glow_radius, glow_color, glow_alpha, 2)
\ No newline at end of file
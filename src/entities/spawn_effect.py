@@ -1,6 +1,7 @@
 # src/entities/spawn_effect.py
 import pygame
 import math
+from src.utils.text_cache import text_cache
 
 class SpawnEffect:
     """Effet visuel pour l'apparition d'un ennemi"""
@@ -70,7 +71,7 @@ class SpawnEffect:
                           int(inner_radius), 1)
         
         # Indicateur de type d'ennemi
-        font = pygame.font.Font(None, 28)
+        font = self.settings.get_font(28)
         
         # Code couleur selon le type
         if self.enemy_type == "charger":
@@ -85,11 +86,11 @@ class SpawnEffect:
             color = (255, 100, 100)  # Rouge
         
         # Texte avec ombre pour meilleure lisibilité
-        text_surface = font.render("", True, color)
+        text_surface = text_cache.render(font, "", True, color)
         text_rect = text_surface.get_rect(center=(int(self.x), int(self.y)))
         
         # Ombre du texte
-        shadow_surface = font.render("", True, (0, 0, 0))
+        shadow_surface = text_cache.render(font, "", True, (0, 0, 0))
         screen.blit(shadow_surface, (text_rect.x + 1, text_rect.y + 1))
         screen.blit(text_surface, text_rect)
     
@@ -1,21 +1,24 @@
 # src/entities/weapons.py
 import math
-import random
-from .projectiles import Projectile
+from src.utils.rng import RngStreams
+import numpy as np
 
 class Weapon:
     """
     Gère le système d'armes du joueur.
     Inclut le tir automatique, multishot et tir en arc.
     """
-    def __init__(self, settings, player_data):
+    def __init__(self, settings, player_data, rng=None):
+        rng = rng if rng is not None else RngStreams()
+        self.fx_random = rng.fx  # Flux cosmétique de la scène (sons)
         self.fire_rate = player_data["attack_speed"]  # tirs par seconde
-        self.damage = player_data["attack_damages"] + random.randint(-5, 5)
+        self.damage = player_data["attack_damages"] + rng.weapon.randint(-5, 5)
         self.projectile_speed = player_data["projectile_speed"]
         self.last_shot_time = 0
         self.last_direction = (1, 0)  # direction par défaut (droite)
         self.stationary_time = 0
         self.stationary_threshold = player_data["stationary_threshold"]
+        self.targeting_range = settings.WEAPON_TARGETING_RANGE  # Portée du ciblage automatique
         
         # Multishot system
         self.multishot_count = 0  # Nombre de projectiles supplémentaires
@@ -27,6 +30,8 @@ class Weapon:
         self.arc_shot = False  # True si le perk est activé
         self.arc_angle = math.radians(15)  # Angle de 15 degrés entre les projectiles
         
+        self.homing_turn_rate = 0  # Virage max par tick des tirs à tête chercheuse (perk), 0 : tirs droits
+        
         self.settings = settings
         
         # Chargement des sons de tir
@@ -46,10 +51,10 @@ class Weapon:
         """Joue un son de tir aléatoire"""
         if self.shoot_sounds:
             # Choisir un son au hasard
-            random.choice(self.shoot_sounds).play()
+            self.fx_random.choice(self.shoot_sounds).play()
         # Si aucun son n'est chargé, ne rien faire (jeu silencieux)
     
-    def update(self, player, current_time, projectiles, enemies, dt):
+    def update(self, player, current_time, projectiles, enemy_index, dt):
         """Gère le tir automatique et le multishot"""
         
         # Gestion du multishot en cours
@@ -60,7 +65,7 @@ class Weapon:
                    self.multishot_timer >= self.shot_interval):
                 # Tire le prochain projectile de la queue
                 projectile_data = self.multishot_queue.pop(0)
-                self._create_shot(projectile_data, projectiles)  # Changé pour _create_shot
+                self._create_shot(projectile_data, projectiles, enemy_index)
                 self.multishot_timer = 0
             
             if not self.multishot_queue:
@@ -79,77 +84,81 @@ class Weapon:
             self.stationary_time >= self.stationary_threshold and 
             current_time - self.last_shot_time > 1000 / self.fire_rate):
             
-            target_enemy = self.find_closest_enemy(player, enemies)
+            # Une cible distincte par projectile du multishot, la plus proche d'abord
+            targets = self.find_targets(player, enemy_index, self.multishot_count + 1)
             
-            if target_enemy:
-                self._shoot_at_target(player, target_enemy, projectiles)
+            if targets:
+                self._shoot_at_targets(player, targets, projectiles, enemy_index)
             else:
                 self._shoot_in_direction(player, projectiles)
             
             self.last_shot_time = current_time
     
-    def find_closest_enemy(self, player, enemies):
-        """Trouve l'ennemi le plus proche du joueur"""
-        if not enemies:
-            return None
-            
-        closest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - player.x)**2 + (enemy.y - player.y)**2)
-            if distance < min_distance:
-                min_distance = distance
-                closest_enemy = enemy
-        
-        return closest_enemy if min_distance < 500 else None
+    def find_closest_enemy(self, player, enemy_index):
+        """Trouve l'ennemi le plus proche du joueur dans la portée (EnemyIndex du tick)"""
+        return enemy_index.nearest(player.x, player.y, self.targeting_range)
+    
+    def find_targets(self, player, enemy_index, count):
+        """Les `count` ennemis les plus proches du joueur dans la portée, du plus proche au plus loin"""
+        return enemy_index.k_nearest(player.x, player.y, count, self.targeting_range)
     
-    def _shoot_at_target(self, player, target, projectiles):
-        """Tire vers l'ennemi ciblé"""
-        dx = target.x - player.x
-        dy = target.y - player.y
+    @staticmethod
+    def _direction(x, y, target):
+        """Direction unitaire de (x, y) vers la cible"""
+        dx = target.x - x
+        dy = target.y - y
         distance = max(math.sqrt(dx*dx + dy*dy), 0.1)
-        dx /= distance
-        dy /= distance
+        return dx / distance, dy / distance
+    
+    def _shoot_at_targets(self, player, targets, projectiles, enemy_index=None):
+        """Tire vers les ennemis ciblés (le plus proche pour le tir principal)"""
+        dx, dy = self._direction(player.x, player.y, targets[0])
         
         # Met à jour la dernière direction
         self.last_direction = (dx, dy)
         
         # Déclenche le tir (normal ou multishot)
-        self._trigger_shot(player.x, player.y, dx, dy, projectiles)
+        self._trigger_shot(player.x, player.y, dx, dy, projectiles, targets, enemy_index)
     
     def _shoot_in_direction(self, player, projectiles):
         """Tire dans la dernière direction"""
         dx, dy = self.last_direction
         self._trigger_shot(player.x, player.y, dx, dy, projectiles)
     
-    def _trigger_shot(self, x, y, dx, dy, projectiles):
+    def _trigger_shot(self, x, y, dx, dy, projectiles, targets=(), enemy_index=None):
         """Déclenche un tir (normal ou multishot)"""
         if self.multishot_count > 0:
             # Prépare le multishot
-            self._prepare_multishot(x, y, dx, dy, projectiles)
+            self._prepare_multishot(x, y, dx, dy, projectiles, targets, enemy_index)
         else:
             # Tir normal ou en arc
             self._create_shot({
                 'x': x, 'y': y,
                 'dx': dx * self.projectile_speed,
                 'dy': dy * self.projectile_speed,
-                'damage': self.damage
-            }, projectiles)
+                'damage': self.damage,
+                'target': targets[0] if targets else None
+            }, projectiles, enemy_index)
     
-    def _prepare_multishot(self, x, y, dx, dy, projectiles):
-        """Prépare les projectiles pour le multishot"""
+    def _prepare_multishot(self, x, y, dx, dy, projectiles, targets=(), enemy_index=None):
+        """
+        Prépare les projectiles pour le multishot : chacun vise sa propre cible
+        (k plus proches), les projectiles en trop gardent la direction du tir principal
+        """
         total_shots = self.multishot_count + 1  # +1 pour le tir principal
                 
         # Crée la queue de tirs et tire immédiatement le premier
         self.multishot_queue = []
         for i in range(total_shots):
+            target = targets[i] if i < len(targets) else None
+            shot_dx, shot_dy = self._direction(x, y, target) if target is not None else (dx, dy)
             self.multishot_queue.append({
                 'x': x, 'y': y,
-                'dx': dx * self.projectile_speed,
-                'dy': dy * self.projectile_speed,
+                'dx': shot_dx * self.projectile_speed,
+                'dy': shot_dy * self.projectile_speed,
                 'damage': self.damage,
-                'index': i
+                'index': i,
+                'target': target
             })
         
         # Démarre le multishot et tire immédiatement le premier projectile
@@ -159,43 +168,60 @@ class Weapon:
         # Tire le premier projectile immédiatement
         if self.multishot_queue:
             projectile_data = self.multishot_queue.pop(0)
-            self._create_shot(projectile_data, projectiles)  # Changé pour _create_shot
+            self._create_shot(projectile_data, projectiles, enemy_index)
     
-    def _create_shot(self, data, projectiles):
+    def _create_shot(self, data, projectiles, enemy_index=None):
         """Crée un tir (simple ou en arc selon le perk)"""
         if self.arc_shot:
-            self._create_arc_shot(data, projectiles)
+            self._create_arc_shot(data, projectiles, enemy_index)
         else:
             self._create_single_projectile(data, projectiles)
     
-    def _create_arc_shot(self, data, projectiles):
-        """Crée trois projectiles en arc"""
+    def _create_arc_shot(self, data, projectiles, enemy_index=None):
+        """
+        Crée trois projectiles en arc (émis en un seul lot)
+        Chaque projectile latéral vise l'ennemi de la portée le plus proche de son angle
+        (à moins d'un demi-arc), autre que les cibles des autres projectiles
+        """
         base_angle = math.atan2(data['dy'], data['dx'])
         speed = math.sqrt(data['dx']**2 + data['dy']**2)
         
         # Les trois angles : centre, gauche, droite
-        angles = [
+        angles = np.array([
             base_angle,  # Centre (vers l'ennemi)
             base_angle - self.arc_angle,  # Gauche
             base_angle + self.arc_angle   # Droite
-        ]
+        ])
+        targets = [data.get('target'), None, None]
+        if enemy_index is not None:
+            candidates = [
+                enemy for enemy in enemy_index.within(data['x'], data['y'], self.targeting_range)
+                if enemy is not targets[0]
+            ]
+            bearings = [math.atan2(enemy.y - data['y'], enemy.x - data['x']) for enemy in candidates]
+            for side in (1, 2):
+                best = None
+                best_gap = self.arc_angle / 2
+                for enemy, bearing in zip(candidates, bearings):
+                    # Écart d'angle normalisé entre 0 et pi
+                    gap = abs((bearing - angles[side] + math.pi) % (2 * math.pi) - math.pi)
+                    if gap <= best_gap and enemy is not targets[1]:
+                        best, best_gap, best_bearing = enemy, gap, bearing
+                if best is not None:
+                    targets[side] = best
+                    angles[side] = best_bearing
         
-        for i, angle in enumerate(angles):
-            # Calcule les nouvelles directions
-            new_dx = math.cos(angle) * speed
-            new_dy = math.sin(angle) * speed
-            
-            # Crée les données pour chaque projectile
-            projectile_data = data.copy()
-            projectile_data['dx'] = new_dx
-            projectile_data['dy'] = new_dy
-            projectile_data['arc_index'] = i  # 0=centre, 1=gauche, 2=droite
-            
-            # Crée le projectile
-            self._create_single_projectile(projectile_data, projectiles)
+        # Données des trois projectiles sous forme de tableaux
+        projectile_data = data.copy()
+        projectile_data['dx'] = np.cos(angles) * speed
+        projectile_data['dy'] = np.sin(angles) * speed
+        projectile_data['arc_index'] = np.arange(3)  # 0=centre, 1=gauche, 2=droite
+        projectile_data['target'] = targets
+        
+        self._create_single_projectile(projectile_data, projectiles)
     
     def _create_single_projectile(self, data, projectiles):
-        """Crée un projectile unique"""
+        """Crée un projectile (ou un lot si dx/dy sont des tableaux)"""
 
         radius = self.settings.player_data["projectile_size"]
         # Couleurs pour multishot
@@ -214,11 +240,11 @@ class Weapon:
             is_multishot = True
         elif 'arc_index' in data: 
             # Couleurs spéciales pour l'arc
-            arc_colors = [
+            arc_colors = np.array([
                 (255, 255, 0),    # Jaune pour le centre
                 (255, 150, 0),    # Orange pour la gauche et la droites
                 (255, 150, 0)     
-            ]
+            ])
             color = arc_colors[data['arc_index'] % len(arc_colors)]
             radius *= 0.8
             is_multishot = False
@@ -229,15 +255,36 @@ class Weapon:
         
         self._play_shoot_sound()
         
-        projectiles.append(Projectile(
+        target = data.get('target')
+        if self.homing_turn_rate > 0 and isinstance(target, list):
+            # Arc à tête chercheuse : chaque projectile poursuit sa propre cible
+            colors = np.broadcast_to(np.asarray(color), (len(target), 3))  # Couleur commune (multishot) ou par projectile
+            for i, arc_target in enumerate(target):
+                projectiles.emit(
+                    data['x'], data['y'],
+                    data['dx'][i], data['dy'][i],
+                    data['damage'],
+                    radius=radius,
+                    color=colors[i],
+                    is_multishot=is_multishot,
+                    special='homing',
+                    turn_rate=self.homing_turn_rate,
+                    target=arc_target
+                )
+            return
+        
+        homing = {}
+        if self.homing_turn_rate > 0:
+            homing = {'special': 'homing', 'turn_rate': self.homing_turn_rate, 'target': target}
+        projectiles.emit(
             data['x'], data['y'],
             data['dx'], data['dy'],
             data['damage'],
-            self.settings,
-            color=color,
             radius=radius,
-            is_multishot=is_multishot
-        ))
+            color=color,
+            is_multishot=is_multishot,
+            **homing
+        )
     
     def update_direction(self, dx, dy):
         """Met à jour la direction de tir basée sur le mouvement"""
@@ -0,0 +1,255 @@
+# src/env.py
+"""
+Environnement d'apprentissage (interface reset / step façon Gymnasium)
+Utilisation :
+    env = TowerEnv()
+    observation, info = env.reset(seed=42)
+    observation, reward, terminated, truncated, info = env.step(action)
+"""
+import numpy as np
+from src.headless import HeadlessGame
+from src.systems.autopilot import DIRECTIONS, apply_direction
+from src.utils.queue import WaveQueue
+
+# Codes des types d'ennemis dans l'observation (0 : emplacement vide)
+ENEMY_CODES = {name: code for code, name in enumerate(WaveQueue.ENEMY_TYPES + ['boss'], start=1)}
+
+# Colonnes de l'observation
+PLAYER_FEATURES = 12  # Position, stats de Player.get_stats, dash, immobilité, étage
+ENEMY_FEATURES = 7  # Position relative, distance, vie, rayon, type, présent
+PROJECTILE_FEATURES = 7  # Position relative, vitesse, rayon, dégâts, présent
+ZONE_FEATURES = 6  # Position relative, rayon, durée restante, en prévisualisation, présent
+
+
+class TowerEnv:
+    """
+    La scène de jeu sans fenêtre comme environnement d'apprentissage
+    Actions (18) : les 9 directions de l'autopilote (0 : immobile, l'arme tire),
+    +9 pour déclencher un dash dans cette direction.
+    Observation : un vecteur float32 de taille fixe, rempli sur place à chaque pas
+    (le même tableau est retourné à chaque appel : le copier pour le garder).
+    Il contient le joueur, les `n_enemies` ennemis et les `n_projectiles`
+    projectiles ennemis les plus proches, et `n_zones` zones de feu.
+    Récompense : score gagné, moins les dégâts subis, plus un bonus par étage
+    atteint et une pénalité à la mort
+    """
+    N_ACTIONS = 2 * len(DIRECTIONS)
+
+    def __init__(self, player_data=None, n_enemies=16, n_projectiles=32, n_zones=8,
+                 frame_skip=1, max_ticks=36000, score_weight=0.01, damage_weight=0.02,
+                 floor_bonus=1.0, death_penalty=1.0):
+        self.game = HeadlessGame(player_data=player_data)
+        self.settings = self.game.settings
+        self.frame_skip = frame_skip  # Ticks simulés par action
+        self.max_ticks = max_ticks  # Au-delà, l'épisode est tronqué
+        self.score_weight = score_weight
+        self.damage_weight = damage_weight
+        self.floor_bonus = floor_bonus
+        self.death_penalty = death_penalty
+
+        self.n_actions = self.N_ACTIONS
+        self.n_enemies = n_enemies
+        self.n_projectiles = n_projectiles
+        self.n_zones = n_zones
+
+        # Un seul tableau ; chaque bloc est une vue remplie sur place
+        sizes = (
+            PLAYER_FEATURES, n_enemies * ENEMY_FEATURES,
+            n_projectiles * PROJECTILE_FEATURES, n_zones * ZONE_FEATURES
+        )
+        self.observation = np.zeros(sum(sizes), dtype=np.float32)
+        self.observation_shape = self.observation.shape
+        offsets = np.cumsum((0,) + sizes)
+        self.player_obs = self.observation[offsets[0]:offsets[1]]
+        self.enemy_obs = self.observation[offsets[1]:offsets[2]].reshape(n_enemies, ENEMY_FEATURES)
+        self.projectile_obs = self.observation[offsets[2]:offsets[3]].reshape(n_projectiles, PROJECTILE_FEATURES)
+        self.zone_obs = self.observation[offsets[3]:offsets[4]].reshape(n_zones, ZONE_FEATURES)
+
+        # Tampons réutilisés pour les ennemis et les zones (agrandis au besoin)
+        self.enemy_buffer = np.zeros((64, 5), dtype=np.float64)
+        self.zone_buffer = np.zeros((32, 5), dtype=np.float64)
+
+        self.info = {"score": 0, "floor": 1, "tick": 0, "damage_taken": 0.0}
+        self.last_score = 0
+        self.last_health = 0
+        self.last_floor = 1
+
+    @staticmethod
+    def observation_size(n_enemies=16, n_projectiles=32, n_zones=8):
+        """Taille du vecteur d'observation (sans créer d'environnement)"""
+        return (PLAYER_FEATURES + n_enemies * ENEMY_FEATURES
+                + n_projectiles * PROJECTILE_FEATURES + n_zones * ZONE_FEATURES)
+
+    def reset(self, seed=None):
+        """Nouvelle partie ; retourne (observation, info)"""
+        self.game.reset(seed)
+        player = self.game.scene.player
+        self.last_score = player.score
+        self.last_health = player.health
+        self.last_floor = 1
+        self.info["damage_taken"] = 0.0
+        self._observe()
+        return self.observation, self._update_info()
+
+    def step(self, action):
+        """Joue une action ; retourne (observation, récompense, terminé, tronqué, info)"""
+        game = self.game
+        scene = game.scene
+        direction = DIRECTIONS[action % len(DIRECTIONS)]
+
+        damage = 0.0
+        for _ in range(self.frame_skip):
+            player = scene.player
+            if not player.is_dashing:
+                apply_direction(player, direction)
+                if action >= len(DIRECTIONS):
+                    player.activate_dash()
+            game.update()
+            # Dégâts subis (la régénération et le soin d'étage ne comptent pas)
+            damage += max(0.0, self.last_health - player.health)
+            self.last_health = player.health
+            if not game.running:
+                break
+
+        player = scene.player
+        floor = scene.wave_manager.floor_number
+        reward = (self.score_weight * (player.score - self.last_score)
+                  - self.damage_weight * damage
+                  + self.floor_bonus * (floor - self.last_floor))
+        self.last_score = player.score
+        self.last_floor = floor
+        self.info["damage_taken"] += damage
+
+        terminated = game.game_over
+        if terminated:
+            reward -= self.death_penalty
+        truncated = not terminated and scene.tick_count >= self.max_ticks
+
+        self._observe()
+        return self.observation, reward, terminated, truncated, self._update_info()
+
+    def _update_info(self):
+        scene = self.game.scene
+        self.info["score"] = scene.player.score
+        self.info["floor"] = scene.wave_manager.floor_number
+        self.info["tick"] = scene.tick_count
+        return self.info
+
+    def _observe(self):
+        """Remplit l'observation sur place"""
+        scene = self.game.scene
+        player = scene.player
+        weapon = scene.weapon
+        width = self.settings.screen_width
+        height = self.settings.screen_height
+
+        # Joueur : champs de Player.get_stats, lus directement (pas de dict par pas)
+        obs = self.player_obs
+        obs[0] = player.x / width
+        obs[1] = player.y / height
+        obs[2] = player.health / player.max_health
+        obs[3] = player.max_health / 100
+        obs[4] = player.speed / 10
+        obs[5] = player.size / 50
+        obs[6] = player.xp / 200
+        obs[7] = player.score / 1000
+        obs[8] = player.get_dash_cooldown_percent()
+        obs[9] = player.is_dashing
+        obs[10] = min(weapon.stationary_time / max(1, weapon.stationary_threshold), 1.0)
+        obs[11] = scene.wave_manager.floor_number / 10
+
+        self._observe_enemies(scene.enemies, player, width, height)
+        self._observe_projectiles(scene.enemy_projectiles, player, width, height)
+        self._observe_zones(scene, player, width, height)
+
+    @staticmethod
+    def _nearest(x, y, player, count):
+        """Index des `count` points les plus proches du joueur, du plus proche au plus loin"""
+        distance2 = (x - player.x) ** 2 + (y - player.y) ** 2
+        if distance2.size > count:
+            index = np.argpartition(distance2, count)[:count]
+        else:
+            index = np.arange(distance2.size)
+        return index[np.argsort(distance2[index])], distance2
+
+    def _observe_enemies(self, enemies, player, width, height):
+        obs = self.enemy_obs
+        obs.fill(0)
+        n = len(enemies)
+        if n == 0:
+            return
+        if n > len(self.enemy_buffer):
+            self.enemy_buffer = np.zeros((2 * n, 5), dtype=np.float64)
+        buffer = self.enemy_buffer
+        for i, enemy in enumerate(enemies):
+            row = buffer[i]
+            row[0] = enemy.x
+            row[1] = enemy.y
+            row[2] = enemy.health / enemy.max_health if enemy.max_health else 0
+            row[3] = enemy.radius
+            row[4] = ENEMY_CODES.get(enemy.type, 0)
+
+        index, distance2 = self._nearest(buffer[:n, 0], buffer[:n, 1], player, self.n_enemies)
+        k = index.size
+        rows = buffer[index]
+        obs[:k, 0] = (rows[:, 0] - player.x) / width
+        obs[:k, 1] = (rows[:, 1] - player.y) / height
+        obs[:k, 2] = np.sqrt(distance2[index]) / width
+        obs[:k, 3] = rows[:, 2]
+        obs[:k, 4] = rows[:, 3] / 50
+        obs[:k, 5] = rows[:, 4] / len(ENEMY_CODES)
+        obs[:k, 6] = 1
+
+    def _observe_projectiles(self, batch, player, width, height):
+        obs = self.projectile_obs
+        obs.fill(0)
+        n = batch.count
+        if n == 0:
+            return
+        index, _ = self._nearest(batch.x[:n], batch.y[:n], player, self.n_projectiles)
+        k = index.size
+        obs[:k, 0] = (batch.x[index] - player.x) / width
+        obs[:k, 1] = (batch.y[index] - player.y) / height
+        obs[:k, 2] = batch.dx[index] / 10
+        obs[:k, 3] = batch.dy[index] / 10
+        obs[:k, 4] = batch.radius[index] / 20
+        obs[:k, 5] = batch.damage[index] / 50
+        obs[:k, 6] = 1
+
+    def _observe_zones(self, scene, player, width, height):
+        obs = self.zone_obs
+        obs.fill(0)
+        n = len(scene.fire_zones) + len(scene.pending_fire_zones)
+        if n == 0:
+            return
+        if n > len(self.zone_buffer):
+            self.zone_buffer = np.zeros((2 * n, 5), dtype=np.float64)
+        buffer = self.zone_buffer
+        i = 0
+        for zone in scene.fire_zones:
+            row = buffer[i]
+            row[0] = zone.x
+            row[1] = zone.y
+            row[2] = zone.radius
+            row[3] = zone.lifetime / zone.duration
+            row[4] = 0
+            i += 1
+        # Zones en prévisualisation : durée restante avant de brûler
+        for pending in scene.pending_fire_zones:
+            row = buffer[i]
+            row[0] = pending['x']
+            row[1] = pending['y']
+            row[2] = 50
+            row[3] = pending['timer'] / 60
+            row[4] = 1
+            i += 1
+
+        index, _ = self._nearest(buffer[:n, 0], buffer[:n, 1], player, self.n_zones)
+        k = index.size
+        rows = buffer[index]
+        obs[:k, 0] = (rows[:, 0] - player.x) / width
+        obs[:k, 1] = (rows[:, 1] - player.y) / height
+        obs[:k, 2] = rows[:, 2] / 100
+        obs[:k, 3] = rows[:, 3]
+        obs[:k, 4] = rows[:, 4]
+        obs[:k, 5] = 1
@@ -3,6 +3,10 @@ import pygame
 import sys
 import json
 from config.settings import Settings
+from src.systems.fixed_timestep import FixedTimestep
+from src.systems.profiler import FrameProfiler
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.utils.assets import assets
 from src.scenes import *
 
 class Game:
@@ -10,12 +14,13 @@ class Game:
     Classe principale du jeu
     Gère l'initialisation, la boucle principale, les scènes, et les événements
     """
-    def __init__(self):
+    def __init__(self, record_replays=False):
         
         # Initialisation des paramètres
         self.player_data = self.get_player_data()
 
         self.settings = Settings(self.player_data)
+        self.settings.record_replays = record_replays
         
         # Initialisation de Pygame
         pygame.init()
@@ -23,7 +28,7 @@ class Game:
         # Création de la fenêtre
         self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height), pygame.RESIZABLE)
         pygame.display.set_caption(self.settings.title)
-        icon = pygame.image.load(self.settings.ICON_PATH)
+        icon = assets.image(self.settings.ICON_PATH)
         pygame.display.set_icon(icon)
         self.full_screen = False
 
@@ -41,6 +46,13 @@ class Game:
 
         # Horloge pour les FPS
         self.clock = pygame.time.Clock()
+
+        # Pas fixe de la simulation (indépendant du rendu)
+        self.timestep = FixedTimestep(self.settings.tick_rate, self.settings.max_ticks_per_frame)
+
+        # Profileur par étape (affiché avec F3)
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler, self.settings)
         
         # État du jeu
         self.running = True
@@ -92,7 +104,9 @@ class Game:
 
             # Événement de bascule plein écran
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_F11:
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                elif event.key == pygame.K_F11:
                     if not self.full_screen:
                         self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)   
                     else:
@@ -107,7 +121,7 @@ class Game:
                 self.current_scene.handle_event(event)
     
     def update(self):
-        """Mise à jour de la logique du jeu"""
+        """Mise à jour de la logique du jeu (un tick de simulation)"""
         if self.current_scene:
             self.current_scene.update()
     
@@ -120,6 +134,9 @@ class Game:
         if self.current_scene:
             self.current_scene.draw(self.used_screen)
 
+        # Panneau du profileur (rien si désactivé)
+        self.profiler_overlay.draw(self.used_screen)
+
         # Dessiner les bordures
         pygame.draw.rect(self.screen, self.settings.BORDER_COLOR, (0, 0, self.settings.x0, self.settings.screen_height))
         pygame.draw.rect(self.screen, self.settings.BORDER_COLOR, (0, 0, self.settings.screen_width, self.settings.y0))
@@ -142,6 +159,8 @@ class Game:
             self.settings.y0 = 0
             self.settings.x0 = (width - self.settings.screen_width)//self.settings.BORDER_WIDTH
         self.used_screen = pygame.Surface((self.settings.screen_width, self.settings.screen_height))
+        # Les images redimensionnées pour l'ancienne taille ne servent plus
+        assets.invalidate_scaled()
         self.current_scene.resize()
 
     def get_player_data(self):
@@ -168,20 +187,29 @@ class Game:
     def run(self):
         """Boucle principale du jeu"""
         while self.running:
+            # Contrôle des FPS (temps réel écoulé depuis l'image précédente)
+            elapsed = self.clock.tick(self.settings.fps)
+            probe = self.profiler.start()
+
             # Gestion des événements
             self.handle_events()
+            probe = self.profiler.lap("events", probe)
             
-            # Mise à jour de la logique
-            self.update()
+            # Mise à jour de la logique à pas fixe, autant de ticks que nécessaire
+            for _ in range(self.timestep.advance(elapsed)):
+                self.update()
+                if not self.running:
+                    break
+            probe = self.profiler.lap("update", probe)
             
             # Rendu
             self.draw()
-            
-            # Contrôle des FPS
-            self.clock.tick(self.settings.fps)
+            self.profiler.lap("draw", probe)
+            self.profiler.end_frame()
         
-        # Sauvegarde des données du joueur
+        # Sauvegarde des données du joueur (et du replay de la partie interrompue)
         self.save()
+        self.scenes[self.settings.SCENE_GAME].save_replay()
 
         # Nettoyage
         self.settings.cleanup()
@@ -0,0 +1,225 @@
+# src/headless.py
+"""
+Simulation sans fenêtre ni son de la scène de jeu
+Utilisation : python -m src.headless --seed 42 --ticks 20000
+"""
+import os
+import argparse
+import json
+import time
+import pygame
+from config.settings import Settings
+from src.scenes.game_scene import GameScene
+from src.systems.autopilot import Autopilot
+from src.systems.fixed_timestep import FixedTimestep
+from src.systems.profiler import FrameProfiler
+from src.systems.replay import Replay, EVENT_DASH, EVENT_PERK, EVENT_RESIZE, apply_input, state_digest
+from src.utils.pattern_cache import pattern_cache
+
+
+class HeadlessGame:
+    """
+    Remplace Game pour la simulation : pas de fenêtre, pas de rendu, sons muets
+    La scène de jeu est avancée tick par tick aussi vite que possible
+    """
+    def __init__(self, seed=None, player_data=None, invincible=False, profile=False, replay=None, autopilot=False):
+        # Relecture : seed et données du joueur de la partie enregistrée
+        self.replay = replay
+        self.replay_events = replay.events_by_tick() if replay else {}
+        self.replay_tick = 0
+        self.final_digest = None
+        if replay is not None:
+            seed = replay.seed
+            player_data = replay.player_data
+
+        # Données par défaut : la sauvegarde du joueur n'est jamais modifiée
+        if player_data is None:
+            with open(r"data/default_player_data.json", 'r', encoding='utf-8') as f:
+                player_data = json.load(f)
+        self.player_data = player_data
+
+        self.settings = Settings(self.player_data, headless=True)
+        if replay is not None:
+            self.settings.screen_width, self.settings.screen_height = replay.screen_size
+
+        # Pilotes factices, choisis avant l'initialisation de pygame
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+        self.settings._init_fonts()
+        self.settings._init_sounds()
+
+        self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep(self.settings.tick_rate, self.settings.max_ticks_per_frame)
+
+        # Profileur par étape de mise à jour (un tick = une image)
+        self.profiler = FrameProfiler()
+        self.profiler.enabled = profile
+
+        self.running = True
+        self.game_stats = None
+        self.game_over = False
+        self.perks_chosen = 0
+        self.invincible = invincible  # Soak tests : le joueur ne peut pas mourir
+        self.autopilot = Autopilot() if autopilot and replay is None else None  # Sinon le joueur reste immobile
+
+        # Une seule scène : la partie
+        self.scene = GameScene(self, self.settings)
+        self.current_scene = self.scene
+        self.scene.on_enter(self.player_data, seed)
+
+    def reset(self, seed=None):
+        """Nouvelle partie dans la même simulation (polices et sons déjà chargés)"""
+        self.running = True
+        self.game_over = False
+        self.game_stats = None
+        self.perks_chosen = 0
+        self.final_digest = None
+        if self.autopilot is not None:
+            self.autopilot = Autopilot()
+        self.scene.on_enter(self.player_data, seed)
+
+    def change_scene(self, scene_name):
+        """Seule la fin de partie est gérée : elle arrête la simulation"""
+        if scene_name == self.settings.SCENE_GAME_OVER:
+            self.game_over = True
+            self.running = False
+            # Même instant que l'écriture du replay par la vraie partie
+            if self.final_digest is None:
+                self.final_digest = state_digest(self.scene)
+
+    def save(self):
+        """Rien n'est sauvegardé en simulation"""
+        pass
+
+    def update(self):
+        """Un tick de simulation, avec choix automatique des perks"""
+        if self.replay is not None:
+            self._apply_replay_tick()
+            self.scene.update()
+            return
+
+        if self.scene.game_paused:
+            if self.scene.current_sub_scene is self.scene.perks_sub_scene:
+                perks_list = self.scene.perks_sub_scene.perks_list
+                self.scene._handle_perks_menu_selection(self.scene.rng.bot.randrange(max(1, len(perks_list))))
+                self.perks_chosen += 1
+            else:
+                self.scene.game_paused = False
+                self.scene.current_sub_scene = None
+        if self.autopilot is not None and not self.scene.game_paused:
+            self.autopilot.update(self.scene)
+        if self.invincible:
+            # Vie énorme : plusieurs coups dans le même tick ne peuvent pas tuer
+            self.scene.player.health = 10**9
+        self.scene.update()
+
+    def _apply_replay_tick(self):
+        """Rejoue les événements puis les entrées enregistrés pour le prochain tick"""
+        scene = self.scene
+        for kind, a, b in self.replay_events.get(self.replay_tick, ()):
+            if kind == EVENT_DASH:
+                scene.player.activate_dash()
+            elif kind == EVENT_PERK:
+                scene._handle_perks_menu_selection(a)
+            elif kind == EVENT_RESIZE:
+                self.settings.screen_width, self.settings.screen_height = a, b
+                scene.resize()
+        apply_input(scene.player, self.replay.inputs[self.replay_tick])
+        self.replay_tick += 1
+
+    def run(self, ticks=None):
+        """Simule au plus `ticks` ticks (tout le replay par défaut) et retourne le rapport"""
+        if ticks is None:
+            ticks = len(self.replay) if self.replay is not None else 36000
+        if self.replay is not None:
+            ticks = min(ticks, len(self.replay))
+        start = time.perf_counter()
+        played = 0
+        while self.running and played < ticks:
+            self.update()
+            self.profiler.end_frame()
+            played += 1
+        elapsed = time.perf_counter() - start
+        return self.report(played, elapsed)
+
+    def report(self, ticks, elapsed):
+        """Résumé de la simulation"""
+        scene = self.scene
+        return {
+            "ticks": ticks,
+            "seconds_simulated": round(ticks / self.settings.tick_rate, 1),
+            "ticks_per_second": round(ticks / elapsed) if elapsed > 0 else 0,
+            "floor": scene.wave_manager.floor_number,  # current_floor est remis à 1 à la mort
+            "wave": scene.wave_manager.wave_number,
+            "game_over": self.game_over,
+            "score": scene.player.score,
+            "perks_chosen": self.perks_chosen,
+            "enemies": len(scene.enemies),
+            "player_projectiles": len(scene.projectiles),
+            "enemy_projectiles": len(scene.enemy_projectiles),
+            "fire_zones": len(scene.fire_zones),
+            "enemy_projectiles_high_water": scene.enemy_projectiles.high_water,
+            "enemy_projectiles_budget": dict(scene.enemy_projectiles.budget_stats),
+            "pattern_cache_hit_rate": round(pattern_cache.stats()["hit_rate"], 3),
+        } | self._autopilot_report() | self._profile_report() | self._replay_report(ticks)
+
+    def _autopilot_report(self):
+        """Coût des décisions du pilote automatique (µs) et nombre de dashs, et budget si le profileur est actif"""
+        if self.autopilot is None:
+            return {}
+        stats = self.autopilot.stats()
+        report = {
+            "autopilot_us": f"{stats['mean']:.1f} / {stats['p95']:.1f} / {stats['max']:.1f}",
+            "autopilot_dashes": self.autopilot.dashes
+        }
+        if self.profiler.enabled:
+            report["autopilot_budget_us"] = f"{self.autopilot.BUDGET_US} ({stats['over_budget']} décisions au-delà)"
+        return report
+
+    def _replay_report(self, ticks):
+        """Vérification au bit près de la relecture (état final identique à l'enregistrement)"""
+        if self.replay is None:
+            return {}
+        digest = self.final_digest if self.final_digest is not None else state_digest(self.scene)
+        return {
+            "replay_ticks": len(self.replay),
+            "replay_match": ticks == len(self.replay) and digest == self.replay.digest
+        }
+
+    def _profile_report(self):
+        """Moyenne, p95 et max (ms) par étape, puis coût de think (µs) par type, si le profileur est actif"""
+        if not self.profiler.enabled:
+            return {}
+        return {
+            f"profile {stage}": f"{stats['mean']:.3f} / {stats['p95']:.3f} / {stats['max']:.3f}"
+            for stage, stats in self.profiler.summary().items()
+        } | {
+            f"think {enemy_type}": f"{stats['thinks']} x {stats['mean_us']:.1f} / {stats['max_us']:.1f}"
+            for enemy_type, stats in self.scene.ai_scheduler.stats().items()
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation de Tour Maudite sans fenêtre")
+    parser.add_argument("--seed", type=int, default=None, help="Seed de la partie")
+    parser.add_argument("--ticks", type=int, default=None, help="Nombre maximal de ticks (60 par seconde de jeu, 36000 par défaut)")
+    parser.add_argument("--invincible", action="store_true", help="Le joueur ne peut pas mourir (soak tests)")
+    parser.add_argument("--profile", action="store_true", help="Mesure chaque étape de la mise à jour (moyenne / p95 / max en ms)")
+    parser.add_argument("--autopilot", action="store_true", help="Le joueur est piloté par le bot (sinon il reste immobile)")
+    parser.add_argument("--replay", default=None, help="Rejoue une partie enregistrée (python Main.py --record)")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay) if args.replay else None
+    game = HeadlessGame(
+        seed=args.seed, invincible=args.invincible, profile=args.profile,
+        replay=replay, autopilot=args.autopilot
+    )
+    report = game.run(args.ticks)
+    for key, value in report.items():
+        print(f"{key}: {value}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -48,3 +48,8 @@ class Perks:
         self.weapon.arc_shot = True
         self.weapon.arc_angle = math.radians(15)  # Angle de 15 degrés entre les projectiles
         self.settings.perks_only_once.append("arc_shot")
+
+    def homing_shot(self):
+        """Les projectiles poursuivent l'ennemi qu'ils visent"""
+        self.weapon.homing_turn_rate = 0.06  # Radians par tick
+        self.settings.perks_only_once.append("homing_shot")
@@ -1,10 +1,11 @@
 # src/perks/perks_manager.py
-import random
+from src.utils.rng import RngStreams
 from .perks import Perks
 
 class PerksManager:
-    def __init__(self, settings, player, weapon):
+    def __init__(self, settings, player, weapon, rng=None):
         self.settings = settings
+        self.random = (rng if rng is not None else RngStreams()).perks  # Flux des perks de la scène
         self.perks = Perks(settings, player, weapon)
         self.perks_dict = {
             "player_speed": self.perks.player_speed,
@@ -16,7 +17,8 @@ class PerksManager:
             "player_regen": self.perks.player_regen,
             "projectile_speed": self.perks.projectile_speed,
             "multishot": self.perks.multishot,
-            "arc_shot": self.perks.arc_shot
+            "arc_shot": self.perks.arc_shot,
+            "homing_shot": self.perks.homing_shot
         }
 
     def get_perks(self) -> list:
@@ -36,11 +38,13 @@ class PerksManager:
             "player_regen": 8,
             "projectile_speed": 8,
             "multishot": 6,  
-            "arc_shot": 4
+            "arc_shot": 4,
+            "homing_shot": 4
         }
         
         perks_list = list(self.perks_dict.keys())
-        perks_list = list(set(perks_list) - set(self.settings.perks_only_once))
+        # Ordre conservé (une différence d'ensembles dépend du hachage des chaînes)
+        perks_list = [perk for perk in perks_list if perk not in self.settings.perks_only_once]
 
         weighted_list = []
         for perk in perks_list:
@@ -48,7 +52,7 @@ class PerksManager:
         
         selected = []
         while len(selected) < 3:
-            choice = random.choice(weighted_list)
+            choice = self.random.choice(weighted_list)
             if choice not in selected:
                 selected.append(choice)
         
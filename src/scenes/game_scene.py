@@ -1,12 +1,30 @@
 # src/scenes/game_scene.py
+import os
+import time
 import pygame
 import math
 import random
+import numpy as np
+from types import SimpleNamespace
 from src.entities import *
 from src.entities.enemies import *
 from src.entities.spawn_effect import SpawnEffect
+from src.entities.projectile_batch import SOURCE_NAMES
+from src.entities.projectiles import FireEffects
 from src.systems.wave_manager import WaveManager
 from src.systems.game_stats import GameStats
+from src.systems.combat_log import CombatLog
+from src.systems.spatial_grid import SpatialGrid
+from src.systems.entity_registry import EntityRegistry
+from src.systems.enemy_index import EnemyIndex
+from src.systems.steering import SteeringSystem
+from src.systems.ai_scheduler import AIScheduler
+from src.systems.emission_scheduler import EmissionScheduler
+from src.systems.replay import ReplayRecorder
+from src.utils.rng import RngStreams
+from src.utils.assets import assets
+from src.utils.sprite_cache import circle_cache
+from src.utils.text_cache import text_cache
 from src.ui.hud import HUD
 from src.ui.transition_effect import TransitionEffect
 from .base_scene import BaseScene
@@ -23,33 +41,61 @@ class GameScene(BaseScene):
         self.weapon = None
         self.wave_manager = None
         self.game_stats = None
+        self.combat_log = None  # Journal de combat (équilibrage)
         self.hud = None
         self.transition = None
-        self.projectiles = []
-        self.enemy_projectiles = []
-        self.enemies = []
-        self.current_time = 0
+        self.enemies = EntityRegistry()
+        self.enemy_index = EnemyIndex()  # Reconstruit à la première requête du tick, partagé par le ciblage
+        self.steering = SteeringSystem(  # Déplacement des ennemis en lot par comportement, puis séparation
+            separation=settings.ENEMY_SEPARATION,
+            max_push=settings.ENEMY_SEPARATION_MAX_PUSH,
+            neighbors_per_cell=settings.ENEMY_NEIGHBORS_PER_CELL
+        )
+        self.ai_scheduler = AIScheduler(settings.AI_THINK_INTERVAL)  # Décisions lentes réparties sur plusieurs ticks
+        self.projectiles = ProjectileBatch(settings, registry=self.enemies)
+        self.enemy_projectiles = self._create_enemy_projectiles()
+        self.emissions = EmissionScheduler()  # Salves des bosses, étalées sur plusieurs ticks
+        self.current_time = 0  # Temps de simulation en millisecondes
+        self.tick_count = 0
         self.current_floor = 1
         self.spawn_effects = []
         self.fire_zones = []  # Zones de feu actives
         self.pending_fire_zones = []  # Zones en prévisualisation
+        self.rng = RngStreams()  # Flux aléatoires de la scène, resemés à chaque partie
+        self.fire_effects = FireEffects(self.rng)  # Particules des zones de feu de la scène
+        self.projectile_grid = SpatialGrid()  # Phase large projectiles joueur → ennemis
+        self.projectile_renderer = ProjectileRenderer()  # Rendu groupé des deux lots
         self.global_seed = random.randint(0, 2**32 - 1)  # Seed unique par partie
-        random.seed(self.global_seed)
         self.current_floor = 1
+        self.recorder = None  # Enregistreur de replay de la partie en cours
+
+    def on_enter(self, player_data, seed=None):
+        """Initialisation du jeu (seed imposée pour la simulation et les replays)"""
+        # Nouvelle seed à chaque partie : la partie ne dépend que d'elle et des entrées
+        self.global_seed = seed if seed is not None else random.randint(0, 2**32 - 1)
+        self.rng.seed_all(self.global_seed)
+        self.settings.perks_only_once = []
+        if self.settings.record_replays:
+            self.recorder = ReplayRecorder(self.global_seed, player_data, self.settings)
+        # Le budget de réflexion dépend du temps réel : sans budget, simulations et replays restent reproductibles
+        self.ai_scheduler.reset()
+        self.ai_scheduler.budget_ms = None if self.settings.headless or self.settings.record_replays else self.settings.AI_THINK_BUDGET_MS
 
-    def on_enter(self, player_data):
-        """Initialisation du jeu"""
         self.current_floor = 1  # Réinitialiser l'étage
+        self.current_time = 0
+        self.tick_count = 0
         self.player = Player(
             self.settings.screen_width//2, 
             self.settings.screen_height//2, 
             self.settings,
-            player_data
+            player_data,
+            self.rng
         )
-        self.weapon = Weapon(self.settings, player_data) 
-        self.wave_manager = WaveManager(self.settings)
+        self.weapon = Weapon(self.settings, player_data, self.rng)
+        self.wave_manager = WaveManager(self.settings, self.rng)
         self.wave_manager.reset_to_floor(self.current_floor)
         self.game_stats = GameStats(self.game, self.settings)
+        self.combat_log = CombatLog()
         
         # Sous-scènes
         self.stat_sub_scene = StatSubScene(self.game, self, self.settings)
@@ -64,16 +110,41 @@ class GameScene(BaseScene):
         self.transition = TransitionEffect(self.settings)
 
         # Image de fond
-        self.fond = pygame.image.load(r"assets/images/background/game_scene.png")
-        self.fond = pygame.transform.scale(self.fond, (self.settings.screen_width, self.settings.screen_height))
+        self.fond = assets.scaled(r"assets/images/background/game_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
         
         # Listes
-        self.projectiles = []
-        self.enemy_projectiles = []
-        self.enemies = []
+        self.enemies = EntityRegistry()  # Poignées stables, retraits différés jusqu'au flush du tick
+        self.projectiles = ProjectileBatch(self.settings, registry=self.enemies)
+        self.enemy_projectiles = self._create_enemy_projectiles()
+        self.emissions.clear()
         self.spawn_effects = [] 
         self.fire_zones = []
         self.pending_fire_zones = []
+        self.fire_effects.clear()
+
+    def _create_enemy_projectiles(self):
+        """Lot des projectiles ennemis, borné par le budget des réglages"""
+        return ProjectileBatch(
+            self.settings,
+            budget=self.settings.ENEMY_PROJECTILE_BUDGET,
+            policy=self.settings.ENEMY_PROJECTILE_POLICY,
+            trail_limit=self.settings.ENEMY_PROJECTILE_TRAIL_LIMIT,
+            registry=self.enemies
+        )
+
+    def on_exit(self):
+        """Fin de la partie (mort ou retour au menu)"""
+        self.save_replay()
+
+    def save_replay(self):
+        """Écrit le replay de la partie en cours, s'il est enregistré"""
+        if self.recorder is None:
+            return None
+        os.makedirs(self.settings.REPLAY_DIR, exist_ok=True)
+        path = os.path.join(self.settings.REPLAY_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}_{self.global_seed}.tmr")
+        self.recorder.finish(self, path)
+        self.recorder = None
+        return path
 
     def handle_event(self, event):
         """
@@ -108,8 +179,13 @@ class GameScene(BaseScene):
             self.current_sub_scene.update()
             return
         
-        self.current_time = pygame.time.get_ticks()
-        dt = self.game.clock.get_time()  # Delta time en millisecondes
+        if self.recorder is not None:
+            self.recorder.record_tick(self.player)
+        
+        # Temps de simulation : avance d'un pas fixe par tick (gelé pendant la pause)
+        dt = self.game.timestep.dt  # Delta time en millisecondes
+        self.tick_count += 1
+        self.current_time = self.tick_count * dt
         self.hud.update(dt)
 
         
@@ -118,13 +194,21 @@ class GameScene(BaseScene):
         if self.transition.is_active():
             return
         
-        # Mise à jour des différentes composantes du jeu
+        # Mise à jour des différentes composantes du jeu (sondes du profileur F3)
+        profiler = self.game.profiler
+        probe = profiler.start()
         self._update_spawn_effects(dt)
+        probe = profiler.lap("update/spawn_effects", probe)
         self._update_wave_manager()
+        probe = profiler.lap("update/wave_manager", probe)
         self._update_player_and_weapon(dt)
+        probe = profiler.lap("update/player_weapon", probe)
         self._update_projectiles()
+        probe = profiler.lap("update/projectiles", probe)
         self._update_enemies(dt)
+        probe = profiler.lap("update/enemies", probe)
         self._update_fire_zones()
+        probe = profiler.lap("update/fire_zones", probe)
         
         self._check_floor_completion()
     
@@ -135,14 +219,16 @@ class GameScene(BaseScene):
             if effect.is_complete():
                 # Crée l'ennemi après l'effet
                 enemy = self.create_enemy_from_effect(effect)
-                self.enemies.append(enemy)
-                self.wave_manager.current_wave_enemies.append(enemy) 
+                self.combat_log.on_spawn(enemy, self.tick_count)
+                self.enemies.add(enemy)
+                self.wave_manager.on_enemy_spawned(enemy)
                 self.spawn_effects.remove(effect)
     
     def _update_wave_manager(self):
         """Met à jour le gestionnaire de vagues"""
-        if (self.wave_manager.is_between_waves() and 
-            self.wave_manager.update(self.current_time) and 
+        # update est appelé à chaque tick pour garder l'horloge des vagues à jour
+        if (self.wave_manager.update(self.current_time) and 
+            self.wave_manager.is_between_waves() and 
             len(self.enemies) == 0 and 
             len(self.spawn_effects) == 0):
             
@@ -171,126 +257,153 @@ class GameScene(BaseScene):
         # Mise à jour du joueur
         self.player.update()
         
+        # Index de ciblage des ennemis vivants : construit une fois pour tout le tick, et seulement s'il sert
+        self.enemy_index.invalidate(self.enemies)
+
         # Mise à jour de l'arme et tir de projectiles
         self.weapon.update_direction(self.player.last_dx, self.player.last_dy)
-        self.weapon.update(self.player, self.current_time, self.projectiles, self.enemies, dt)
+        self.weapon.update(self.player, self.current_time, self.projectiles, self.enemy_index, dt)
     
     def _update_projectiles(self):
         """Met à jour les projectiles du joueur et des ennemis"""
-        # Mise à jour des projectiles joueurs
-        for projectile in self.projectiles[:]:
-            projectile.update()
-            
-            # Gestion des projectiles qui se divisent
-            if hasattr(projectile, 'will_split') and projectile.will_split and projectile.split_timer <= 0:
-                split_projectiles = projectile.create_split_projectiles()
-                self.projectiles.extend(split_projectiles)
-                projectile.will_split = False
-            
-            if not projectile.is_alive():
-                self.projectiles.remove(projectile)
-        
-        # Mise à jour des projectiles ennemis
-        for projectile in self.enemy_projectiles[:]:
-            projectile.update()
-            
-            # Gestion des projectiles qui se divisent
-            if hasattr(projectile, 'will_split') and projectile.will_split and projectile.split_timer <= 0:
-                split_projectiles = projectile.create_split_projectiles()
-                self.enemy_projectiles.extend(split_projectiles)
-                projectile.will_split = False
-            
-            if not projectile.is_alive():
-                self.enemy_projectiles.remove(projectile)
-            else:
-                # Collisions projectiles ennemis → joueur
-                distance = ((projectile.x - self.player.x)**2 + (projectile.y - self.player.y)**2)**0.5
-                if distance < self.player.size + projectile.radius:
-                    if self.player.take_damage(projectile.damage):
-                        self._handle_player_death()
-                    if projectile in self.enemy_projectiles:
-                        self.enemy_projectiles.remove(projectile)
+        # Mise à jour vectorisée (déplacement, divisions, sorties d'écran)
+        self.projectiles.update()
+        self.enemy_projectiles.update()
+        
+        # Collisions projectiles ennemis → joueur
+        hits = self.enemy_projectiles.collide_circle(self.player.x, self.player.y, self.player.size)
+        for i in hits:
+            source = SOURCE_NAMES[self.enemy_projectiles.source[i]]
+            self._damage_player(float(self.enemy_projectiles.damage[i]), source)
+        if hits.size:
+            self.enemy_projectiles.kill(hits)
+            self.enemy_projectiles.compact()
     
     def _update_enemies(self, dt):
         """Met à jour tous les ennemis"""
-        new_bosses_from_division = []
-        bosses_to_remove = []
-        
-        for enemy in self.enemies[:]:
-            # Passe les zones de feu et pending_zones au pyromane
-            if enemy.type == "pyromane":
-                enemy.update(self.player, self.fire_zones, self.pending_fire_zones)
-            # Passe les projectiles ennemis au shooter et destructeur
-            elif enemy.type in ["shooter", "destructeur"]:
-                enemy.update(self.player, self.enemy_projectiles)
-            elif enemy.type == "boss":
-                 # Le boss retourne maintenant (ennemis_créés, bosses_de_division)
-                enemies_created, division_bosses = enemy.update(self.player, self.enemy_projectiles)
-                if division_bosses:
-                    # Stocker le boss à retirer après la boucle
-                    bosses_to_remove.append(enemy)
-                    # Informer le wave manager de la division
-                    self.wave_manager.on_enemy_divided(enemy, division_bosses)
-                    new_bosses_from_division.extend(division_bosses)
-            else:   
-                enemy.update(self.player, None)
+        divisions = []
+
+        # Grille des projectiles joueur, reconstruite une fois par frame
+        self._build_projectile_grid()
+        
+        # Déplacement de tous les ennemis, une passe NumPy par comportement
+        self.steering.update(self.enemies, self.player)
+        # Contacts de mêlée possibles, d'après les positions après déplacement
+        contacts = self.steering.contacts(self.player).tolist()
+        # Décisions lentes (portée, flaques...) des ennemis dont c'est le tour
+        self.ai_scheduler.update(self.enemies, self.player, self.fire_zones, self.pending_fire_zones)
+        
+        # Les ennemis tués pendant la boucle ne sont retirés qu'au flush
+        for enemy, contact in zip(self.enemies, contacts):
+            # Comportement propre (tirs, flaques de feu...) ; seul le boss crée des ennemis
+            division_bosses = enemy.act(self.player, self.enemy_projectiles, self.fire_zones, self.pending_fire_zones)
+            if division_bosses:
+                # Les nouveaux bosses sont ajoutés après la boucle
+                divisions.append((enemy, division_bosses))
                         
             # Collisions projectiles joueur → ennemis
             self._check_player_projectile_collisions(enemy)
             
             # Collisions ennemis mêlée → joueur
-            if enemy.type != "shooter" and enemy.type != "destructeur":
+            if contact:
                 self._check_melee_collision(enemy)
             
             # Gestion des suicides
-            if enemy.type == "suicide":
+            if enemy.explodes:
                 self._handle_suicide_enemy(enemy)
         
-        # Ajouter les nouveaux bosses de division
-        for boss in new_bosses_from_division:
-            if boss not in self.enemies:
-                self.enemies.append(boss)
-                self.wave_manager.current_wave_enemies.append(boss)
+        # Part de ce tick des salves planifiées, même celles d'un boss tué ou divisé depuis
+        self.emissions.update(self.enemy_projectiles)
+        
+        # Retire en une seule passe les projectiles consommés par une collision
+        self.projectiles.compact()
+        # Et les ennemis tués
+        self.enemies.flush()
+        
+        # Ajouter les nouveaux bosses de division puis informer le wave manager
+        for enemy, division_bosses in divisions:
+            for boss in division_bosses:
+                self.combat_log.on_spawn(boss, self.tick_count)
+                self.enemies.add(boss)
+            self.wave_manager.on_enemy_divided(enemy, division_bosses)
+    
+    def _build_projectile_grid(self):
+        """Range les projectiles joueur dans la grille, taillée sur le plus grand rayon"""
+        n = len(self.projectiles)
+        max_radius = 0
+        for enemy in self.enemies:
+            max_radius = max(max_radius, enemy.radius)
+        if n:
+            max_radius = max(max_radius, float(self.projectiles.radius[:n].max()))
+        
+        cell_size = SpatialGrid.cell_size_for(max_radius)
+        if cell_size != self.projectile_grid.cell_size:
+            self.projectile_grid.resize(cell_size)
+        self.projectile_grid.build_arrays(
+            self.projectiles.x[:n], self.projectiles.y[:n], self.projectiles.radius[:n]
+        )
     
     def _check_player_projectile_collisions(self, enemy):
         """Vérifie les collisions entre projectiles joueur et ennemi"""
-        for projectile in self.projectiles[:]:
-            distance = ((enemy.x - projectile.x)**2 + (enemy.y - projectile.y)**2)**0.5
-            if distance < enemy.radius + projectile.radius:
-                if enemy.take_damage(projectile.damage):
-                    self.enemies.remove(enemy)
-                    self.wave_manager.on_enemy_died(enemy)
-                    
-                    # Score et pièces selon le type d'ennemi
-                    if enemy.type == "boss": # Y'a plusieurs Boss (avec la division donc ca augmente beaucoup)
-                        score_amount = 30
-                        coins_amount = 7.5
-                    elif enemy.type == "destructeur":
-                        score_amount = 50
-                        coins_amount = 15
-                    elif enemy.type == "suicide":
-                        score_amount = 20
-                        coins_amount = 5
-                    else:
-                        score_amount = 10
-                        coins_amount = 2
-                    
-                    self.player.add_score(score_amount)
-                    self.player.add_coins(coins_amount) 
-                    self.settings.sounds["mort_enemy"].play()  
-                    
-                    self._check_for_level_up()
+        projectiles = self.projectiles
+        
+        # Boss arborescent : test récursif sur les nœuds
+        if hasattr(enemy, 'root'):
+            for i in self._query_boss_tree(enemy.root):
+                projectile = SimpleNamespace(
+                    x=projectiles.x[i], y=projectiles.y[i],
+                    radius=projectiles.radius[i], damage=float(projectiles.damage[i])
+                )
+                if projectiles.lifetime[i] > 0 and self._check_boss_projectile_collisions(enemy, projectile):
+                    projectiles.lifetime[i] = 0  # Consommé, retiré en fin de frame
+                    break
+            return
+        
+        # Seuls les projectiles des cellules voisines sont testés
+        candidates = self.projectile_grid.query_indices(enemy.x, enemy.y, enemy.radius)
+        if candidates.size == 0:
+            return
+        reach = enemy.radius + projectiles.radius[candidates]
+        touching = ((projectiles.x[candidates] - enemy.x)**2 + (projectiles.y[candidates] - enemy.y)**2 < reach * reach)
+        # Un projectile déjà consommé par un autre ennemi est ignoré
+        touching &= projectiles.lifetime[candidates] > 0
+        hits = candidates[touching]
+        if hits.size == 0:
+            return
+        
+        i = hits[0]
+        if enemy.take_damage(float(projectiles.damage[i])):
+            self.enemies.kill(enemy.handle)
+            self.wave_manager.on_enemy_died(enemy)
+            self.combat_log.on_kill(enemy, self.tick_count)
+            
+            # Score et pièces selon le type d'ennemi
+            if enemy.type == "boss": # Y'a plusieurs Boss (avec la division donc ca augmente beaucoup)
+                score_amount = 30
+                coins_amount = 7.5
+            elif enemy.type == "destructeur":
+                score_amount = 50
+                coins_amount = 15
+            elif enemy.type == "suicide":
+                score_amount = 20
+                coins_amount = 5
+            else:
+                score_amount = 10
+                coins_amount = 2
+            
+            self.player.add_score(score_amount)
+            self.player.add_coins(coins_amount) 
+            self.settings.sounds["mort_enemy"].play()  
+            
+            self._check_for_level_up()
 
-                if projectile in self.projectiles:
-                    self.projectiles.remove(projectile)
-                break
+        projectiles.lifetime[i] = 0  # Consommé, retiré en fin de frame
     
     def _check_melee_collision(self, enemy):
         """Vérifie les collisions en mêlée entre ennemi et joueur"""
         distance = ((enemy.x - self.player.x)**2 + (enemy.y - self.player.y)**2)**0.5
         if distance < enemy.radius + self.player.size:
-            if self.player.take_damage(enemy.damage):
-                self._handle_player_death()
+            self._damage_player(enemy.damage, enemy.type)
             
             # Recul
             dx = enemy.x - self.player.x
@@ -308,8 +421,9 @@ class GameScene(BaseScene):
         if distance_to_root < enemy.root.radius + projectile.radius:
             if enemy.root.take_damage(projectile.damage):
                 # Si le cœur est détruit
-                self.enemies.remove(enemy)
+                self.enemies.kill(enemy.handle)
                 self.wave_manager.on_enemy_died(enemy)
+                self.combat_log.on_kill(enemy, self.tick_count)
                 self.player.add_score(200)  # Gros score pour le boss
                 self._check_for_level_up()
             return True
@@ -317,6 +431,24 @@ class GameScene(BaseScene):
         # Vérifier récursivement les collisions avec les nœuds enfants
         return self._check_boss_node_collisions(enemy.root, projectile)
 
+    def _query_boss_tree(self, root):
+        """Index des projectiles proches d'un nœud actif de l'arbre, sans doublon, dans l'ordre de première rencontre"""
+        found = []
+        self._collect_boss_tree(root, found)
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        # Dédoublonnage en une passe : un projectile proche de plusieurs nœuds n'est gardé qu'une fois
+        indices, first = np.unique(np.concatenate(found), return_index=True)
+        return indices[np.argsort(first)]
+
+    def _collect_boss_tree(self, node, found):
+        """Ajoute à found les index candidats de la grille pour ce nœud et ses enfants actifs"""
+        if not node.active:
+            return
+        found.append(self.projectile_grid.query_indices(node.x, node.y, node.radius))
+        for child in node.children:
+            self._collect_boss_tree(child, found)
+
     def _check_boss_node_collisions(self, node, projectile, nodes_to_remove=None):
         """Vérifie récursivement les collisions avec les nœuds de l'arbre"""
         if nodes_to_remove is None:
@@ -346,10 +478,8 @@ class GameScene(BaseScene):
         
         if enemy.is_exploding and enemy.explosion_timer <= 0:
             if distance_to_player < enemy.explosion_radius:
-                if self.player.take_damage(enemy.damage):
-                    self._handle_player_death()
-            if enemy in self.enemies:
-                self.enemies.remove(enemy)
+                self._damage_player(enemy.damage, enemy.type)
+            self.enemies.kill(enemy.handle)
             self.wave_manager.on_enemy_died(enemy)
             self.player.add_score(15)
             self._check_for_level_up()
@@ -365,16 +495,20 @@ class GameScene(BaseScene):
             
             if pending['timer'] <= 0:
                 # Créer la flaque de feu
-                self.fire_zones.append(FireZone(pending['x'], pending['y'], self.settings))
+                self.fire_zones.append(FireZone(pending['x'], pending['y'], self.settings, self.fire_effects))
                 self.pending_fire_zones.remove(pending)
         
         # Mise à jour des zones de feu et dégâts au joueur
         for fire_zone in self.fire_zones[:]:
             if not fire_zone.update():
+                fire_zone.release_particles()
                 self.fire_zones.remove(fire_zone)
             else:
                 # Vérifie les dégâts au joueur
+                health = self.player.health
                 fire_zone.check_damage(self.player)
+                self.combat_log.on_damage("feu", health - self.player.health)
+        self.fire_effects.update(self.fire_zones)
         # vérifie si le joueur est mort
         if self.player.health <= 0:
             self._handle_player_death()
@@ -388,19 +522,31 @@ class GameScene(BaseScene):
 
             self.transition.start(self.next_floor)
     
+    def _damage_player(self, amount, source):
+        """Inflige des dégâts au joueur en notant leur source"""
+        health = self.player.health
+        died = self.player.take_damage(amount)
+        self.combat_log.on_damage(source, health - self.player.health)
+        if died:
+            self._handle_player_death()
+    
     def _handle_player_death(self):
         """Gère la mort du joueur"""
+        self.combat_log.on_death()
         self.game_stats.update(self.player, self.weapon)
         self.game.game_stats = self.game_stats.stats
         
         self.current_floor = 1
         
         self.game.change_scene(self.settings.SCENE_GAME_OVER)
-        pygame.mixer.music.stop()
+        if not self.settings.headless:
+            pygame.mixer.music.stop()
         self.settings.sounds["game_over"].play()
 
     def _handle_perks_menu_selection(self, perk_index):
         """Gère la sélection d'un perk dans le menu"""
+        if self.recorder is not None:
+            self.recorder.record_perk(perk_index)
         if perk_index < len(self.perks_sub_scene.perks_list):
             perk = self.perks_sub_scene.perks_list[perk_index]
             self.perks_sub_scene.perks_manager.choose_perk(perk)
@@ -431,7 +577,7 @@ class GameScene(BaseScene):
         elif effect.enemy_type == "destructeur":
             return Destructeur(effect.x, effect.y, self.settings)
         elif effect.enemy_type == "pyromane":
-            return Pyromane(effect.x, effect.y, self.settings)
+            return Pyromane(effect.x, effect.y, self.settings, self.rng)
         elif effect.enemy_type == "boss":
             # Récupérer la seed du boss depuis les données de vague
             if hasattr(effect, 'boss_data'):
@@ -443,7 +589,8 @@ class GameScene(BaseScene):
                 effect.x, effect.y,
                 self.settings,
                 self.current_floor,
-                boss_seed
+                boss_seed,
+                emissions=self.emissions
             )
         else:
             return Basic(effect.x, effect.y, self.settings)
@@ -459,7 +606,10 @@ class GameScene(BaseScene):
         self.enemies.clear()
         self.projectiles.clear()
         self.enemy_projectiles.clear()
+        self.emissions.clear()
         self.spawn_effects.clear()
+        for fire_zone in self.fire_zones:
+            fire_zone.release_particles()
         self.fire_zones.clear()
         self.pending_fire_zones.clear()
         
@@ -477,6 +627,9 @@ class GameScene(BaseScene):
         """
         Dessine le jeu sur l'écran
         """
+        profiler = self.game.profiler
+        probe = profiler.start()
+
         # image de fond
         
         screen.blit(self.fond, (0, 0))
@@ -488,23 +641,24 @@ class GameScene(BaseScene):
         
         # Dessine les prévisualisations de flammes
         self._draw_fire_previews(screen)
+        probe = profiler.lap("draw/background", probe)
         
         # Dessine les projectiles
-        for projectile in self.projectiles:
-            projectile.draw(screen)
-        for projectile in self.enemy_projectiles:
-            projectile.draw(screen)
+        self.projectile_renderer.draw(screen, (self.projectiles, self.enemy_projectiles))
+        probe = profiler.lap("draw/projectiles", probe)
 
         # Dessine les zones de feu
-        for fire_zone in self.fire_zones:
-            fire_zone.draw(screen)
+        self.fire_effects.draw(screen, self.fire_zones)
+        probe = profiler.lap("draw/fire_zones", probe)
         
         # Dessine les ennemis
         for enemy in self.enemies:
             enemy.draw(screen)
+        probe = profiler.lap("draw/enemies", probe)
         
         # Dessine le joueur
         self.player.draw(screen)
+        probe = profiler.lap("draw/player", probe)
         
         # Dessine le HUD
         self.hud.draw(screen)
@@ -515,43 +669,51 @@ class GameScene(BaseScene):
         # Dessine le menu de pause
         if self.game_paused:
             self.current_sub_scene.draw(screen)
+        profiler.lap("draw/hud", probe)
+
+        if profiler.enabled:
+            profiler.counts = self.entity_counts()
+    
+    def entity_counts(self):
+        """Nombre d'entités actives (pour le profileur)"""
+        particles = len(self.player.dash_trail_particles) + len(self.player.dash_afterimages) + len(self.fire_effects)
+        return {
+            "proj": len(self.projectiles),
+            "proj_enn": len(self.enemy_projectiles),
+            "ennemis": len(self.enemies),
+            "feux": len(self.fire_zones),
+            "particules": particles
+        }
     
     def _draw_fire_previews(self, screen):
         """Dessine les prévisualisations des zones de feu"""
         for pending in self.pending_fire_zones:
-            preview_surface = pygame.Surface((100, 100), pygame.SRCALPHA)
             preview_radius = 40
             
             # Cercle extérieur pulsant
             pulse = 5 * math.sin(pygame.time.get_ticks() * 0.005)
             outer_radius = preview_radius + pulse
             
-            # Alpha basé sur le temps restant (max 45 frames)
+            # Alpha basé sur le temps restant (max 45 ticks)
             progress = min(pending['timer'], 45) / 45.0
             alpha = int(180 * progress)
             
             # Cercle extérieur (orange transparent)
-            pygame.draw.circle(preview_surface, (255, 150, 0, alpha), 
-                              (50, 50), outer_radius, 3)
+            circle_cache.blit(screen, pending['x'], pending['y'], outer_radius, (255, 150, 0), alpha, 3)
             
             # Cercle intérieur (rouge plus transparent)
             inner_alpha = max(0, alpha - 60)
-            pygame.draw.circle(preview_surface, (255, 50, 0, inner_alpha), 
-                              (50, 50), preview_radius // 2)
+            circle_cache.blit(screen, pending['x'], pending['y'], preview_radius // 2, (255, 50, 0), inner_alpha)
             
             # Effet "onde concentrique"
             wave_progress = 1.0 - (min(pending['timer'], 45) / 45)
             wave_radius = int(preview_radius * wave_progress)
-            pygame.draw.circle(preview_surface, (255, 200, 100, int(alpha * 0.3)), 
-                              (50, 50), wave_radius, 2)
-            
-            # Appliquer la surface
-            screen.blit(preview_surface, (pending['x'] - 50, pending['y'] - 50))
+            circle_cache.blit(screen, pending['x'], pending['y'], wave_radius, (255, 200, 100), int(alpha * 0.3), 2)
             
             # Texte de compte à rebours
             if pending['timer'] > 0:
                 time_left = pending['timer'] / 60  # Convertir en secondes
-                countdown_text = self.settings.font["h3"].render(f"{time_left:.1f}s", True, (255, 255, 255))
+                countdown_text = text_cache.render(self.settings.font["h3"], f"{time_left:.1f}s", True, (255, 255, 255))
                 screen.blit(countdown_text, (pending['x'] - 15, pending['y'] - 60))
 
     def resize(self):
@@ -559,7 +721,9 @@ class GameScene(BaseScene):
         Appelé lorsque la fenêtre change de taille
         Recalcule les positions des éléments
         """
-        self.fond = pygame.transform.scale(self.fond, (self.settings.screen_width, self.settings.screen_height))
+        if self.recorder is not None:
+            self.recorder.record_resize(self.settings.screen_width, self.settings.screen_height)
+        self.fond = assets.scaled(r"assets/images/background/game_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
         
         if self.game_paused:
             self.current_sub_scene.resize()
\ No newline at end of file
@@ -1,6 +1,8 @@
 # src/scenes/menu_scene.py
 import pygame
+from src.utils.assets import assets
 from .base_scene import BaseScene
+from src.utils.text_cache import text_cache
 
 class MenuScene(BaseScene):
     def __init__(self, game, settings):
@@ -18,27 +20,24 @@ class MenuScene(BaseScene):
         self.reset_button = pygame.Rect(0, self.settings.screen_height - 50, 200, 50)
 
         self.volume_plus = pygame.Rect(self.settings.screen_width - 50, 0, 50, 50)
-        self.plus_bouton = pygame.image.load("assets/images/son_plus.png").convert_alpha()
-        self.plus_bouton = pygame.transform.scale(self.plus_bouton, (50, 50)) 
+        self.plus_bouton = assets.scaled("assets/images/son_plus.png", (50, 50)) 
         self.volume_moins = pygame.Rect(self.settings.screen_width - 190, 0, 50, 50)
-        self.moins_bouton = pygame.image.load("assets/images/son_moins.png").convert_alpha()
-        self.moins_bouton = pygame.transform.scale(self.moins_bouton, (50, 50))
+        self.moins_bouton = assets.scaled("assets/images/son_moins.png", (50, 50))
         self.val_volume = pygame.Rect(self.settings.screen_width - 120, 0, 50, 50)
 
-        self.txt_val_volume = self.settings.font["h2"].render(str(int(self.settings.master_volume*100)), True, (0, 0, 0))
+        self.txt_val_volume = text_cache.render(self.settings.font["h2"], str(int(self.settings.master_volume*100)), True, (0, 0, 0))
         self.txt_vel_volume_rect = self.txt_val_volume.get_rect(center=self.val_volume.center)
 
         # Charger l'image de fond
-        self.bg_image = pygame.image.load("assets/images/background/menu_scene.png")
-        self.bg_image = pygame.transform.scale(self.bg_image, (self.settings.screen_width, self.settings.screen_height))
+        self.bg_image = assets.scaled("assets/images/background/menu_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
 
-        self.text = self.settings.font["main_menu"].render("JOUER", True, (255, 200, 0))
+        self.text = text_cache.render(self.settings.font["main_menu"], "JOUER", True, (255, 200, 0))
         self.button_rect = self.text.get_rect(center=self.play_button.center)
 
-        self.text_talents = self.settings.font["h1"].render("Talents", True, (0, 0, 255))
+        self.text_talents = text_cache.render(self.settings.font["h1"], "Talents", True, (0, 0, 255))
         self.talents_button = self.text_talents.get_rect(center=self.talents_button.center)
 
-        self.text_reset = self.settings.font["h2"].render("Réinitialisation", True, (111, 6, 6))
+        self.text_reset = text_cache.render(self.settings.font["h2"], "Réinitialisation", True, (111, 6, 6))
         self.reset_button = self.text_reset.get_rect(center=self.reset_button.center)
 
     def handle_event(self, event):
@@ -54,7 +53,7 @@ class MenuScene(BaseScene):
                 self.player_data = self.game.reset_player_data()
                 self.settings.sounds["game_over"].play()
                 # Actualise le son car il est aussi reset
-                self.txt_val_volume = self.settings.font["h2"].render(str(int(self.settings.master_volume*100)), True, (0, 0, 0))
+                self.txt_val_volume = text_cache.render(self.settings.font["h2"], str(int(self.settings.master_volume*100)), True, (0, 0, 0))
                 self.txt_vel_volume_rect = self.txt_val_volume.get_rect(center=self.val_volume.center)
 
             elif self.volume_plus.move(self.settings.x0, self.settings.y0).collidepoint(event.pos):
@@ -89,7 +88,7 @@ class MenuScene(BaseScene):
         else:
             self.settings.update_master_volume(val*0.01)
 
-        self.txt_val_volume = self.settings.font["h2"].render(str(int(self.settings.master_volume*100)), True, (0, 0, 0))
+        self.txt_val_volume = text_cache.render(self.settings.font["h2"], str(int(self.settings.master_volume*100)), True, (0, 0, 0))
         self.txt_vel_volume_rect = self.txt_val_volume.get_rect(center=self.val_volume.center)
 
     def update(self):
@@ -98,54 +97,50 @@ class MenuScene(BaseScene):
         """
         
         if self.button_rect.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.text = self.settings.font["main_menu"].render("JOUER", True, (255, 200, 0))
+            self.text = text_cache.render(self.settings.font["main_menu"], "JOUER", True, (255, 200, 0))
             if not hasattr(self, 'exit_hovered') or not self.exit_hovered: 
                 self.exit_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.text = self.settings.font["main_menu"].render("JOUER", True, (255, 255, 255))
+            self.text = text_cache.render(self.settings.font["main_menu"], "JOUER", True, (255, 255, 255))
             self.exit_hovered = False
 
         if self.talents_button.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.text_talents = self.settings.font["h1"].render("Talents", True, (0, 0, 255))
+            self.text_talents = text_cache.render(self.settings.font["h1"], "Talents", True, (0, 0, 255))
             if not hasattr(self, 'talents_hovered') or not self.talents_hovered:
                 self.talents_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.text_talents = self.settings.font["h1"].render("Talents", True, (0, 0, 100))
+            self.text_talents = text_cache.render(self.settings.font["h1"], "Talents", True, (0, 0, 100))
             self.talents_hovered = False
 
         if self.reset_button.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.text_reset = self.settings.font["h2"].render("Réinitialisation", True, (198, 12, 12))
+            self.text_reset = text_cache.render(self.settings.font["h2"], "Réinitialisation", True, (198, 12, 12))
             if not hasattr(self, 'reset_hovered') or not self.reset_hovered:
                 self.reset_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.text_reset = self.settings.font["h2"].render("Réinitialisation", True, (111, 6, 6))
+            self.text_reset = text_cache.render(self.settings.font["h2"], "Réinitialisation", True, (111, 6, 6))
             self.reset_hovered = False
 
         if self.volume_plus.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
             #change la couleur du rectangle
-            self.plus_bouton = pygame.image.load("assets/images/son_plus_hover.png").convert_alpha()
-            self.plus_bouton = pygame.transform.scale(self.plus_bouton, (50, 50))
+            self.plus_bouton = assets.scaled("assets/images/son_plus_hover.png", (50, 50))
             if not hasattr(self, 'volume_hovered') or not self.volume_hovered:
                 self.volume_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
             self.volume_hovered = False
-            self.plus_bouton = pygame.image.load("assets/images/son_plus.png").convert_alpha()
-            self.plus_bouton = pygame.transform.scale(self.plus_bouton, (50, 50))
+            self.plus_bouton = assets.scaled("assets/images/son_plus.png", (50, 50))
         
         if self.volume_moins.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.moins_bouton = pygame.image.load("assets/images/son_moins_hover.png").convert_alpha()
-            self.moins_bouton = pygame.transform.scale(self.moins_bouton, (50, 50))
+            self.moins_bouton = assets.scaled("assets/images/son_moins_hover.png", (50, 50))
             if not hasattr(self, 'volume_moins_hovered') or not self.volume_moins_hovered:
                 self.volume_moins_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
             self.volume_moins_hovered = False
-            self.moins_bouton = pygame.image.load("assets/images/son_moins.png").convert_alpha()
-            self.moins_bouton = pygame.transform.scale(self.moins_bouton, (50, 50))
+            self.moins_bouton = assets.scaled("assets/images/son_moins.png", (50, 50))
         
 
     def draw(self, screen):
@@ -181,7 +176,7 @@ class MenuScene(BaseScene):
         self.play_button.update(self.settings.screen_width//2-100, self.settings.screen_height//2-20, 200, 50)
         self.talents_button.update(self.settings.screen_width-200, self.settings.screen_height - 50, 200, 50)
         self.reset_button.update(0, self.settings.screen_height - 50, 200, 50)
-        self.bg_image = pygame.transform.scale(self.bg_image, (self.settings.screen_width, self.settings.screen_height))
+        self.bg_image = assets.scaled("assets/images/background/menu_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
         self.button_rect = self.text.get_rect(center=self.play_button.center)
         self.talents_button = self.text_talents.get_rect(center=self.talents_button.center)
         self.reset_button = self.text_reset.get_rect(center=self.reset_button.center)
@@ -1,7 +1,9 @@
 # src/scenes/sub_scenes/pause_sub_scene.py
 import pygame
+from src.utils.assets import assets
 from .base_sub_scene import BaseSubScene
 from src.ui.pause_ui import PauseUI
+from src.utils.text_cache import text_cache
 
 class PauseSubScene(BaseSubScene):
     """Gère le Menu Pause"""
@@ -13,23 +15,20 @@ class PauseSubScene(BaseSubScene):
         """Appelée quand la scène devient active"""
         super().on_enter()
         self.ui = PauseUI(game_stats, self.settings)
-        self.exit_text = self.settings.font["h3"].render("Continuer", True, (255, 0, 0))
-        self.exit_rect = pygame.image.load(r"assets/images/cadre.png")
-        self.exit_rect = pygame.transform.scale(self.exit_rect, (200, 50))
+        self.exit_text = text_cache.render(self.settings.font["h3"], "Continuer", True, (255, 0, 0))
+        self.exit_rect = assets.scaled(r"assets/images/cadre.png", (200, 50))
         self.exit_rect = self.exit_rect.get_rect(center=(self.settings.screen_width//2, self.settings.screen_height//2 - 37.5))
         self.exit_text_rect = self.exit_text.get_rect(center=self.exit_rect.center)
         
         # Bouton Quitter au menu principal
-        self.back_to_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 0, 0))
-        self.back_to_menu_rect = pygame.image.load(r"assets/images/cadre.png")
-        self.back_to_menu_rect = pygame.transform.scale(self.back_to_menu_rect, (200, 50))
+        self.back_to_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 0, 0))
+        self.back_to_menu_rect = assets.scaled(r"assets/images/cadre.png", (200, 50))
         self.back_to_menu_rect = self.back_to_menu_rect.get_rect(center=(self.settings.screen_width//2, self.settings.screen_height//2 + 37.5))
         self.back_to_menu_text_rect = self.back_to_menu_text.get_rect(center=self.back_to_menu_rect.center)
         
         # Bouton Stats
-        self.stat_text = self.settings.font["h3"].render("Statistiques", True, (255, 0, 0))
-        self.stat_rect = pygame.image.load(r"assets/images/cadre.png")
-        self.stat_rect = pygame.transform.scale(self.stat_rect, (200, 50))
+        self.stat_text = text_cache.render(self.settings.font["h3"], "Statistiques", True, (255, 0, 0))
+        self.stat_rect = assets.scaled(r"assets/images/cadre.png", (200, 50))
         self.stat_rect = self.stat_rect.get_rect(center=(self.settings.screen_width//2, self.settings.screen_height//2 + 37.5*3))
         self.stat_text_rect = self.stat_text.get_rect(center=self.stat_rect.center)
 
@@ -51,33 +50,33 @@ class PauseSubScene(BaseSubScene):
     def update(self):
         """Met à jour la logique de la scène"""
         if self.exit_rect.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.exit_text = self.settings.font["h3"].render("Continuer", True, (255, 255, 255))
+            self.exit_text = text_cache.render(self.settings.font["h3"], "Continuer", True, (255, 255, 255))
             # Met un son uniquement la premiere fois que le curseur passe dessus
             if not hasattr(self, 'exit_hovered') or not self.exit_hovered:
                 self.exit_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.exit_text = self.settings.font["h3"].render("Continuer", True, (255, 0, 0))
+            self.exit_text = text_cache.render(self.settings.font["h3"], "Continuer", True, (255, 0, 0))
             self.exit_hovered = False
 
         if self.back_to_menu_rect.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.back_to_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 255, 255))
+            self.back_to_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 255, 255))
             # Pareille ici
             if not hasattr(self, 'exit_hovered1') or not self.exit_hovered1:
                 self.exit_hovered1 = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.back_to_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 0, 0))
+            self.back_to_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 0, 0))
             self.exit_hovered1 = False
 
         if self.stat_rect.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.stat_text = self.settings.font["h3"].render("Statistiques", True, (255, 255, 255))
+            self.stat_text = text_cache.render(self.settings.font["h3"], "Statistiques", True, (255, 255, 255))
             # Et ici aussi
             if not hasattr(self, 'stat_hovered') or not self.stat_hovered:
                 self.stat_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.stat_text = self.settings.font["h3"].render("Statistiques", True, (255, 0, 0))
+            self.stat_text = text_cache.render(self.settings.font["h3"], "Statistiques", True, (255, 0, 0))
             self.stat_hovered = False
 
     def draw(self, screen):
@@ -20,8 +20,9 @@ class PerksSubScene(BaseSubScene):
     def on_enter(self):
         """Appelée quand la scène devient active"""
         super().on_enter()
-        self.ui = PerksUI(self.settings)
-        self.perks_manager = PerksManager(self.settings, self.player, self.weapon)
+        if not self.settings.headless:  # Pas d'interface sans fenêtre
+            self.ui = PerksUI(self.settings)
+        self.perks_manager = PerksManager(self.settings, self.player, self.weapon, self.game_scene.rng)
         self.perks_list = self.perks_manager.get_perks()
         
         # Calculer les rectangles une seule fois ici
@@ -106,8 +107,8 @@ class PerksSubScene(BaseSubScene):
             # Vérifier chaque bouton (Je sais pas trop pourquoi, il y avait un bug ou je pouvais pas cliquer dessus)
             for i, (_, _, union_rect) in enumerate(self.perks_rect):
                 if union_rect.collidepoint(mouse_x, mouse_y):
-                    self.perks_manager.choose_perk(self.perks_list[i])
-                    self.on_exit()
+                    # Passe par la scène de jeu (le choix est enregistré dans le replay)
+                    self.game_scene._handle_perks_menu_selection(i)
                     return 
                 
     def update(self):
@@ -1,7 +1,9 @@
 # src/scenes/sub_scenes/pause_sub_scene.py
 import pygame
+from src.utils.assets import assets
 from .base_sub_scene import BaseSubScene
 from src.ui.stat_ui import StatUI
+from src.utils.text_cache import text_cache
 
 class StatSubScene(BaseSubScene):
     """Gère le Menu Stats"""
@@ -16,9 +18,8 @@ class StatSubScene(BaseSubScene):
 
         # Met un fond d'écran au menu Stats
 
-        self.back_to_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 0, 0))
-        self.back_to_menu_rect = pygame.image.load(r"assets/images/cadre.png")
-        self.back_to_menu_rect = pygame.transform.scale(self.back_to_menu_rect, (200, 50))
+        self.back_to_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 0, 0))
+        self.back_to_menu_rect = assets.scaled(r"assets/images/cadre.png", (200, 50))
         self.back_to_menu_rect = self.back_to_menu_rect.get_rect(center=(self.settings.screen_width//2, self.settings.screen_height//2 +200))
         self.back_to_menu_text_rect = self.back_to_menu_text.get_rect(center=self.back_to_menu_rect.center)
         
@@ -36,13 +37,13 @@ class StatSubScene(BaseSubScene):
     def update(self):
         """Met à jour la logique de la scène"""
         if self.back_to_menu_rect.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.back_to_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 255, 255))
+            self.back_to_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 255, 255))
             # Met un son uniquement la premiere fois que le curseur passe dessus
             if not hasattr(self, 'exit_hovered1') or not self.exit_hovered1:
                 self.exit_hovered1 = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.back_to_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 0, 0))
+            self.back_to_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 0, 0))
             self.exit_hovered1 = False
 
     def draw(self, screen):
@@ -1,6 +1,6 @@
 # src/scenes/sub_scenes/tuto_sub_scene.py
 
-import pygame
+from src.utils.assets import assets
 from .base_sub_scene import BaseSubScene
 
 class TutoSubScene(BaseSubScene):
@@ -13,8 +13,7 @@ class TutoSubScene(BaseSubScene):
         """Appelée quand la scène devient active"""
         super().on_enter()
         
-        self.bg_img = pygame.image.load(r"assets/images/tuto.png")
-        self.bg_img = pygame.transform.scale(self.bg_img, (self.settings.screen_width, self.settings.screen_height))
+        self.bg_img = assets.scaled(r"assets/images/tuto.png", (self.settings.screen_width, self.settings.screen_height))
 
     def on_exit(self):
         """Appelée quand la scène n'est plus active"""
@@ -38,4 +37,4 @@ class TutoSubScene(BaseSubScene):
         Appelé lorsque la fenêtre change de taille
         Recalcule les positions des éléments
         """
-        self.bg_img = pygame.transform.scale(self.bg_img, (self.settings.screen_width, self.settings.screen_height))
\ No newline at end of file
+        self.bg_img = assets.scaled(r"assets/images/tuto.png", (self.settings.screen_width, self.settings.screen_height))
\ No newline at end of file
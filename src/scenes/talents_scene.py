@@ -1,7 +1,9 @@
 # src/scenes/talents_scene.py
 import pygame
+from src.utils.assets import assets
 from .base_scene import BaseScene
 from src.perks.talents import Talents
+from src.utils.text_cache import text_cache
 
 class TalentsScene(BaseScene):
     def __init__(self, game, settings):
@@ -12,53 +14,53 @@ class TalentsScene(BaseScene):
         self.player_data = player_data
         self.talents = Talents(self.game, self.settings, player_data)
         # Rect pour quiter le menu
-        self.exit_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 0, 0))
-        self.cadre = pygame.image.load(r"assets\images\cadre.png")
+        self.exit_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 0, 0))
+        self.cadre = r"assets\images\cadre.png"
         self.exit_menu_rect = pygame.Rect(self.settings.screen_width - 210, 50, 200, 50)
-        self.quit_button_img = pygame.transform.scale(self.cadre, (self.exit_menu_rect.width, self.exit_menu_rect.height))
+        self.quit_button_img = assets.scaled(self.cadre, (self.exit_menu_rect.width, self.exit_menu_rect.height))
         self.exit_menu_text_rect = self.exit_menu_text.get_rect(center=self.exit_menu_rect.center)
         
         self.talent_dict = {
             "max_health":{
-                "img":pygame.image.load(r"assets\images\perks_icons\Heal_icon.png"),
+                "path":r"assets\images\perks_icons\Heal_icon.png",
                 "val_min":100
                 },
-            "regen_power":{"img":pygame.image.load(r"assets\images\perks_icons\Regen_icon.png"),
+            "regen_power":{"path":r"assets\images\perks_icons\Regen_icon.png",
                 "val_min":0.1,
                 "val_max":1.0
                 },
-            "player_speed":{"img":pygame.image.load(r"assets\images\perks_icons\Speed_Icon.png"),
+            "player_speed":{"path":r"assets\images\perks_icons\Speed_Icon.png",
                 "val_min":5,
                 "val_max":20
                 },
-            "player_size":{"img":pygame.image.load(r"assets\images\perks_icons\Player_size_up_icon.png"),
+            "player_size":{"path":r"assets\images\perks_icons\Player_size_up_icon.png",
                 "val_min":5,
                 "val_max":20
                 },
-            "dash_cooldown":{"img":pygame.image.load(r"assets\images\perks_icons\dash_cooldown_icon.png"),
+            "dash_cooldown":{"path":r"assets\images\perks_icons\dash_cooldown_icon.png",
                 "val_min":30,
                 "val_max":180
                 },
-            "dash_distance":{"img":pygame.image.load(r"assets\images\perks_icons\dash_distance_icon.png"),
+            "dash_distance":{"path":r"assets\images\perks_icons\dash_distance_icon.png",
                 "val_min":4,
                 "val_max":10
                 },
-            "attack_damages":{"img":pygame.image.load(r"assets\images\perks_icons\Attack_icon.png"),
+            "attack_damages":{"path":r"assets\images\perks_icons\Attack_icon.png",
                 "val_min":20
                 },
-            "attack_speed":{"img":pygame.image.load(r"assets\images\perks_icons\Attack_speed_icon.png"),
+            "attack_speed":{"path":r"assets\images\perks_icons\Attack_speed_icon.png",
                 "val_min":2,
                 "val_max":10
                 },
-            "stationary_threshold":{"img":pygame.image.load(r"assets\images\perks_icons\stationnary_threshold_icon.png"),
+            "stationary_threshold":{"path":r"assets\images\perks_icons\stationnary_threshold_icon.png",
                 "val_min":15,
                 "val_max":30
                 },
-            "projectile_size":{"img":pygame.image.load(r"assets\images\perks_icons\Projectile_size_up_icon.png"),
+            "projectile_size":{"path":r"assets\images\perks_icons\Projectile_size_up_icon.png",
                 "val_min":5,
                 "val_max":20
                 },
-            "projectile_speed":{"img":pygame.image.load(r"assets\images\perks_icons\Projectile_speed_icon.png"),
+            "projectile_speed":{"path":r"assets\images\perks_icons\Projectile_speed_icon.png",
                 "val_min":10,
                 "val_max":20
                 }
@@ -69,7 +71,7 @@ class TalentsScene(BaseScene):
         i = 0
         for key in list(self.talent_dict.keys()):
             self.talent_dict[key]["rect"] = base_talent_rect.move(self.settings.screen_width*5//32 * (i%4), self.settings.screen_width*3//16 * (i//4))
-            self.talent_dict[key]["img"] = pygame.transform.scale(self.talent_dict[key]["img"], base_talent_rect.size)
+            self.talent_dict[key]["img"] = assets.scaled(self.talent_dict[key]["path"], base_talent_rect.size)
             
             # définit le text
             self.talent_dict[key]["txt"] = []
@@ -88,14 +90,13 @@ class TalentsScene(BaseScene):
             self.talent_dict[key]["txt"].append(current_line)
             self.talent_dict[key]["total_rect"] = self.talent_dict[key]["rect"]
             self.talent_dict[key]["total_rect"].inflate_ip(5, 55)
-            self.talent_cadre = pygame.transform.scale(self.cadre, self.talent_dict[key]["total_rect"].size)
+            self.talent_cadre = assets.scaled(self.cadre, self.talent_dict[key]["total_rect"].size)
             i += 1
 
         self.stats_rect = pygame.Rect(self.settings.screen_width*2//3, self.settings.screen_height//4, self.settings.screen_width//3, self.settings.screen_height//2+100)
         
         # Charger l'image de fond
-        bg_img = pygame.image.load("assets/images/background/talents_scene.png")
-        self.bg_image = pygame.transform.scale(bg_img, (self.settings.screen_width, self.settings.screen_height))
+        self.bg_image = assets.scaled("assets/images/background/talents_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
 
     def handle_event(self, event):
         """Gère les clics de souris et touches"""
@@ -124,12 +125,12 @@ class TalentsScene(BaseScene):
     def update(self):
         """Met à jour la logique de la scène"""
         if self.exit_menu_rect.move(self.settings.x0, self.settings.y0).collidepoint(pygame.mouse.get_pos()):
-            self.exit_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 255, 255))
+            self.exit_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 255, 255))
             if not hasattr(self, 'exit_hovered') or not self.exit_hovered:
                 self.exit_hovered = True
                 self.settings.sounds["souris_on_button"].play()
         else:
-            self.exit_menu_text = self.settings.font["h3"].render("Quitter", True, (255, 0, 0))
+            self.exit_menu_text = text_cache.render(self.settings.font["h3"], "Quitter", True, (255, 0, 0))
             self.exit_hovered = False
 
     def draw(self, screen):
@@ -149,17 +150,17 @@ class TalentsScene(BaseScene):
             screen.blit(self.talent_dict[key]["img"], self.talent_dict[key]["rect"].topleft)
             # Affiche le texte
             for i, line in enumerate(self.talent_dict[key]["txt"]):
-                text_surface = self.settings.font["h3"].render(line, True, (255, 255, 255))
+                text_surface = text_cache.render(self.settings.font["h3"], line, True, (255, 255, 255))
                 txt_rect = text_surface.get_rect(midtop=(self.talent_dict[key]["rect"].center[0], self.talent_dict[key]["rect"].center[1] + i * 25 + 25))
                 
                 screen.blit(text_surface, txt_rect)
 
         # Affiche les stats
-        stats_img = pygame.transform.scale(self.cadre, (self.stats_rect.width, self.stats_rect.height))
+        stats_img = assets.scaled(self.cadre, (self.stats_rect.width, self.stats_rect.height))
         screen.blit(stats_img, self.stats_rect)
 
         for i, key in enumerate(self.player_data.keys()):
-            txt = self.settings.font["h4"].render(f"{self.settings.data_translation_map.get(key, key)}: {self.player_data[key]}", True, (255, 255, 255))
+            txt = text_cache.render(self.settings.font["h4"], f"{self.settings.data_translation_map.get(key, key)}: {self.player_data[key]}", True, (255, 255, 255))
             rect = txt.get_rect(midtop = (self.stats_rect.midtop)).move(0, 25 + 20*i)
             screen.blit(txt, rect)
     
@@ -168,9 +169,9 @@ class TalentsScene(BaseScene):
         Appelé lorsque la fenêtre change de taille
         Recalcule les positions et la taille des éléments
         """
-        self.bg_image = pygame.transform.scale(self.bg_image, (self.settings.screen_width, self.settings.screen_height))
+        self.bg_image = assets.scaled("assets/images/background/talents_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
         self.exit_menu_rect.update(self.settings.screen_width - 210, 50, 200, 50)
-        self.quit_button_img = pygame.transform.scale(self.cadre, (self.exit_menu_rect.width, self.exit_menu_rect.height))
+        self.quit_button_img = assets.scaled(self.cadre, (self.exit_menu_rect.width, self.exit_menu_rect.height))
         self.exit_menu_text_rect.center = self.exit_menu_rect.center
 
         # On recalcule la position de tout les talents
@@ -183,7 +184,7 @@ class TalentsScene(BaseScene):
                 self.settings.screen_width//8
                 )
             # Redimensionne l'image
-            self.talent_dict[key]["img"] = pygame.transform.scale(self.talent_dict[key]["img"], self.talent_dict[key]["rect"].size)
+            self.talent_dict[key]["img"] = assets.scaled(self.talent_dict[key]["path"], self.talent_dict[key]["rect"].size)
             # définit le texte
             self.talent_dict[key]["txt"] = []
             self.talent_dict[key]["txt_rect"] = []
@@ -203,7 +204,7 @@ class TalentsScene(BaseScene):
             self.talent_dict[key]["total_rect"].inflate_ip(5, 55)
             # Redimensionne le cadre
             if i == 0:
-                self.talent_cadre = pygame.transform.scale(self.cadre, self.talent_dict[key]["total_rect"].size)
+                self.talent_cadre = assets.scaled(self.cadre, self.talent_dict[key]["total_rect"].size)
             i += 1
 
         self.stats_rect.update(self.settings.screen_width*2//3, self.settings.screen_height//4, self.settings.screen_width//3, self.settings.screen_height//2+100)
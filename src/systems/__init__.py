@@ -1,9 +1,36 @@
 # src/systems/__init__.py
 
+from .ai_scheduler import AIScheduler
+from .autopilot import Autopilot
+from .combat_log import CombatLog
+from .emission_scheduler import EmissionScheduler
+from .enemy_index import EnemyIndex
+from .entity_registry import EntityRegistry
+from .fixed_timestep import FixedTimestep
 from .game_stats import GameStats
+from .neighbor_grid import NeighborGrid
+from .particles import ParticleSystem
+from .profiler import FrameProfiler
+from .replay import Replay, ReplayRecorder
+from .spatial_grid import SpatialGrid
+from .steering import SteeringSystem
 from .wave_manager import WaveManager
 
 __all__ = [
+    "AIScheduler",
+    "Autopilot",
+    "CombatLog",
+    "EmissionScheduler",
+    "EnemyIndex",
+    "EntityRegistry",
+    "FixedTimestep",
     "GameStats",
+    "FrameProfiler",
+    "NeighborGrid",
+    "ParticleSystem",
+    "Replay",
+    "ReplayRecorder",
+    "SpatialGrid",
+    "SteeringSystem",
     "WaveManager"
 ]
\ No newline at end of file
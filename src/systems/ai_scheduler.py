@@ -0,0 +1,92 @@
+# src/systems/ai_scheduler.py
+import itertools
+from operator import attrgetter
+from time import perf_counter_ns
+
+# Numéro de chaque reset, unique entre tous les ordonnanceurs
+_epochs = itertools.count()
+
+
+class AIScheduler:
+    """
+    Répartit les décisions lentes des ennemis (think) sur plusieurs ticks
+    Un ennemi dont la classe a `thinks` reçoit à sa première rencontre un créneau
+    parmi `interval` (tourniquet) : il réfléchit aussitôt, puis une fois tous les
+    `interval` ticks, au tick de son créneau. Entre deux réflexions, il garde sa
+    dernière décision ; son déplacement et ses timers restent mis à jour à chaque tick.
+    Un budget (ms) borne le temps de réflexion d'un tick : au-delà, les ennemis
+    restants sont reportés et passent en premier aux ticks suivants, les plus
+    anciens reports d'abord. Au moins une réflexion a lieu par tick.
+    Le coût de think est mesuré par type d'ennemi. Un ennemi qui survit à un reset
+    est traité comme nouveau (son créneau et son report datent de l'ancienne numérotation)
+    """
+    def __init__(self, interval=4, budget_ms=None):
+        self.interval = max(1, interval)
+        self.budget_ms = budget_ms  # None : pas de budget (partie reproductible)
+        self.reset()
+
+    def reset(self):
+        """Nouvelle partie : tick, créneaux et statistiques remis à zéro"""
+        self.epoch = next(_epochs)  # Les créneaux attribués avant ce reset sont périmés
+        self.tick = 0
+        self.next_slot = 0  # Prochain créneau attribué
+        self.thinks = 0  # Réflexions au dernier tick
+        self.deferred = 0  # Ennemis reportés au dernier tick
+        self.deferrals = 0  # Reports depuis le début de la partie
+        self.costs = {}  # type -> [réflexions, durée totale (ns), durée max (ns)]
+
+    def update(self, enemies, player, fire_zones=None, pending_zones=None):
+        """Fait réfléchir les ennemis dont c'est le tour ; retourne le nombre de réflexions"""
+        phase = self.tick % self.interval
+        self.tick += 1
+        overdue = []
+        due = []
+        for enemy in enemies:
+            if not enemy.thinks:
+                continue
+            if enemy.think_epoch != self.epoch:
+                # Nouvel ennemi (ou d'avant le reset) : créneau suivant du tourniquet, première réflexion immédiate
+                enemy.think_epoch = self.epoch
+                enemy.think_slot = self.next_slot % self.interval
+                enemy.think_deferred = None
+                self.next_slot += 1
+                due.append(enemy)
+            elif enemy.think_deferred is not None:
+                overdue.append(enemy)
+            elif enemy.think_slot == phase:
+                due.append(enemy)
+        overdue.sort(key=attrgetter('think_deferred'))
+        queue = overdue + due
+
+        budget = None if self.budget_ms is None else self.budget_ms * 1_000_000
+        start = now = perf_counter_ns()
+        done = 0
+        for enemy in queue:
+            if budget is not None and done and now - start >= budget:
+                break
+            enemy.think(player, fire_zones, pending_zones)
+            enemy.think_deferred = None
+            before, now = now, perf_counter_ns()
+            cost = self.costs.get(enemy.type)
+            if cost is None:
+                self.costs[enemy.type] = [1, now - before, now - before]
+            else:
+                cost[0] += 1
+                cost[1] += now - before
+                cost[2] = max(cost[2], now - before)
+            done += 1
+
+        for enemy in queue[done:]:
+            if enemy.think_deferred is None:
+                enemy.think_deferred = self.tick
+        self.thinks = done
+        self.deferred = len(queue) - done
+        self.deferrals += self.deferred
+        return done
+
+    def stats(self):
+        """Coût de think par type d'ennemi : nombre, moyenne et max (µs)"""
+        return {
+            enemy_type: {"thinks": count, "mean_us": total / count / 1000, "max_us": peak / 1000}
+            for enemy_type, (count, total, peak) in self.costs.items()
+        }
@@ -0,0 +1,207 @@
+# src/systems/autopilot.py
+from collections import deque
+from operator import attrgetter
+from time import perf_counter_ns
+import numpy as np
+
+# Directions candidates : (dernière touche horizontale, dernière touche verticale)
+# La première est l'immobilité, qui déclenche le tir automatique de l'arme
+DIRECTIONS = (
+    (None, None),
+    ('left', None), ('right', None), (None, 'up'), (None, 'down'),
+    ('left', 'up'), ('right', 'up'), ('left', 'down'), ('right', 'down')
+)
+AXIS = {None: 0, 'left': -1, 'right': 1, 'up': -1, 'down': 1}
+
+# Ennemis à distance : leur corps ne blesse pas (seuls leurs projectiles comptent)
+RANGED_TYPES = ("shooter", "destructeur")
+
+
+def apply_direction(player, direction):
+    """Met le joueur dans l'état de touches correspondant à une direction de DIRECTIONS"""
+    horizontal, vertical = direction
+    keys = player.keys_pressed
+    keys['left'] = horizontal == 'left'
+    keys['right'] = horizontal == 'right'
+    keys['up'] = vertical == 'up'
+    keys['down'] = vertical == 'down'
+    player.last_horizontal_key = horizontal
+    player.last_vertical_key = vertical
+
+
+class Autopilot:
+    """
+    Pilote automatique du joueur (benchmarks et simulations en lot)
+    L'arme ne tire qu'après un temps d'immobilité : le bot reste immobile tant
+    qu'aucun ennemi de mêlée ne peut l'atteindre avant son prochain tir et
+    qu'aucun projectile ni zone de feu ne menace sa position. Sinon, les 8
+    directions sont notées sur un champ de danger évalué à quelques ticks
+    d'avance : projectiles ennemis (trajectoire prolongée), zones de feu actives
+    et à venir, ennemis de mêlée et bords de l'écran. Un dash est déclenché
+    quand la direction choisie n'évite pas le prochain coup.
+    Seuls les `max_projectiles` projectiles et les `max_enemies` ennemis les plus
+    proches sont évalués : le coût d'une décision est borné quel que soit le nombre
+    d'entités à l'écran, et reste déterministe (aucune adaptation selon la vitesse
+    de la machine)
+    """
+    BUDGET_US = 400  # Budget d'une décision, rapporté par python -m src.headless --autopilot --profile
+
+    def __init__(self, max_projectiles=96, max_enemies=24, horizons=(4, 10, 18), weights=(1.0, 0.6, 0.35)):
+        self.max_projectiles = max_projectiles
+        self.max_enemies = max_enemies
+        self.horizons = np.array(horizons, dtype=np.float64)  # Ticks d'anticipation
+        self.weights = np.array(weights, dtype=np.float64)  # Poids de chaque horizon
+        self.margin = 10  # Marge de sécurité autour d'un projectile (pixels)
+        self.enemy_scale = 60  # Décroissance (pixels) du danger d'un ennemi de mêlée
+        self.wall_scale = 40  # Décroissance (pixels) du danger des bords
+        self.preferred_distance = 300  # Distance visée à l'ennemi le plus proche (portée de l'arme : 500)
+        self.engage_weight = 0.5
+        self.shot_window = 20  # Ticks d'immobilité voulus après le premier tir
+        self.still_hazard_limit = 2.0  # Danger (projectiles, feu) toléré en restant immobile
+        self.switch_margin = 0.5  # Hystérésis : évite de changer de direction à chaque tick
+        self.dash_threshold = 8.0  # Danger immédiat au-delà duquel le bot tente un dash
+
+        axis = np.array([(AXIS[h], AXIS[v]) for h, v in DIRECTIONS], dtype=np.float64)
+        self.axis_x = axis[:, 0:1]  # (directions, 1) : diffusé sur les horizons
+        self.axis_y = axis[:, 1:2]
+        self.current = 0  # Index de la direction suivie
+        self.time_to_contact = float('inf')  # Ticks avant qu'un ennemi de mêlée atteigne le joueur
+        self.still_hazard = 0.0  # Danger des projectiles et du feu sur place
+        self.decision_times = deque(maxlen=600)  # Durée des dernières décisions (ns)
+        self.evaluated = (0, 0)  # (projectiles, ennemis) évalués à la dernière décision
+        self.dashes = 0
+
+    def update(self, scene):
+        """Choisit la direction du joueur pour ce tick (à appeler avant scene.update)"""
+        start = perf_counter_ns()
+        player = scene.player
+        if not player.is_dashing:
+            danger = self._danger(scene, player)
+            score = danger.sum(axis=1)
+
+            # Rester immobile si le prochain tir a le temps de partir
+            weapon = scene.weapon
+            needed = max(0, weapon.stationary_threshold - weapon.stationary_time) + self.shot_window
+            if self.time_to_contact > needed and self.still_hazard < self.still_hazard_limit:
+                self.current = 0
+            else:
+                best = 1 + int(np.argmin(score[1:]))
+                if self.current == 0 or score[best] < score[self.current] - self.switch_margin:
+                    self.current = best
+
+            # La direction choisie n'évite pas le prochain coup : dash dans la moins dangereuse
+            if danger[self.current, 0] > self.dash_threshold and player.dash_cooldown <= 0:
+                self.current = 1 + int(np.argmin(score[1:]))
+                apply_direction(player, DIRECTIONS[self.current])
+                player.activate_dash()
+                self.dashes += 1
+            else:
+                apply_direction(player, DIRECTIONS[self.current])
+        self.decision_times.append(perf_counter_ns() - start)
+
+    def _danger(self, scene, player):
+        """Danger de chaque direction à chaque horizon : tableau (directions, horizons)"""
+        settings = scene.settings
+        size = player.size
+        # Positions futures du joueur pour chaque direction (mêmes bornes que Player)
+        # La ligne 0 (immobile) est la position actuelle à tous les horizons
+        cx = np.clip(player.x + self.axis_x * player.speed * self.horizons, size, settings.screen_width - size)
+        cy = np.clip(player.y + self.axis_y * player.speed * self.horizons, size, settings.screen_height - size)
+
+        self.evaluated = (0, 0)
+        danger = self._projectile_danger(scene.enemy_projectiles, player, cx, cy)
+        danger += self._zone_danger(scene, player, cx, cy)
+        self.still_hazard = float((danger[0] * self.weights).sum())
+        danger += self._enemy_danger(scene.enemies, player, cx, cy)
+
+        # Bords : le joueur s'y fait coincer
+        wall = np.minimum(np.minimum(cx, settings.screen_width - cx), np.minimum(cy, settings.screen_height - cy))
+        danger += 2 * np.exp(-wall / self.wall_scale)
+        return danger * self.weights
+
+    def _projectile_danger(self, batch, player, cx, cy):
+        """Projectiles ennemis prolongés en ligne droite, les plus proches seulement"""
+        n = batch.count
+        if n == 0:
+            return np.zeros(cx.shape)
+        x, y = batch.x[:n], batch.y[:n]
+        if n > self.max_projectiles:
+            # Sélection en O(n) des plus proches, sans tri complet
+            distance2 = (x - player.x) ** 2 + (y - player.y) ** 2
+            nearest = np.argpartition(distance2, self.max_projectiles)[:self.max_projectiles]
+        else:
+            nearest = slice(None)
+
+        # Positions futures (horizons, projectiles)
+        t = self.horizons[:, None]
+        px = x[nearest] + batch.dx[:n][nearest] * t
+        py = y[nearest] + batch.dy[:n][nearest] * t
+        reach2 = (player.size + batch.radius[:n][nearest] + self.margin) ** 2
+        self.evaluated = (px.shape[1], self.evaluated[1])
+
+        # Danger progressif : maximal au centre du projectile, nul au-delà de la marge
+        distance2 = (cx[:, :, None] - px) ** 2 + (cy[:, :, None] - py) ** 2
+        closeness = np.clip(1 - distance2 / reach2, 0, 1)
+        return (closeness * batch.damage[:n][nearest]).sum(axis=2)
+
+    def _zone_danger(self, scene, player, cx, cy):
+        """Zones de feu actives, et à venir une fois leur prévisualisation terminée"""
+        zones = [(zone.x, zone.y, zone.radius, 0) for zone in scene.fire_zones]
+        zones.extend((pending['x'], pending['y'], 50, pending['timer']) for pending in scene.pending_fire_zones)
+        if not zones:
+            return np.zeros(cx.shape)
+        zx, zy, radius, timer = np.array(zones, dtype=np.float64).T
+        reach2 = (radius + player.size) ** 2
+        distance2 = (cx[:, :, None] - zx) ** 2 + (cy[:, :, None] - zy) ** 2
+        # Une zone en prévisualisation ne compte qu'aux horizons où elle brûle déjà
+        burning = timer <= self.horizons[:, None]
+        return (np.clip(1 - distance2 / reach2, 0, 1) * burning * 6).sum(axis=2)
+
+    def _enemy_danger(self, enemies, player, cx, cy):
+        """Ennemis de mêlée (qui se rapprochent à leur vitesse) et distance de tir, les plus proches seulement"""
+        self.time_to_contact = float('inf')
+        enemies = list(enemies)
+        n = len(enemies)
+        if n == 0:
+            return np.zeros(cx.shape)
+        ex = np.fromiter(map(attrgetter('x'), enemies), dtype=np.float64, count=n)
+        ey = np.fromiter(map(attrgetter('y'), enemies), dtype=np.float64, count=n)
+        if n > self.max_enemies:
+            # Sélection en O(n) des plus proches, comme pour les projectiles
+            distance2 = (ex - player.x) ** 2 + (ey - player.y) ** 2
+            nearest = np.argpartition(distance2, self.max_enemies)[:self.max_enemies]
+            ex, ey = ex[nearest], ey[nearest]
+            enemies = [enemies[i] for i in nearest.tolist()]
+        self.evaluated = (self.evaluated[0], len(enemies))
+        distance = np.sqrt((cx[:, :, None] - ex) ** 2 + (cy[:, :, None] - ey) ** 2)
+
+        melee = [
+            (i, enemy.explosion_radius if enemy.type == "suicide" else enemy.radius,
+             enemy.damage, max(getattr(enemy, 'speed', 0), 0.1))
+            for i, enemy in enumerate(enemies)
+            if enemy.type not in RANGED_TYPES and enemy.damage > 0
+        ]
+        danger = np.zeros(cx.shape)
+        if melee:
+            index, radius, damage, speed = np.array(melee, dtype=np.float64).T
+            # Écart restant : l'ennemi poursuit le joueur et aura parcouru speed * t à l'horizon t
+            gap = distance[:, :, index.astype(np.intp)] - radius - player.size
+            self.time_to_contact = float((gap[0, 0] / speed).min())
+            gap -= speed * self.horizons[:, None]
+            danger += (np.exp(-np.maximum(gap, 0) / self.enemy_scale) * damage * 0.1).sum(axis=2)
+
+        # Rester à portée de tir de l'ennemi le plus proche, sans s'y coller
+        nearest = distance.min(axis=2)
+        return danger + self.engage_weight * np.abs(nearest - self.preferred_distance) / self.preferred_distance
+
+    def stats(self):
+        """Durée des décisions en microsecondes : moyenne, p95 et max, et décisions au-delà de BUDGET_US"""
+        if not self.decision_times:
+            return {"mean": 0, "p95": 0, "max": 0, "over_budget": 0}
+        ordered = sorted(self.decision_times)
+        return {
+            "mean": sum(ordered) / len(ordered) / 1000,
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] / 1000,
+            "max": ordered[-1] / 1000,
+            "over_budget": sum(1 for duration in ordered if duration > self.BUDGET_US * 1000)
+        }
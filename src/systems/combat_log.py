@@ -0,0 +1,56 @@
+# src/systems/combat_log.py
+
+class CombatLog:
+    """
+    Journal de combat d'une partie (équilibrage)
+    Temps pour tuer par type d'ennemi, dégâts subis par source et cause de la mort
+    Les temps sont en ticks de simulation : ils ne dépendent pas de la machine
+    """
+    def __init__(self):
+        self.kills = {}  # type d'ennemi -> nombre d'ennemis tués
+        self.kill_ticks = {}  # type d'ennemi -> somme des ticks entre apparition et mort
+        self.damage_taken = {}  # source -> dégâts subis
+        self.hits_taken = {}  # source -> nombre de coups reçus
+        self.last_source = None
+        self.death_cause = None
+
+    def on_spawn(self, enemy, tick):
+        """Note le tick d'apparition d'un ennemi"""
+        enemy.spawn_tick = tick
+
+    def on_kill(self, enemy, tick):
+        """Un ennemi vient d'être tué par le joueur"""
+        lived = tick - getattr(enemy, 'spawn_tick', tick)
+        self.kills[enemy.type] = self.kills.get(enemy.type, 0) + 1
+        self.kill_ticks[enemy.type] = self.kill_ticks.get(enemy.type, 0) + lived
+
+    def on_damage(self, source, amount):
+        """Le joueur vient de perdre `amount` PV à cause de `source`"""
+        if amount <= 0:
+            return  # Dash : invulnérable
+        self.damage_taken[source] = self.damage_taken.get(source, 0) + amount
+        self.hits_taken[source] = self.hits_taken.get(source, 0) + 1
+        self.last_source = source
+
+    def on_death(self):
+        """Le joueur est mort : le dernier coup reçu en est la cause"""
+        if self.death_cause is None:
+            self.death_cause = self.last_source or "inconnu"
+
+    def time_to_kill(self, tick_rate):
+        """Temps moyen pour tuer (secondes) par type d'ennemi"""
+        return {
+            enemy_type: self.kill_ticks[enemy_type] / count / tick_rate
+            for enemy_type, count in self.kills.items()
+        }
+
+    def summary(self, tick_rate):
+        """Résumé plat (une colonne par mesure) pour les exports CSV"""
+        row = {"death_cause": self.death_cause or ""}
+        for enemy_type, seconds in sorted(self.time_to_kill(tick_rate).items()):
+            row[f"kills_{enemy_type}"] = self.kills[enemy_type]
+            row[f"ttk_{enemy_type}"] = round(seconds, 3)
+        for source, amount in sorted(self.damage_taken.items()):
+            row[f"damage_{source}"] = round(amount, 2)
+            row[f"hits_{source}"] = self.hits_taken[source]
+        return row
@@ -0,0 +1,81 @@
+# src/systems/emission_scheduler.py
+from collections import deque
+import numpy as np
+
+
+class EmissionScheduler:
+    """
+    Étale l'émission des grosses salves sur plusieurs ticks
+    Une salve planifiée devient une file de projectiles rectilignes, émis à raison
+    de `budget` projectiles par tick au plus, les plus proches du joueur d'abord.
+    Un projectile émis k ticks après sa salve part de la position qu'il aurait
+    atteinte (x + k * dx, y + k * dy) avec k ticks de vie en moins : la géométrie
+    est celle d'une émission en une seule image. Ceux qu'une émission immédiate
+    aurait déjà retirés (sortis de l'écran, durée de vie écoulée) ne sont pas émis.
+    Le planificateur compte ses ticks (un update par tick) : une salve planifiée avant
+    l'update d'un tick part de ce tick. Il appartient à la scène, pas au boss qui tire :
+    les salves en cours continuent après la mort ou la division du boss.
+    À mettre à jour après les projectiles et les ennemis (qui planifient)
+    """
+    def __init__(self, budget=128, lifetime=90):
+        self.budget = budget  # Projectiles émis au plus par tick
+        self.lifetime = lifetime  # Durée de vie d'un projectile émis sans retard
+        self.tick = 0  # Tick en cours (avancé par update)
+        self.pending = deque()  # Salves en attente : [tick, tableau (6, n), couleur, source, prochain index]
+        self.emitted = 0  # Projectiles émis au dernier update
+        self.max_delay = 0  # Plus grand retard d'émission observé (ticks)
+
+    def __len__(self):
+        """Nombre de projectiles en attente"""
+        return sum(volley[1].shape[1] - volley[4] for volley in self.pending)
+
+    def clear(self):
+        """Abandonne les salves en attente"""
+        self.pending.clear()
+
+    def schedule(self, x, y, dx, dy, damage, radius, color, source=None, origin=None):
+        """
+        Planifie une salve lancée au tick en cours (scalaires ou tableaux, comme ProjectileBatch.emit)
+        origin : position (x, y) du joueur ; les projectiles les plus proches partent en premier
+        """
+        data = np.array(np.broadcast_arrays(x, y, dx, dy, damage, radius), dtype=np.float64).reshape(6, -1)
+        if data.shape[1] == 0:
+            return
+        if origin is not None:
+            distance2 = (data[0] - origin[0]) ** 2 + (data[1] - origin[1]) ** 2
+            data = data[:, np.argsort(distance2, kind='stable')]
+        self.pending.append([self.tick, data, color, source, 0])
+
+    def update(self, batch):
+        """Émet dans le lot la part de ce tick des salves en attente, puis passe au tick suivant ; retourne le nombre émis"""
+        tick = self.tick
+        self.tick += 1
+        self.emitted = 0
+        width = batch.settings.screen_width
+        height = batch.settings.screen_height
+        while self.pending and self.emitted < self.budget:
+            volley = self.pending[0]
+            start_tick, data, color, source, start = volley
+            stop = min(data.shape[1], start + self.budget - self.emitted)
+            x, y, dx, dy, damage, radius = data[:, start:stop]
+            delay = tick - start_tick
+            if delay > 0:
+                self.max_delay = max(self.max_delay, delay)
+                # Trajectoire rectiligne dans un écran convexe : il suffit que le
+                # premier et le dernier déplacement manqués restent dans l'écran
+                first_x, first_y = x + dx, y + dy
+                x, y = x + dx * delay, y + dy * delay
+                inside = ((first_x >= 0) & (first_x <= width) & (first_y >= 0) & (first_y <= height) &
+                          (x >= 0) & (x <= width) & (y >= 0) & (y <= height))
+                if delay >= self.lifetime:
+                    inside[:] = False
+                x, y, dx, dy, damage, radius = (values[inside] for values in (x, y, dx, dy, damage, radius))
+            batch.emit(x, y, dx, dy, damage, radius=radius, color=color,
+                       lifetime=self.lifetime - delay, source=source)
+            # Le budget compte aussi les projectiles écartés : leur place est déjà passée
+            self.emitted += stop - start
+            if stop == data.shape[1]:
+                self.pending.popleft()
+            else:
+                volley[4] = stop
+        return self.emitted
@@ -0,0 +1,143 @@
+# src/systems/enemy_index.py
+import math
+import numpy as np
+from .spatial_grid import SpatialGrid
+
+
+class EnemyIndex:
+    """
+    Index spatial des ennemis vivants pour le ciblage
+    Reconstruit au plus une fois par tick, à la première requête qui suit invalidate
+    (positions à cet instant), puis partagé par tous les consommateurs :
+    plus proche voisin, k plus proches et requête de rayon, en distances au carré.
+    Les plus proches sont cherchés par anneaux de cellules de la grille autour du
+    point : la recherche s'arrête dès que les anneaux suivants ne peuvent plus
+    contenir de candidat plus proche. À distance égale, l'ennemi rangé le
+    premier (ordre de build) l'emporte
+    """
+    def __init__(self, cell_size=128):
+        self.grid = SpatialGrid(cell_size)
+        self.entities = []
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.bounds = (0, 0, -1, -1)  # Cellules occupées extrêmes (min_cx, min_cy, max_cx, max_cy)
+        self.source = ()  # Entités de la prochaine reconstruction
+        self.stale = False  # Reconstruction attendue à la prochaine requête
+        self.builds = 0
+        self.queries = 0
+
+    def invalidate(self, entities):
+        """Nouveau tick : l'index sera reconstruit à partir de entities à sa première requête"""
+        self.source = entities
+        self.stale = True
+
+    def build(self, entities):
+        """Reconstruit l'index à partir d'entités ayant x et y"""
+        self.source = entities
+        self.stale = False
+        self.entities = list(entities)
+        n = len(self.entities)
+        self.x = np.fromiter((entity.x for entity in self.entities), dtype=np.float64, count=n)
+        self.y = np.fromiter((entity.y for entity in self.entities), dtype=np.float64, count=n)
+        # Points : le rayon des ennemis n'élargit pas les requêtes
+        self.grid.build_arrays(self.x, self.y, np.zeros(n))
+        if n:
+            cell = self.grid.cell_size
+            cx = np.floor_divide(self.x, cell)
+            cy = np.floor_divide(self.y, cell)
+            self.bounds = (int(cx.min()), int(cy.min()), int(cx.max()), int(cy.max()))
+        self.builds += 1
+
+    def _ensure_built(self):
+        """Reconstruit l'index si le tick l'a invalidé"""
+        if self.stale:
+            self.build(self.source)
+
+    def __len__(self):
+        self._ensure_built()
+        return len(self.entities)
+
+    def _ring(self, cx, cy, r):
+        """Cellules non vides à distance de Chebyshev r de la cellule (cx, cy)"""
+        cells = self.grid.cells
+        if r == 0:
+            bucket = cells.get((cx, cy))
+            return [] if bucket is None else [bucket]
+        buckets = []
+        for i in range(cx - r, cx + r + 1):
+            for j in (cy - r, cy + r):
+                bucket = cells.get((i, j))
+                if bucket is not None:
+                    buckets.append(bucket)
+        for j in range(cy - r + 1, cy + r):
+            for i in (cx - r, cx + r):
+                bucket = cells.get((i, j))
+                if bucket is not None:
+                    buckets.append(bucket)
+        return buckets
+
+    def query_nearest(self, x, y, k=1, max_distance=math.inf):
+        """Index et distances au carré des k plus proches à moins de max_distance, du plus proche au plus loin"""
+        self._ensure_built()
+        self.queries += 1
+        if not self.entities or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        cell = self.grid.cell_size
+        cx, cy = int(x // cell), int(y // cell)
+        min_cx, min_cy, max_cx, max_cy = self.bounds
+        last_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy)
+        if max_distance != math.inf:
+            last_ring = min(last_ring, int(max_distance // cell) + 1)
+
+        found = []
+        count = 0
+        index = d2 = None
+        for r in range(last_ring + 1):
+            ring = self._ring(cx, cy, r)
+            if not ring:
+                continue
+            found.extend(ring)
+            count += sum(len(bucket) for bucket in ring)
+            if count >= k:
+                index = np.concatenate(found)
+                d2 = (self.x[index] - x) ** 2 + (self.y[index] - y) ** 2
+                # Hors des anneaux parcourus, tout ennemi est à plus de r cellules
+                if np.partition(d2, k - 1)[k - 1] < (r * cell) ** 2:
+                    break
+                index = None
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        if index is None:
+            index = np.concatenate(found)
+            d2 = (self.x[index] - x) ** 2 + (self.y[index] - y) ** 2
+
+        keep = d2 < max_distance * max_distance
+        index, d2 = index[keep], d2[keep]
+        order = np.lexsort((index, d2))[:k]
+        return index[order], d2[order]
+
+    def query_radius(self, x, y, radius):
+        """Index (croissants) et distances au carré des ennemis à au plus radius"""
+        self._ensure_built()
+        self.queries += 1
+        if not self.entities:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        index = self.grid.query_indices(x, y, radius)
+        d2 = (self.x[index] - x) ** 2 + (self.y[index] - y) ** 2
+        keep = d2 <= radius * radius
+        return index[keep], d2[keep]
+
+    def nearest(self, x, y, max_distance=math.inf):
+        """Ennemi le plus proche à moins de max_distance, ou None"""
+        index, _ = self.query_nearest(x, y, 1, max_distance)
+        return self.entities[index[0]] if index.size else None
+
+    def k_nearest(self, x, y, k, max_distance=math.inf):
+        """Les k ennemis les plus proches à moins de max_distance, du plus proche au plus loin"""
+        index, _ = self.query_nearest(x, y, k, max_distance)
+        return [self.entities[i] for i in index.tolist()]
+
+    def within(self, x, y, radius):
+        """Ennemis à au plus radius, dans l'ordre de build"""
+        index, _ = self.query_radius(x, y, radius)
+        return [self.entities[i] for i in index.tolist()]
@@ -0,0 +1,116 @@
+# src/systems/entity_registry.py
+
+INDEX_BITS = 20  # Bits bas d'une poignée : emplacement ; bits hauts : génération
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class EntityRegistry:
+    """
+    Registre d'entités à poignées générationnelles
+    Une poignée est un entier (génération << INDEX_BITS | emplacement) : quand une
+    entité est retirée, la génération de son emplacement avance et toutes les
+    anciennes poignées deviennent périmées (get retourne None) au lieu de garder
+    l'objet en vie. Les entités sont rangées de façon dense (itération sans trou) ;
+    un retrait échange l'entité avec la dernière, en O(1) (l'ordre n'est pas gardé).
+    kill() met le retrait en attente : flush(), appelé une fois par tick, retire
+    toutes les entités tuées, ce qui permet de tuer pendant qu'on itère.
+    L'entité reçoit sa poignée dans l'attribut `handle`
+    """
+    def __init__(self):
+        self.entities = []  # Stockage dense (ordre d'itération)
+        self.dense_handles = []  # Poignée de chaque entité du stockage dense
+        self.slots = []  # Par emplacement : index dans le stockage dense, -1 si libre
+        self.generations = []  # Par emplacement : génération courante
+        self.free = []  # Emplacements libres, réutilisés en premier
+        self.kill_queue = []  # Poignées à retirer au prochain flush
+
+    def add(self, entity):
+        """Enregistre une entité et retourne sa poignée (la même si elle est déjà enregistrée)"""
+        handle = getattr(entity, 'handle', None)
+        if handle is not None and self.get(handle) is entity:
+            return handle
+        if self.free:
+            index = self.free.pop()
+        else:
+            index = len(self.slots)
+            self.slots.append(-1)
+            self.generations.append(0)
+        handle = (self.generations[index] << INDEX_BITS) | index
+        self.slots[index] = len(self.entities)
+        self.entities.append(entity)
+        self.dense_handles.append(handle)
+        entity.handle = handle
+        return handle
+
+    def get(self, handle):
+        """Entité de la poignée, ou None si la poignée est périmée"""
+        if handle is None:
+            return None
+        index = handle & INDEX_MASK
+        if index >= len(self.slots) or self.generations[index] != handle >> INDEX_BITS:
+            return None
+        dense = self.slots[index]
+        return self.entities[dense] if dense >= 0 else None
+
+    def __contains__(self, handle):
+        return self.get(handle) is not None
+
+    def remove(self, handle):
+        """Retire aussitôt l'entité (échange avec la dernière) ; False si la poignée est périmée"""
+        if self.get(handle) is None:
+            return False
+        index = handle & INDEX_MASK
+        dense = self.slots[index]
+        last = len(self.entities) - 1
+        if dense != last:
+            moved = self.dense_handles[last]
+            self.entities[dense] = self.entities[last]
+            self.dense_handles[dense] = moved
+            self.slots[moved & INDEX_MASK] = dense
+        self.entities.pop()
+        self.dense_handles.pop()
+        self.slots[index] = -1
+        self.generations[index] += 1
+        self.free.append(index)
+        return True
+
+    def kill(self, handle):
+        """Met le retrait en attente jusqu'au prochain flush (plusieurs kill d'une même poignée sont sans effet)"""
+        self.kill_queue.append(handle)
+
+    def flush(self):
+        """Retire les entités tuées depuis le dernier flush ; retourne le nombre retiré"""
+        if not self.kill_queue:
+            return 0
+        removed = 0
+        for handle in self.kill_queue:
+            removed += self.remove(handle)
+        self.kill_queue.clear()
+        return removed
+
+    def clear(self):
+        """Retire toutes les entités (toutes les poignées deviennent périmées)"""
+        for index, dense in enumerate(self.slots):
+            if dense >= 0:
+                self.slots[index] = -1
+                self.generations[index] += 1
+        self.free = list(range(len(self.slots) - 1, -1, -1))
+        # Nouvelles listes : une itération en cours continue sur l'ancien contenu
+        self.entities = []
+        self.dense_handles = []
+        self.kill_queue = []
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def __len__(self):
+        return len(self.entities)
+
+    def stats(self):
+        """Compteurs du registre (pour le profilage)"""
+        return {
+            "entities": len(self.entities),
+            "slots": len(self.slots),
+            "free": len(self.free),
+            "pending_kills": len(self.kill_queue)
+        }
@@ -0,0 +1,38 @@
+# src/systems/fixed_timestep.py
+
+class FixedTimestep:
+    """
+    Accumulateur pour une simulation à pas fixe
+    Le temps réel écoulé entre deux images est converti en un nombre entier
+    de ticks de simulation, le reste étant gardé pour l'image suivante
+    """
+    def __init__(self, tick_rate=60, max_ticks_per_frame=5):
+        self.tick_rate = tick_rate
+        self.dt = 1000 / tick_rate  # Durée d'un tick en millisecondes
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0
+        self.ticks = 0  # Nombre total de ticks simulés
+        self.dropped_ticks = 0  # Ticks abandonnés par la protection de rattrapage
+
+    def advance(self, elapsed_ms):
+        """Ajoute le temps écoulé et retourne le nombre de ticks à simuler"""
+        self.accumulator += elapsed_ms
+        steps = int(self.accumulator // self.dt)
+
+        # Évite la spirale de la mort : au-delà du maximum, le retard est abandonné
+        if steps > self.max_ticks_per_frame:
+            self.dropped_ticks += steps - self.max_ticks_per_frame
+            self.accumulator -= (steps - self.max_ticks_per_frame) * self.dt
+            steps = self.max_ticks_per_frame
+
+        self.accumulator -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    def alpha(self):
+        """Fraction du tick suivant déjà écoulée (pour interpoler le rendu)"""
+        return self.accumulator / self.dt
+
+    def reset(self):
+        """Vide l'accumulateur (après un chargement ou une pause longue)"""
+        self.accumulator = 0
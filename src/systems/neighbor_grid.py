@@ -0,0 +1,63 @@
+# src/systems/neighbor_grid.py
+import numpy as np
+
+# Décalages des 9 cellules voisines (la cellule elle-même comprise)
+NEIGHBOR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+class NeighborGrid:
+    """
+    Grille uniforme entièrement vectorisée pour les requêtes de voisinage
+    Les points sont triés par cellule ; les voisins d'un point sont lus dans les
+    9 cellules qui l'entourent, au plus `per_cell` par cellule : un point considère
+    donc au plus 9 * per_cell voisins, et une reconstruction suivie de pairs()
+    coûte O(n) même quand tous les points s'entassent dans la même cellule.
+    Dans une cellule, les premiers points rangés (index croissants) sont pris
+    """
+    def __init__(self, cell_size=64, per_cell=4):
+        self.cell_size = max(1, cell_size)
+        self.per_cell = per_cell
+        self.count = 0
+        self.keys = np.empty(0, dtype=np.int64)  # Clé de cellule de chaque point
+        self.order = np.empty(0, dtype=np.int64)  # Points triés par clé
+        self.sorted_keys = np.empty(0, dtype=np.int64)
+        self.offsets = np.empty(0, dtype=np.int64)  # Décalage de clé des 9 voisines
+
+    def build(self, xs, ys, cell_size=None):
+        """Reconstruit la grille à partir de tableaux de positions"""
+        if cell_size is not None:
+            self.cell_size = max(1, cell_size)
+        self.count = len(xs)
+        if self.count == 0:
+            self.keys = self.order = self.sorted_keys = np.empty(0, dtype=np.int64)
+            return
+        cx = np.floor_divide(xs, self.cell_size).astype(np.int64)
+        cy = np.floor_divide(ys, self.cell_size).astype(np.int64)
+        # Une colonne et une ligne vides autour : les clés voisines ne se chevauchent pas
+        cx -= cx.min() - 1
+        cy -= cy.min() - 1
+        rows = int(cy.max()) + 2
+        self.keys = cx * rows + cy
+        self.order = np.argsort(self.keys, kind='stable')
+        self.sorted_keys = self.keys[self.order]
+        self.offsets = np.array([dx * rows + dy for dx, dy in NEIGHBOR_OFFSETS], dtype=np.int64)
+
+    def pairs(self):
+        """Paires candidates (i, j), i != j, de points dans des cellules voisines"""
+        if self.count < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        wanted = self.keys[:, None] + self.offsets[None, :]  # (n, 9)
+        start = np.searchsorted(self.sorted_keys, wanted, side='left')
+        stop = np.searchsorted(self.sorted_keys, wanted, side='right')
+        taken = np.minimum(stop - start, self.per_cell)
+
+        slot = np.arange(self.per_cell)
+        valid = slot < taken[:, :, None]  # (n, 9, per_cell)
+        i = np.repeat(np.arange(self.count), taken.sum(axis=1))
+        j = self.order[(start[:, :, None] + slot)[valid]]
+        distinct = i != j
+        return i[distinct], j[distinct]
+
+    def __len__(self):
+        return self.count
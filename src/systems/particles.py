@@ -0,0 +1,200 @@
+# src/systems/particles.py
+import numpy as np
+from src.utils.sprite_cache import circle_cache
+
+NO_OWNERS = np.empty(0, dtype=np.int64)  # Aucune particule retirée
+
+
+class ParticleSystem:
+    """
+    Particules en structure de tableaux (un tableau NumPy 2D, une ligne par attribut)
+    emit() ajoute une ou plusieurs particules d'un coup, update() les fait toutes
+    avancer en une passe vectorisée (vitesse, gravité, agitation, durée de vie)
+    et retire les mortes en comblant chaque trou par une vivante de la fin,
+    draw() dessine le système en un seul appel Surface.blits.
+    Un système peut être partagé par plusieurs émetteurs : chaque particule
+    porte le numéro de son propriétaire (owner), ce qui permet de retirer ou de
+    remplacer les particules d'un seul émetteur.
+    Courbes d'une particule à `life` ticks de sa fin :
+    - taille : size * (shrink + (1 - shrink) * life / max_life)
+    - alpha : alpha * min(1, life / fade) ; pendant cette phase d'estompage,
+      size est en plus multipliée par growth (du système) à chaque tick
+    - position dessinée : x + sin(life * wiggle_speed) * wiggle (ondulation)
+    """
+    # Une ligne d'un seul tableau 2D par attribut : retirer ou agrandir = une seule copie
+    FIELDS = (
+        'x', 'y', 'dx', 'dy', 'life', 'max_life', 'fade', 'size', 'shrink',
+        'alpha', 'wiggle', 'wiggle_speed', 'red', 'green', 'blue', 'owner'
+    )
+
+    def __init__(self, capacity=64, gravity=0.0, jitter=(0.0, 0.0), growth=1.0, seed=None):
+        self.count = 0
+        self.capacity = 0
+        self.gravity = gravity  # Ajouté à dy à chaque tick
+        self.jitter = jitter  # Variation aléatoire de (dx, dy) à chaque tick (fumée)
+        self.growth = growth  # Facteur de taille par tick pendant l'estompage
+        # Tirages cosmétiques vectorisés, seed tirée du flux fx de la scène (jamais ceux de la partie)
+        self.random = np.random.default_rng(seed)
+        self.blit_count = 0  # Nombre de blits du dernier draw
+        self.sprites = {}  # Clé de draw -> sprite (évite de repasser par le cache LRU)
+        self.max_sprites = 1024
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity):
+        """Agrandit le tableau en conservant les particules existantes"""
+        data = np.zeros((len(self.FIELDS), capacity), dtype=np.float64)
+        if self.capacity:
+            data[:, :self.count] = self.data[:, :self.count]
+        self.data = data
+        self.capacity = capacity
+        # Vues nommées sur les lignes (color : vue (particules, 3) sur red, green, blue)
+        for row, name in enumerate(self.FIELDS):
+            setattr(self, name, data[row])
+        red = self.FIELDS.index('red')
+        self.color = data[red:red + 3].T
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Supprime toutes les particules (les tableaux sont gardés)"""
+        self.count = 0
+
+    def emit(self, x, y, dx=0.0, dy=0.0, life=30, size=3.0, color=(255, 255, 255), alpha=255,
+             fade=None, max_life=None, shrink=1.0, wiggle=0.0, wiggle_speed=0.0, owner=0):
+        """
+        Ajoute une ou plusieurs particules d'un coup
+        Chaque paramètre accepte un scalaire ou un tableau (color : un triplet ou
+        un tableau de triplets). fade et max_life valent life par défaut
+        Retourne le nombre de particules ajoutées
+        """
+        n = max(np.size(x), np.size(y), np.size(dx), np.size(dy), np.size(life))
+        if self.count + n > self.capacity:
+            new_capacity = self.capacity
+            while self.count + n > new_capacity:
+                new_capacity *= 2
+            self._grow(new_capacity)
+
+        # Les scalaires sont diffusés par l'affectation
+        s = slice(self.count, self.count + n)
+        self.x[s] = x
+        self.y[s] = y
+        self.dx[s] = dx
+        self.dy[s] = dy
+        self.life[s] = life
+        self.max_life[s] = life if max_life is None else max_life
+        self.fade[s] = life if fade is None else fade
+        self.size[s] = size
+        self.shrink[s] = shrink
+        self.alpha[s] = alpha
+        self.wiggle[s] = wiggle
+        self.wiggle_speed[s] = wiggle_speed
+        self.color[s] = color
+        self.owner[s] = owner
+        self.count += n
+        return n
+
+    def update(self):
+        """
+        Fait avancer toutes les particules d'un tick puis retire les mortes
+        Retourne le propriétaire de chaque particule morte (émetteurs en boucle)
+        """
+        n = self.count
+        if n == 0:
+            return NO_OWNERS
+        self.x[:n] += self.dx[:n]
+        self.y[:n] += self.dy[:n]
+        if self.gravity:
+            self.dy[:n] += self.gravity
+        jitter_x, jitter_y = self.jitter
+        if jitter_x:
+            self.dx[:n] += self.random.uniform(-jitter_x, jitter_x, n)
+        if jitter_y:
+            self.dy[:n] += self.random.uniform(-jitter_y, jitter_y, n)
+
+        life = self.life[:n]
+        life -= 1
+        if self.growth != 1.0:
+            self.size[:n][life < self.fade[:n]] *= self.growth
+        return self._remove_dead()
+
+    def kill_owner(self, owner):
+        """Retire toutes les particules d'un propriétaire"""
+        n = self.count
+        self.life[:n][self.owner[:n] == owner] = 0
+        self._remove_dead()
+
+    def _remove_dead(self):
+        """
+        Comble chaque particule morte par une vivante de la fin (l'ordre n'est pas gardé)
+        Retourne les propriétaires des particules retirées
+        """
+        n = self.count
+        alive = self.life[:n] > 0
+        m = int(np.count_nonzero(alive))
+        if m == n:
+            return NO_OWNERS
+        removed = self.owner[:n][~alive].astype(np.int64)
+        # Trous avant la nouvelle fin, et autant de vivantes après elle pour les remplir
+        holes = np.flatnonzero(~alive[:m])
+        if holes.size:
+            self.data[:, holes] = self.data[:, m + np.flatnonzero(alive[m:])]
+        self.count = m
+        return removed
+
+    def _sprite(self, key):
+        """Sprite d'une clé de draw (le dictionnaire est vidé quand il devient trop grand)"""
+        if len(self.sprites) >= self.max_sprites:
+            self.sprites.clear()
+        sprite = circle_cache.get(key >> 32, ((key >> 24) & 0xFF, (key >> 16) & 0xFF, (key >> 8) & 0xFF), key & 0xFF)
+        self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, grow=0, alpha_scale=1.0):
+        """
+        Dessine toutes les particules avec les sprites de circle_cache
+        grow et alpha_scale agrandissent et atténuent la couche (halo des flammes)
+        """
+        self.blit_count = 0
+        n = self.count
+        if n == 0:
+            return
+        life = self.life[:n]
+        shrink = self.shrink[:n]
+        radius = (self.size[:n] * (shrink + (1 - shrink) * life / self.max_life[:n]) + grow).astype(np.int64)
+        alpha = self.alpha[:n] * alpha_scale * np.minimum(1.0, life / self.fade[:n])
+        # Même palier d'alpha que circle_cache
+        step = circle_cache.alpha_step
+        alpha = np.clip(np.rint(alpha / step) * step, 0, 255).astype(np.int64)
+
+        visible = np.flatnonzero((radius > 0) & (alpha > 0))
+        if visible.size == 0:
+            return
+        radius = radius[visible]
+        alpha = alpha[visible]
+        colors = self.color[:n][visible].astype(np.int64)
+        x = self.x[:n][visible]
+        wiggle = self.wiggle[:n][visible]
+        if wiggle.any():
+            x = x + np.sin(life[visible] * self.wiggle_speed[:n][visible]) * wiggle
+
+        # Clé entière (rayon, couleur, alpha) -> sprite de circle_cache, mémorisé par le système
+        keys = (np.minimum(radius, 0xFFFF) << 32) | (colors[:, 0] << 24) | (colors[:, 1] << 16) | (colors[:, 2] << 8) | alpha
+        sprites = self.sprites
+        images = []
+        for key in keys.tolist():
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = self._sprite(key)
+            images.append(sprite)
+
+        # Même arrondi que circle_cache.blit
+        left = (x - radius).astype(np.int64).tolist()
+        top = (self.y[:n][visible] - radius).astype(np.int64).tolist()
+        sequence = list(zip(images, zip(left, top)))
+        self.blit_count = len(sequence)
+        fblits = getattr(screen, "fblits", None)
+        if fblits is not None:
+            fblits(sequence)
+        else:
+            screen.blits(sequence, doreturn=False)
@@ -0,0 +1,89 @@
+# src/systems/profiler.py
+from collections import deque
+from time import perf_counter_ns
+
+
+class FrameProfiler:
+    """
+    Profileur par étape de la boucle de jeu
+    Les sondes (start / lap) mesurent en nanosecondes avec perf_counter_ns.
+    Désactivé, lap retourne 0 sans rien mesurer : le coût est celui d'un appel
+    de méthode. Les durées d'une image sont cumulées (plusieurs ticks possibles)
+    puis gardées sur une fenêtre glissante d'images
+    Une étape "parent/enfant" est un détail de l'étape parent : seules les
+    étapes sans "/" comptent dans la durée totale de l'image
+    """
+    def __init__(self, window=120, graph_length=240):
+        self.enabled = False
+        self.window = window  # Nombre d'images pour moyenne, p95 et max
+        self.stages = {}  # étape -> deque des durées (ns) des dernières images
+        self.frame_totals = {}  # étape -> durée cumulée (ns) de l'image en cours
+        self.frame_times = deque(maxlen=graph_length)  # Durées totales (ns) pour le graphe
+        self.counts = {}  # Nombre d'entités, renseigné par la scène
+        self.frames = 0
+
+    def toggle(self):
+        """Active ou désactive les mesures (les anciennes sont oubliées)"""
+        self.enabled = not self.enabled
+        self.reset()
+        return self.enabled
+
+    def reset(self):
+        """Oublie toutes les mesures"""
+        self.stages.clear()
+        self.frame_totals.clear()
+        self.frame_times.clear()
+        self.counts = {}
+        self.frames = 0
+
+    def start(self):
+        """Horodatage de départ d'une série de sondes (0 si désactivé)"""
+        return perf_counter_ns() if self.enabled else 0
+
+    def lap(self, stage, start):
+        """Ajoute le temps écoulé depuis start à l'étape et retourne le nouvel horodatage"""
+        if not self.enabled:
+            return 0
+        now = perf_counter_ns()
+        self.frame_totals[stage] = self.frame_totals.get(stage, 0) + now - start
+        return now
+
+    def end_frame(self):
+        """Clôt l'image : les cumuls passent dans la fenêtre glissante"""
+        if not self.enabled:
+            return
+        self.frame_times.append(sum(
+            total for stage, total in self.frame_totals.items() if "/" not in stage
+        ))
+
+        for stage, total in self.frame_totals.items():
+            history = self.stages.get(stage)
+            if history is None:
+                history = self.stages[stage] = deque(maxlen=self.window)
+            history.append(total)
+        # Une étape absente de l'image compte pour 0
+        for stage, history in self.stages.items():
+            if stage not in self.frame_totals:
+                history.append(0)
+        self.frame_totals.clear()
+        self.frames += 1
+
+    @staticmethod
+    def _summarize(values):
+        ordered = sorted(values)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            "mean": sum(ordered) / len(ordered) / 1e6,
+            "p95": p95 / 1e6,
+            "max": ordered[-1] / 1e6
+        }
+
+    def summary(self):
+        """Moyenne, p95 et max (en ms) de chaque étape sur la fenêtre glissante"""
+        return {stage: self._summarize(history) for stage, history in self.stages.items() if history}
+
+    def frame_summary(self):
+        """Moyenne, p95 et max (en ms) de la durée totale des images"""
+        if not self.frame_times:
+            return None
+        return self._summarize(list(self.frame_times)[-self.window:])
@@ -0,0 +1,168 @@
+# src/systems/replay.py
+import json
+import struct
+import zlib
+import hashlib
+from array import array
+
+# Format du fichier (petit-boutiste) :
+#   en-tête  : "TMRP", version, seed, tick_rate, largeur, hauteur, empreinte finale,
+#              longueur puis JSON des données du joueur
+#   contenu  : compressé avec zlib, un octet d'entrées par tick simulé puis les événements
+MAGIC = b"TMRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQHHH16sI")
+EVENT = struct.Struct("<IBHH")  # tick, type, a, b
+
+# Événements appliqués avant le tick indiqué
+EVENT_DASH = 1
+EVENT_PERK = 2  # a = index du perk choisi
+EVENT_RESIZE = 3  # a, b = nouvelle taille de la surface de jeu
+
+# Octet d'entrées : 4 bits pour les touches enfoncées, 2 bits par dernière touche d'axe
+KEY_BITS = (('left', 1), ('right', 2), ('up', 4), ('down', 8))
+HORIZONTAL_CODES = {None: 0, 'left': 1, 'right': 2}
+VERTICAL_CODES = {None: 0, 'up': 1, 'down': 2}
+HORIZONTAL_KEYS = {code: key for key, code in HORIZONTAL_CODES.items()}
+VERTICAL_KEYS = {code: key for key, code in VERTICAL_CODES.items()}
+
+
+def encode_input(player):
+    """État des entrées du joueur sur un octet"""
+    value = 0
+    for key, bit in KEY_BITS:
+        if player.keys_pressed[key]:
+            value |= bit
+    value |= HORIZONTAL_CODES[player.last_horizontal_key] << 4
+    value |= VERTICAL_CODES[player.last_vertical_key] << 6
+    return value
+
+
+def apply_input(player, value):
+    """Remet le joueur dans l'état d'entrées enregistré"""
+    for key, bit in KEY_BITS:
+        player.keys_pressed[key] = bool(value & bit)
+    player.last_horizontal_key = HORIZONTAL_KEYS[(value >> 4) & 3]
+    player.last_vertical_key = VERTICAL_KEYS[(value >> 6) & 3]
+
+
+def state_digest(scene):
+    """Empreinte de l'état de la simulation (pour vérifier une relecture au bit près)"""
+    player = scene.player
+    values = array('d', [
+        scene.tick_count, player.x, player.y, player.health, player.score, player.xp,
+        scene.wave_manager.floor_number, scene.wave_manager.wave_number
+    ])
+    for enemy in scene.enemies:
+        values.extend((enemy.x, enemy.y, enemy.health))
+    for fire_zone in scene.fire_zones:
+        values.extend((fire_zone.x, fire_zone.y, fire_zone.lifetime))
+
+    digest = hashlib.blake2b(values.tobytes(), digest_size=16)
+    for batch in (scene.projectiles, scene.enemy_projectiles):
+        n = batch.count
+        for field in (batch.x, batch.y, batch.dx, batch.dy, batch.lifetime):
+            digest.update(field[:n].tobytes())
+    return digest.digest()
+
+
+class Replay:
+    """
+    Partie enregistrée : seed, données du joueur, taille de la surface de jeu,
+    un octet d'entrées par tick simulé et les événements ponctuels
+    """
+    def __init__(self, seed, player_data, screen_size, tick_rate=60):
+        self.seed = seed
+        self.player_data = player_data
+        self.screen_size = screen_size
+        self.tick_rate = tick_rate
+        self.inputs = bytearray()
+        self.events = []  # [(tick, type, a, b), ...] dans l'ordre
+        self.digest = bytes(16)  # Empreinte de l'état final (zéros si inconnue)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def events_by_tick(self):
+        """Événements regroupés par tick"""
+        grouped = {}
+        for tick, kind, a, b in self.events:
+            grouped.setdefault(tick, []).append((kind, a, b))
+        return grouped
+
+    def to_bytes(self):
+        player_data = json.dumps(self.player_data, ensure_ascii=False).encode("utf-8")
+        header = HEADER.pack(
+            MAGIC, VERSION, self.seed, self.tick_rate,
+            self.screen_size[0], self.screen_size[1], self.digest, len(player_data)
+        )
+        body = bytearray(struct.pack("<I", len(self.inputs)))
+        body += self.inputs
+        body += struct.pack("<I", len(self.events))
+        for event in self.events:
+            body += EVENT.pack(*event)
+        return header + player_data + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, tick_rate, width, height, digest, data_length = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Fichier de replay invalide ou d'une autre version")
+        offset = HEADER.size
+        player_data = json.loads(data[offset:offset + data_length].decode("utf-8"))
+        body = zlib.decompress(data[offset + data_length:])
+
+        replay = cls(seed, player_data, (width, height), tick_rate)
+        replay.digest = digest
+        (tick_count,) = struct.unpack_from("<I", body)
+        replay.inputs = bytearray(body[4:4 + tick_count])
+        offset = 4 + tick_count
+        (event_count,) = struct.unpack_from("<I", body, offset)
+        offset += 4
+        replay.events = [EVENT.unpack_from(body, offset + i * EVENT.size) for i in range(event_count)]
+        return replay
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """
+    Enregistre une partie pendant qu'elle se joue
+    Seuls les ticks simulés sont enregistrés : la pause n'a pas besoin de l'être.
+    Un événement est attaché au prochain tick simulé
+    """
+    def __init__(self, seed, player_data, settings):
+        self.replay = Replay(
+            seed, player_data,
+            (settings.screen_width, settings.screen_height),
+            settings.tick_rate
+        )
+
+    def record_tick(self, player):
+        """Appelé au début de chaque tick simulé, avant la mise à jour"""
+        # Dash déclenché depuis le tick précédent (sa minuterie n'a pas encore bougé)
+        if player.is_dashing and player.dash_timer == player.dash_duration:
+            self._event(EVENT_DASH)
+        self.replay.inputs.append(encode_input(player))
+
+    def record_perk(self, perk_index):
+        self._event(EVENT_PERK, perk_index)
+
+    def record_resize(self, width, height):
+        self._event(EVENT_RESIZE, width, height)
+
+    def _event(self, kind, a=0, b=0):
+        self.replay.events.append((len(self.replay.inputs), kind, a, b))
+
+    def finish(self, scene, path):
+        """Fige l'empreinte de l'état courant et écrit le fichier"""
+        self.replay.digest = state_digest(scene)
+        self.replay.save(path)
+        return self.replay
@@ -0,0 +1,114 @@
+# src/systems/spatial_grid.py
+import math
+import numpy as np
+
+class SpatialGrid:
+    """
+    Grille uniforme (spatial hash) pour la phase large des collisions
+    Chaque entité est rangée dans la cellule de son centre, et une requête
+    ne parcourt que les cellules qui touchent le cercle recherché
+    La grille se remplit soit avec des objets (build/query), soit avec les
+    index de tableaux NumPy (build_arrays/query_indices)
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = max(1, cell_size)
+        self.cells = {}
+        self.max_radius = 0  # Plus grand rayon inséré (élargit les requêtes)
+        self.count = 0
+
+    @staticmethod
+    def cell_size_for(max_radius, minimum=16):
+        """Taille de cellule adaptée au plus grand rayon (2 rayons = 1 cellule)"""
+        return max(minimum, int(math.ceil(max_radius * 2)))
+
+    def resize(self, cell_size):
+        """Change la taille des cellules (vide la grille)"""
+        self.cell_size = max(1, cell_size)
+        self.clear()
+
+    def clear(self):
+        """Vide la grille (à appeler avant chaque reconstruction)"""
+        self.cells.clear()
+        self.max_radius = 0
+        self.count = 0
+
+    def _cell(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, item, x, y, radius=0):
+        """Ajoute une entité dans la cellule de son centre"""
+        key = self._cell(x, y)
+        bucket = self.cells.get(key)
+        if bucket is None:
+            bucket = []
+            self.cells[key] = bucket
+        # L'ordre d'insertion est gardé pour rendre les requêtes déterministes
+        bucket.append((self.count, item))
+        self.count += 1
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def build(self, entities):
+        """Reconstruit la grille à partir d'entités ayant x, y et radius"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity, entity.x, entity.y, entity.radius)
+
+    def build_arrays(self, xs, ys, radii):
+        """Reconstruit la grille à partir de tableaux de positions (les entités sont leurs index)"""
+        self.clear()
+        n = len(xs)
+        if n == 0:
+            return
+
+        cx = np.floor_divide(xs, self.cell_size).astype(np.int64)
+        cy = np.floor_divide(ys, self.cell_size).astype(np.int64)
+        # Tri stable par cellule : les index restent croissants dans chaque cellule
+        order = np.lexsort((cy, cx))
+        cx, cy = cx[order], cy[order]
+        changes = np.flatnonzero((np.diff(cx) != 0) | (np.diff(cy) != 0)) + 1
+        starts = [0] + changes.tolist()
+        ends = changes.tolist() + [n]
+        for start, end in zip(starts, ends):
+            self.cells[(int(cx[start]), int(cy[start]))] = order[start:end]
+
+        self.max_radius = float(np.max(radii))
+        self.count = n
+
+    def _cells_around(self, x, y, radius):
+        """Cellules non vides qui peuvent contenir une entité touchant le cercle"""
+        reach = radius + self.max_radius
+        min_cx, min_cy = self._cell(x - reach, y - reach)
+        max_cx, max_cy = self._cell(x + reach, y + reach)
+
+        buckets = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is not None and len(bucket):
+                    buckets.append(bucket)
+        return buckets
+
+    def query_indices(self, x, y, radius=0):
+        """Index candidats (triés) d'une grille construite avec build_arrays"""
+        buckets = self._cells_around(x, y, radius)
+        if not buckets:
+            return np.empty(0, dtype=np.int64)
+        if len(buckets) == 1:
+            return buckets[0]
+        return np.sort(np.concatenate(buckets))
+
+    def query(self, x, y, radius=0):
+        """
+        Retourne les entités candidates pouvant toucher le cercle (x, y, radius)
+        Les candidats sont rendus dans leur ordre d'insertion
+        """
+        found = []
+        for bucket in self._cells_around(x, y, radius):
+            found.extend(bucket)
+
+        found.sort(key=lambda entry: entry[0])
+        return [item for _, item in found]
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,224 @@
+# src/systems/steering.py
+from operator import attrgetter
+import numpy as np
+from .neighbor_grid import NeighborGrid
+from .spatial_grid import SpatialGrid
+
+STEERING_BEHAVIORS = ("seek", "kite", "orbit", "keep_distance")
+STEERING_CODES = {None: -1} | {behavior: code for code, behavior in enumerate(STEERING_BEHAVIORS)}
+SEEK, KITE, ORBIT, KEEP = range(len(STEERING_BEHAVIORS))
+
+# Colonnes de la table des paramètres de classe
+STOP, MARGIN, KITE_BAND, RETREAT, KEEP_NEAR, KEEP_FAR, TRACKS, MELEE, SEPARATION = range(9)
+
+
+class SteeringParameters(dict):
+    """
+    Paramètres de pilotage par classe d'ennemi, lus une seule fois par classe
+    Le dictionnaire donne la ligne de chaque classe dans `table` ; une classe
+    inconnue est ajoutée à sa première rencontre. Un attribut absent (ou None)
+    vaut NaN
+    """
+    def __init__(self):
+        super().__init__()
+        self.table = np.empty((0, 9))
+
+    def __missing__(self, klass):
+        def value(name):
+            attribute = getattr(klass, name, None)
+            return np.nan if attribute is None else attribute
+
+        near, far = getattr(klass, 'keep_band', (np.nan, np.nan))
+        row = [value('stop_distance'), value('screen_margin'), value('kite_band'), value('retreat_factor'),
+               value('keep_distance') * near, value('keep_distance') * far,
+               bool(getattr(klass, 'tracks_player', False)), bool(getattr(klass, 'melee', False)),
+               value('separation')]
+        self.table = np.vstack([self.table, row])
+        self[klass] = index = len(self)
+        return index
+
+
+steering_parameters = SteeringParameters()
+
+
+class SteeringSystem:
+    """
+    Déplacement des ennemis en lot, groupés par comportement
+    Chaque classe d'ennemi déclare son comportement (attribut `steering`) et ses
+    paramètres en attributs de classe, lus une fois par classe (SteeringParameters).
+    Positions et vitesses sont lues en lot, chaque comportement est calculé en une
+    passe NumPy sur tout son groupe, puis les positions sont réécrites dans les entités.
+    Les ennemis dont la classe a `tracks_player` reçoivent `to_player` = (dx, dy, distance)
+    vers le joueur avant leur déplacement, repris ensuite par leur comportement (tir, explosion...)
+      seek          : avance vers le joueur tant qu'il est à plus de stop_distance
+      kite          : garde le joueur entre attack_range - kite_band et attack_range
+      orbit         : rejoint le cercle circle_radius puis tourne autour du joueur
+      keep_distance : garde le joueur dans keep_band * keep_distance
+    En deçà de la zone, kite et keep_distance reculent à retreat_factor * speed.
+    Un ennemi dont screen_margin n'est pas None reste dans l'écran (marge radius + screen_margin)
+    Après le déplacement, les ennemis qui se chevauchent sont écartés (separate) :
+    une part `separation` du chevauchement est résorbée à chaque tick, partagée
+    selon l'attribut `separation` de chaque ennemi (0 : il ne cède jamais)
+    """
+    def __init__(self, separation=0.0, max_push=3.0, neighbors_per_cell=4):
+        self.separation = separation  # Part du chevauchement résorbée par tick (0 : pas de séparation)
+        self.max_push = max_push  # Poussée de séparation maximale par tick (px)
+        self.grid = NeighborGrid(per_cell=neighbors_per_cell)
+        self.separated = 0  # Paires d'ennemis (non orientées) qui se chevauchaient au dernier update
+        self.group_sizes = {behavior: 0 for behavior in STEERING_BEHAVIORS}
+        # Dernier update : ennemis, ligne de paramètres et positions après déplacement
+        self.enemies = []
+        self.rows = np.empty(0, dtype=np.int64)
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+
+    def update(self, enemies, player):
+        """Déplace tous les ennemis pilotés ; retourne le nombre d'ennemis déplacés"""
+        self.enemies = list(enemies)
+        crowd = self.separate if self.separation > 0 else None
+        codes, self.rows, self.x, self.y = self.steer(self.enemies, player, crowd)
+        counts = np.bincount(codes[codes >= 0], minlength=len(STEERING_BEHAVIORS))
+        for behavior, count in zip(STEERING_BEHAVIORS, counts.tolist()):
+            self.group_sizes[behavior] = count
+        return int(counts.sum())
+
+    def contacts(self, player, slack=1.0):
+        """
+        Ennemis de mêlée qui peuvent toucher le joueur après le dernier update
+        Sur-ensemble (marge slack) : le test exact reste à faire pour chacun
+        """
+        if not self.enemies:
+            return np.zeros(0, dtype=bool)
+        reach = self._values(self.enemies, 'radius') + player.size + slack
+        melee = steering_parameters.table[self.rows, MELEE] > 0
+        return melee & ((self.x - player.x) ** 2 + (self.y - player.y) ** 2 < reach * reach)
+
+    @staticmethod
+    def _values(enemies, name):
+        """Attribut de chaque ennemi, en tableau (None devient NaN)"""
+        return np.fromiter(map(attrgetter(name), enemies), dtype=np.float64, count=len(enemies))
+
+    def separate(self, enemies, params, x, y):
+        """Écarte les ennemis qui se chevauchent (modifie x et y en place)"""
+        n = len(enemies)
+        radius = self._values(enemies, 'radius')
+        self.grid.build(x, y, SpatialGrid.cell_size_for(radius.max()))
+        i, j = self.grid.pairs()
+        dx = x[i] - x[j]
+        dy = y[i] - y[j]
+        reach = radius[i] + radius[j]
+        overlap = np.flatnonzero(dx * dx + dy * dy < reach * reach)
+        i, j, dx, dy, reach = i[overlap], j[overlap], dx[overlap], dy[overlap], reach[overlap]
+        if i.size == 0:
+            self.separated = 0
+            return
+        # Avec le plafond par cellule, une paire peut n'être vue que dans un sens
+        keys = np.sort(np.minimum(i, j) * n + np.maximum(i, j))
+        self.separated = 1 + np.count_nonzero(keys[1:] != keys[:-1])
+        distance = np.sqrt(dx * dx + dy * dy)
+        # Centres confondus : écartés sur l'axe x, dans un sens fixé par leurs index
+        coincident = distance == 0
+        distance[coincident] = 1.0
+        dx[coincident] = np.where(i[coincident] > j[coincident], 1.0, -1.0)
+
+        # Chacun cède selon son poids : un ennemi de poids 0 n'est jamais poussé
+        weight = params[:, SEPARATION]
+        total = weight[i] + weight[j]
+        share = np.divide(weight[i], total, out=np.zeros_like(total), where=total > 0)
+        push = (reach - distance) * share * self.separation / distance
+        push_x = np.bincount(i, weights=dx * push, minlength=n)
+        push_y = np.bincount(i, weights=dy * push, minlength=n)
+
+        # Poussée bornée par tick
+        length = np.sqrt(push_x * push_x + push_y * push_y)
+        scale = np.minimum(1.0, self.max_push / np.maximum(length, 1e-9))
+        x += push_x * scale
+        y += push_y * scale
+
+    @classmethod
+    def steer(cls, enemies, player, crowd=None):
+        """
+        Déplace les ennemis selon leur comportement
+        crowd(enemies, params, x, y) : séparation appliquée aux positions avant de les tenir dans l'écran
+        Retourne (code de comportement, ligne de paramètres, x, y après déplacement) de chacun
+        """
+        enemies = list(enemies)
+        n = len(enemies)
+        codes = np.fromiter(map(STEERING_CODES.__getitem__, map(attrgetter('steering'), enemies)),
+                            dtype=np.int64, count=n)
+        if n == 0:
+            return codes, np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+        rows = np.fromiter(map(steering_parameters.__getitem__, map(type, enemies)), dtype=np.int64, count=n)
+        params = steering_parameters.table[rows]
+        x = cls._values(enemies, 'x')
+        y = cls._values(enemies, 'y')
+        speed = cls._values(enemies, 'speed')
+        dx = player.x - x
+        dy = player.y - y
+        distance = np.sqrt(dx * dx + dy * dy)
+        safe = np.maximum(distance, 0.1)
+        step_x = dx / safe * speed
+        step_y = dy / safe * speed
+
+        # seek : avance au-delà de stop_distance
+        advance = (codes == SEEK) & (safe > params[:, STOP])
+
+        # kite et keep_distance : avance au-delà de far, recule en deçà de near
+        hold = (codes == KITE) | (codes == KEEP)
+        near = params[:, KEEP_NEAR].copy()
+        far = params[:, KEEP_FAR].copy()
+        kite = np.flatnonzero(codes == KITE)
+        if kite.size:
+            # La portée est propre à chaque ennemi
+            far[kite] = cls._values([enemies[i] for i in kite.tolist()], 'attack_range')
+            near[kite] = far[kite] - params[kite, KITE_BAND]
+        beyond = hold & (safe > far)
+        back = hold & ~beyond & (safe < near)
+        advance |= beyond
+        new_x = np.where(advance, x + step_x, np.where(back, x - step_x * params[:, RETREAT], x))
+        new_y = np.where(advance, y + step_y, np.where(back, y - step_y * params[:, RETREAT], y))
+
+        orbit = np.flatnonzero(codes == ORBIT)
+        if orbit.size:
+            cls._orbit([enemies[i] for i in orbit.tolist()], orbit, player, x, y, speed, distance,
+                       step_x, step_y, new_x, new_y)
+
+        if crowd is not None and n > 1:
+            crowd(enemies, params, new_x, new_y)
+
+        # Ennemis tenus dans l'écran
+        kept = np.flatnonzero(~np.isnan(params[:, MARGIN]))
+        if kept.size:
+            settings = enemies[0].settings
+            margin = params[kept, MARGIN] + cls._values([enemies[i] for i in kept.tolist()], 'radius')
+            new_x[kept] = np.maximum(margin, np.minimum(new_x[kept], settings.screen_width - margin))
+            new_y[kept] = np.maximum(margin, np.minimum(new_y[kept], settings.screen_height - margin))
+
+        for enemy, ex, ey in zip(enemies, new_x.tolist(), new_y.tolist()):
+            enemy.x = ex
+            enemy.y = ey
+        tracking = np.flatnonzero(params[:, TRACKS])
+        if tracking.size:
+            for i, to_x, to_y, d in zip(tracking.tolist(), dx[tracking].tolist(), dy[tracking].tolist(),
+                                        distance[tracking].tolist()):
+                enemies[i].to_player = (to_x, to_y, d)
+        return codes, rows, new_x, new_y
+
+    @classmethod
+    def _orbit(cls, group, index, player, x, y, speed, distance, step_x, step_y, new_x, new_y):
+        """orbit : rejoint le cercle autour du joueur, puis avance le long du cercle (écrit dans new_x, new_y)"""
+        x, y, speed, distance = x[index], y[index], speed[index], distance[index]
+        radius = cls._values(group, 'circle_radius')
+        orbiting = distance <= radius
+        angle = cls._values(group, 'circle_angle') + cls._values(group, 'circle_speed')
+        move_x = player.x + np.cos(angle) * radius - x
+        move_y = player.y + np.sin(angle) * radius - y
+        move_distance = np.sqrt(move_x * move_x + move_y * move_y)
+        step = orbiting & (move_distance > 0)
+        # Évite la division par zéro des ennemis qui ne tournent pas
+        move_distance[~step] = 1.0
+        for enemy, value, turned in zip(group, angle.tolist(), orbiting.tolist()):
+            if turned:
+                enemy.circle_angle = value
+        new_x[index] = np.where(orbiting, np.where(step, x + move_x / move_distance * speed, x), x + step_x[index])
+        new_y[index] = np.where(orbiting, np.where(step, y + move_y / move_distance * speed, y), y + step_y[index])
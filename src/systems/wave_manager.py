@@ -1,22 +1,24 @@
 # src/systems/wave_manager.py
-import pygame
 from src.utils.queue import WaveQueue
-import random
+from src.utils.rng import RngStreams
 
 class WaveManager:
     """Gère le déroulement des vagues d'ennemis avec système de file personnalisé"""
     
-    def __init__(self, settings):
+    def __init__(self, settings, rng=None):
         self.settings = settings
-        self.wave_queue = WaveQueue(settings)
-        self.current_wave_enemies = []
+        self.rng = rng if rng is not None else RngStreams()  # Flux aléatoires de la scène
+        self.random = self.rng.waves
+        self.wave_queue = WaveQueue(settings, self.rng)
+        self.current_wave_handles = set()  # Poignées (EntityRegistry) des ennemis de la vague
         self.wave_number = 0
         self.floor_number = 1
         self.enemies_remaining = 0
         self.state = "between_waves"  # between_waves, in_wave, boss_wave, all_cleared
         self.boss_spawned = False
         
-        # Timing des vagues
+        # Timing des vagues (temps de simulation en millisecondes)
+        self.current_time = 0
         self.wave_start_time = 0
         self.time_between_waves = 2000  # 2 secondes entre les vagues
         
@@ -34,11 +36,12 @@ class WaveManager:
         # Configurer les vagues pour cet étage (3 vagues normales)
         self.wave_queue.setup_waves_for_floor(floor_number)
         
-        self.wave_start_time = pygame.time.get_ticks()
-        self.current_wave_enemies.clear()
+        self.wave_start_time = self.current_time
+        self.current_wave_handles.clear()
     
     def update(self, current_time):
         """Met à jour l'état du gestionnaire de vagues"""
+        self.current_time = current_time
         if self.state == "between_waves" and (self.wave_queue.has_more_waves() or (self.wave_number >= 3 and not self.boss_spawned)):
             if current_time - self.wave_start_time >= self.time_between_waves:
                 return True  # Indique qu'une nouvelle vague doit commencer
@@ -73,7 +76,7 @@ class WaveManager:
     
     def start_boss_wave(self):
         """Démarre la vague de boss"""
-        boss_seed = hash((self.floor_number, pygame.time.get_ticks())) % (2**32)
+        boss_seed = self.random.getrandbits(32)
         x, y = self.generate_boss_spawn_position()
         
         self.state = "boss_wave"
@@ -97,28 +100,28 @@ class WaveManager:
         
         max_attempts = 10
         for _ in range(max_attempts):
-            side = random.randint(0, 3)
+            side = self.random.randint(0, 3)
             
             if side == 0:  # Haut
-                x = random.randint(left, right)
+                x = self.random.randint(left, right)
                 y = top
             elif side == 1:  # Droite
                 x = right
-                y = random.randint(top, bottom)
+                y = self.random.randint(top, bottom)
             elif side == 2:  # Bas
-                x = random.randint(left, right)
+                x = self.random.randint(left, right)
                 y = bottom
             else:  # Gauche
                 x = left
-                y = random.randint(top, bottom)
+                y = self.random.randint(top, bottom)
             
             distance_to_center = ((x - center_x)**2 + (y - center_y)**2)**0.5
             if distance_to_center > center_margin:
                 return x, y
         
         # Fallback
-        x = random.randint(left, right)
-        y = random.randint(top, bottom)
+        x = self.random.randint(left, right)
+        y = self.random.randint(top, bottom)
         return x, y
     
     def generate_boss_spawn_position(self):
@@ -128,10 +131,14 @@ class WaveManager:
         y = self.settings.screen_height // 2
         return x, y
     
+    def on_enemy_spawned(self, enemy):
+        """Appelé quand un ennemi de la vague apparaît (après son enregistrement)"""
+        self.current_wave_handles.add(enemy.handle)
+    
     def on_enemy_died(self, enemy):
         """Appelé quand un ennemi meurt"""
-        if enemy in self.current_wave_enemies:
-            self.current_wave_enemies.remove(enemy)
+        if enemy.handle in self.current_wave_handles:
+            self.current_wave_handles.remove(enemy.handle)
             self.enemies_remaining -= 1
             
             if self.enemies_remaining <= 0:
@@ -140,7 +147,7 @@ class WaveManager:
     def on_wave_cleared(self):
         """Appelé quand une vague est terminée"""
         self.state = "between_waves"
-        self.wave_start_time = pygame.time.get_ticks()
+        self.wave_start_time = self.current_time
         
         # Si c'était le boss, l'étage est terminé
         if self.boss_spawned and self.enemies_remaining == 0:
@@ -177,18 +184,17 @@ class WaveManager:
 
     def on_enemy_divided(self, original_enemy, new_enemies):
         """
-        Appelé quand un boss se divise
+        Appelé quand un boss se divise (les nouveaux bosses sont déjà enregistrés)
         """
-        # Retirer le boss original des listes
-        if original_enemy in self.current_wave_enemies:
-            self.current_wave_enemies.remove(original_enemy)
+        # Retirer le boss original de la vague
+        self.current_wave_handles.discard(original_enemy.handle)
         
-        # Ajouter les nouveaux bosses aux listes
+        # Ajouter les nouveaux bosses à la vague
         for new_enemy in new_enemies:
-            self.current_wave_enemies.append(new_enemy)
+            self.current_wave_handles.add(new_enemy.handle)
         
         # Mettre à jour le compteur d'ennemis restants
-        self.enemies_remaining = len(self.current_wave_enemies)
+        self.enemies_remaining = len(self.current_wave_handles)
     
     def is_boss_wave_current(self):
         """Retourne True si c'est le moment du boss"""
@@ -196,5 +202,5 @@ class WaveManager:
     
     def reset(self):
         """Réinitialise complètement le wave manager"""
-        self.wave_queue = WaveQueue(self.settings)
+        self.wave_queue = WaveQueue(self.settings, self.rng)
         self.reset_to_floor(1)
\ No newline at end of file
@@ -3,6 +3,7 @@ from .game_over_ui import GameOverUI
 from .hud import HUD
 from .pause_ui import PauseUI
 from .perks_ui import PerksUI
+from .profiler_overlay import ProfilerOverlay
 from .transition_effect import TransitionEffect
 from .stat_ui import StatUI
 
@@ -11,6 +12,7 @@ __all__ = [
     "HUD",
     "PauseUI",
     "PerksUI",
+    "ProfilerOverlay",
     "TransitionEffect",
     "StatUI"
 ]
\ No newline at end of file
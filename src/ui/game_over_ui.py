@@ -1,5 +1,7 @@
 # src/ui/game_over_ui
 import pygame
+from src.utils.assets import assets
+from src.utils.text_cache import text_cache
 
 class GameOverUI:
     """
@@ -11,19 +13,17 @@ class GameOverUI:
         
         self.stats_rect = pygame.Rect(self.settings.screen_width*0.1, self.settings.screen_height*0.1, self.settings.screen_width*0.8, self.settings.screen_height*0.8)
 
-        self.stats_text = self.settings.font["h1"].render(f"Score :{self.game_stats["score"]}", True, (250, 0, 0))
+        self.stats_text = text_cache.render(self.settings.font["h1"], f"Score :{self.game_stats["score"]}", True, (250, 0, 0))
         self.stats_text_rect = self.stats_text.get_rect(center=(self.stats_rect.center[0], self.settings.screen_height*0.15))
 
     def draw(self, screen, quit_button, quit_rect, quit_text):
         """Dessine l'interface complète"""
         #met une image de fond
-        bg_image = pygame.image.load(r"assets/images/background/gameover_scene.png")        
-        bg_image = pygame.transform.scale(bg_image, (self.settings.screen_width, self.settings.screen_height))
+        bg_image = assets.scaled(r"assets/images/background/gameover_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
         screen.blit(bg_image, (0, 0))
         screen.blit(self.stats_text, self.stats_text_rect)
         #dessine le bouton quitter
-        bg_image2 = pygame.image.load(r"assets/images/cadre.png")
-        bg_image2 = pygame.transform.scale(bg_image2, (quit_button.width, quit_button.height))
+        bg_image2 = assets.scaled(r"assets/images/cadre.png", (quit_button.width, quit_button.height))
         screen.blit(bg_image2, quit_button)
         screen.blit(quit_text, quit_rect)
 
@@ -1,6 +1,7 @@
 # src/ui/hud.py
 import pygame
 import math
+from src.utils.text_cache import text_cache
 
 class HUD:
     def __init__(self, player, wave_manager, weapon, settings):
@@ -18,7 +19,7 @@ class HUD:
         self.pulse_speed = 0.05
         
         # Police pour les petites infos
-        self.small_font = pygame.font.Font(None, 20)
+        self.small_font = self.settings.get_font(20)
     
     def update(self, dt):
         """Met à jour les animations du HUD"""
@@ -75,7 +76,7 @@ class HUD:
                         1, border_radius=self.corner_radius)
         
         # Texte santé
-        health_text = self.settings.font["h3"].render(
+        health_text = text_cache.render(self.settings.font["h3"], 
             f"{int(self.player.health)}/{self.player.max_health}", 
             True, (255, 255, 255)
         )
@@ -112,7 +113,7 @@ class HUD:
         
         # Texte
         status = "PRÊT" if is_ready else f"{(self.player.dash_cooldown/60):.1f}s"
-        dash_text = self.settings.font["h4"].render(
+        dash_text = text_cache.render(self.settings.font["h4"], 
             f"DASH: {status}", 
             True, (200, 200, 255)
         )
@@ -127,7 +128,7 @@ class HUD:
         info_y = self.margin
         
         # Étage
-        floor_text = self.settings.font["h2"].render(
+        floor_text = text_cache.render(self.settings.font["h2"], 
             f"Étage {wave_info['floor']}", 
             True, (255, 215, 0)
         )
@@ -136,7 +137,7 @@ class HUD:
         # Type de vague - AFFICHAGE SIMPLIFIÉ
         if wave_info['is_boss_wave']:
             # BOSS
-            wave_text = self.settings.font["h3"].render(
+            wave_text = text_cache.render(self.settings.font["h3"], 
                 "BOSS", 
                 True, (255, 50, 50)
             )
@@ -145,13 +146,13 @@ class HUD:
             current_wave = wave_info['current_wave']
             if current_wave == 0:
                 # Entre les vagues, afficher la prochaine
-                wave_text = self.settings.font["h3"].render(
+                wave_text = text_cache.render(self.settings.font["h3"], 
                     "Préparation", 
                     True, (255, 255, 100)
                 )
             else:
                 # Pendant une vague normale
-                wave_text = self.settings.font["h3"].render(
+                wave_text = text_cache.render(self.settings.font["h3"], 
                     f"Vague {current_wave}/3", 
                     True, (100, 150, 255)
                 )
@@ -179,7 +180,7 @@ class HUD:
             state_text = wave_info['state']
             state_color = self.settings.WHITE
         
-        state_display = self.settings.font["h3"].render(state_text, True, state_color)
+        state_display = text_cache.render(self.settings.font["h3"], state_text, True, state_color)
         screen.blit(state_display, (info_x, info_y + 65))
     
     def draw_aim_indicator(self, screen):
@@ -210,7 +211,7 @@ class HUD:
         
         # Texte
         status = "Prêt" if stationary_percent >= 1.0 else f"{int(stationary_percent * 100)}%"
-        aim_text = self.settings.font["h4"].render(
+        aim_text = text_cache.render(self.settings.font["h4"], 
             f"Visée: {status}", 
             True, (200, 220, 255)
         )
@@ -234,21 +235,21 @@ class HUD:
             type_text = "Normale"
             type_color = (100, 200, 100)
         
-        type_display = self.settings.font["h3"].render(type_text, True, type_color)
+        type_display = text_cache.render(self.settings.font["h3"], type_text, True, type_color)
         screen.blit(type_display, (info_x, info_y))
         
         # Vagues normales terminées
         if not wave_info['is_boss_wave']:
             completed_waves = wave_info['current_wave']
             waves_text = f"Vagues: {completed_waves}/3"
-            waves_display = self.settings.font["h4"].render(
+            waves_display = text_cache.render(self.settings.font["h4"], 
                 waves_text, 
                 True, (200, 200, 200)
             )
             screen.blit(waves_display, (info_x, info_y + 30))
         else:
             boss_text = "BOSS en cours"
-            boss_display = self.settings.font["h4"].render(
+            boss_display = text_cache.render(self.settings.font["h4"], 
                 boss_text, 
                 True, (255, 100, 100)
             )
@@ -259,21 +260,21 @@ class HUD:
         info_y = self.settings.screen_height - 40
         
         # Score
-        score_text = self.settings.font["h4"].render(
+        score_text = text_cache.render(self.settings.font["h4"], 
             f"Score: {self.player.score}", 
             True, (255, 255, 255)
         )
         screen.blit(score_text, (self.margin, info_y))
         
         # XP
-        xp_text = self.settings.font["h4"].render(
+        xp_text = text_cache.render(self.settings.font["h4"], 
             f"XP: {self.player.xp}/200", 
             True, (200, 200, 255)
         )
         screen.blit(xp_text, (self.margin + 150, info_y))
         
         # Instructions 
-        instructions = self.small_font.render(
+        instructions = text_cache.render(self.small_font, 
             "ZQSD: Déplacer • Stop: Viser • X: Dash • ESC: Menu", 
             True, (150, 150, 150)
         )
@@ -1,5 +1,6 @@
 # src/ui/pause_ui
 import pygame
+from src.utils.assets import assets
 
 class PauseUI:
     def __init__(self, game_stats:dict, settings):
@@ -13,25 +14,21 @@ class PauseUI:
         Dessine l'interface complète
         """        
         # Met une image de fond
-        bg_image = pygame.image.load(r"assets/images/background/pause_scene.png")
-        bg_image = pygame.transform.scale(bg_image, (self.settings.screen_width, self.settings.screen_height))
+        bg_image = assets.scaled(r"assets/images/background/pause_scene.png", (self.settings.screen_width, self.settings.screen_height), alpha=False)
         screen.blit(bg_image, (0, 0))
 
         # Met le bouton quitter
-        bg_image = pygame.image.load(r"assets/images/cadre.png")
-        bg_image = pygame.transform.scale(bg_image, (exit_rect.width, exit_rect.height))
+        bg_image = assets.scaled(r"assets/images/cadre.png", (exit_rect.width, exit_rect.height))
         screen.blit(bg_image, exit_rect)
         screen.blit(exit_text, exit_text_rect)
 
         # Met le bouton menu
-        bg_image = pygame.image.load(r"assets/images/cadre.png")
-        bg_image = pygame.transform.scale(bg_image, (back_to_menu_rect.width, back_to_menu_rect.height))
+        bg_image = assets.scaled(r"assets/images/cadre.png", (back_to_menu_rect.width, back_to_menu_rect.height))
         screen.blit(bg_image, back_to_menu_rect)
         screen.blit(back_to_menu_text, back_to_menu_text_rect)   
 
         # Met les stats #
-        bg_image = pygame.image.load(r"assets/images/cadre.png")
-        bg_image = pygame.transform.scale(bg_image, (stat_rect.width, stat_rect.height))
+        bg_image = assets.scaled(r"assets/images/cadre.png", (stat_rect.width, stat_rect.height))
         screen.blit(bg_image, stat_rect)
         screen.blit(stat_text, stat_text_rect)     
 
@@ -0,0 +1,102 @@
+# src/ui/profiler_overlay.py
+import pygame
+
+class ProfilerOverlay:
+    """
+    Panneau du profileur (touche F3)
+    Affiche moyenne, p95 et max de chaque étape, le nombre d'entités et le
+    graphe défilant des durées d'image par rapport au budget de 16,6 ms
+    """
+    def __init__(self, profiler, settings, refresh_interval=10):
+        self.profiler = profiler
+        self.settings = settings
+        self.refresh_interval = refresh_interval  # Images entre deux mises à jour du texte
+        self.lines = []  # Par ligne : surfaces des cellules (nom, moy, p95, max)
+        self.last_refresh = -refresh_interval
+
+        self.margin = 10
+        self.line_height = 16
+        self.width = 330
+        self.columns = (120, 60, 0)  # Bord droit des colonnes moy, p95 et max (depuis la droite)
+        self.graph_height = 60
+        self.budget_ms = 1000 / settings.fps
+
+    def _ordered_stages(self):
+        """Étapes dans l'ordre d'affichage : chaque étape suivie de ses sous-étapes"""
+        summary = self.profiler.summary()
+        ordered = []
+        for stage in summary:
+            if "/" not in stage:
+                ordered.append(stage)
+                ordered.extend(child for child in summary if child.startswith(stage + "/"))
+        # Sous-étapes dont le parent n'est pas mesuré (simulation sans rendu)
+        ordered.extend(stage for stage in summary if stage not in ordered)
+        return [(stage, summary[stage]) for stage in ordered]
+
+    def _refresh(self):
+        """Refait les lignes de texte (pas à chaque image : les chiffres resteraient illisibles)"""
+        font = self.settings.get_font(18)
+        white = (255, 255, 255)
+        rows = [(("étape", "moy", "p95", "max ms"), white)]
+
+        frame = self.profiler.frame_summary()
+        if frame:
+            color = (255, 90, 90) if frame["p95"] > self.budget_ms else (120, 255, 120)
+            rows.append((("image", frame["mean"], frame["p95"], frame["max"]), color))
+
+        for stage, stats in self._ordered_stages():
+            # Les sous-étapes sont indentées sous leur étape parent
+            name = "   " + stage.split("/", 1)[1] if "/" in stage else stage
+            rows.append(((name, stats["mean"], stats["p95"], stats["max"]), (220, 220, 220)))
+
+        # Rendu direct : ces textes changent sans cesse et satureraient le cache partagé
+        self.lines = [
+            [font.render(cell if isinstance(cell, str) else f"{cell:.2f}", True, color) for cell in cells]
+            for cells, color in rows
+        ]
+        if self.profiler.counts:
+            counts = "  ".join(f"{name} {value}" for name, value in self.profiler.counts.items())
+            self.lines.append([font.render(counts, True, (180, 200, 255))])
+        self.last_refresh = self.profiler.frames
+
+    def draw(self, screen):
+        """Dessine le panneau en haut à droite"""
+        if not self.profiler.enabled:
+            return
+        if self.profiler.frames - self.last_refresh >= self.refresh_interval or not self.lines:
+            self._refresh()
+
+        width = max([self.width] + [line[0].get_width() + 2 * self.margin for line in self.lines if len(line) == 1])
+        height = len(self.lines) * self.line_height + self.graph_height + 3 * self.margin
+        x = screen.get_width() - width - self.margin
+        y = self.margin
+
+        # Fond semi-transparent
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        screen.blit(panel, (x, y))
+
+        # Nom à gauche, chiffres alignés à droite de leur colonne
+        for i, cells in enumerate(self.lines):
+            line_y = y + self.margin + i * self.line_height
+            screen.blit(cells[0], (x + self.margin, line_y))
+            for column, cell in zip(self.columns, cells[1:]):
+                screen.blit(cell, (x + width - self.margin - column - cell.get_width(), line_y))
+
+        self._draw_graph(screen, x + self.margin, y + height - self.margin - self.graph_height,
+                         width - 2 * self.margin, self.graph_height)
+
+    def _draw_graph(self, screen, x, y, width, height):
+        """Graphe défilant des durées d'image (échelle : deux fois le budget)"""
+        pygame.draw.rect(screen, (60, 60, 60), (x, y, width, height), 1)
+        scale = height / (2 * self.budget_ms)
+        budget_y = y + height - int(self.budget_ms * scale)
+        pygame.draw.line(screen, (255, 200, 0), (x, budget_y), (x + width - 1, budget_y))
+
+        times = list(self.profiler.frame_times)[-width:]
+        start_x = x + width - len(times)
+        for i, frame_ns in enumerate(times):
+            frame_ms = frame_ns / 1e6
+            bar = min(height, int(frame_ms * scale))
+            color = (255, 90, 90) if frame_ms > self.budget_ms else (120, 255, 120)
+            pygame.draw.line(screen, color, (start_x + i, y + height - 1), (start_x + i, y + height - bar))
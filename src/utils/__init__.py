@@ -1,6 +1,18 @@
 # src/utils/__init__.py
+from .assets import AssetManager, assets
+from .pattern_cache import PatternCache, pattern_cache
 from .queue import Queue
+from .sprite_cache import CircleSpriteCache, circle_cache
+from .text_cache import TextCache, text_cache
 
 __all__ = [
-    "Queue"
-]
\ No newline at end of file
+    "AssetManager",
+    "assets",
+    "PatternCache",
+    "pattern_cache",
+    "Queue",
+    "CircleSpriteCache",
+    "circle_cache",
+    "TextCache",
+    "text_cache"
+]
@@ -0,0 +1,87 @@
+# src/utils/assets.py
+import os
+import pygame
+
+class AssetManager:
+    """
+    Gestionnaire d'images partagé
+    Chaque fichier est chargé une seule fois, converti au format de l'écran dès
+    qu'une fenêtre existe, et ses versions redimensionnées sont gardées en cache
+    """
+    def __init__(self):
+        self.paths = {}  # chemin demandé -> chemin normalisé
+        self.images = {}  # (chemin, alpha) -> surface
+        self.converted = set()  # Images déjà converties au format de l'écran
+        self.scaled_images = {}  # (chemin, alpha, taille, lissage) -> surface
+        self.loads = 0  # Nombre de lectures sur le disque
+
+    def normalize(self, path):
+        """Chemin normalisé (mémorisé pour éviter un accès disque à chaque image)"""
+        normalized = self.paths.get(path)
+        if normalized is None:
+            normalized = self._normalize(path)
+            self.paths[path] = normalized
+        return normalized
+
+    @staticmethod
+    def _normalize(path):
+        """
+        Normalise un chemin : séparateurs Windows remplacés, et casse du nom de
+        fichier corrigée si besoin (Windows ignore la casse, Linux non)
+        """
+        path = os.path.normpath(path.replace("\\", "/")).replace(os.sep, "/")
+        if not os.path.exists(path):
+            folder, name = os.path.split(path)
+            if os.path.isdir(folder or "."):
+                for candidate in os.listdir(folder or "."):
+                    if candidate.lower() == name.lower():
+                        return f"{folder}/{candidate}" if folder else candidate
+        return path
+
+    def image(self, path, alpha=True):
+        """Retourne l'image (chargée une seule fois)"""
+        key = (self.normalize(path), alpha)
+        surface = self.images.get(key)
+        if surface is None:
+            surface = pygame.image.load(key[0])
+            self.images[key] = surface
+            self.loads += 1
+
+        # Conversion au format d'affichage, une seule fois, dès qu'une fenêtre existe
+        if key not in self.converted and pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            self.images[key] = surface
+            self.converted.add(key)
+            # Les versions redimensionnées avant la conversion sont refaites
+            for scaled_key in [k for k in self.scaled_images if k[:2] == key]:
+                del self.scaled_images[scaled_key]
+        return surface
+
+    def scaled(self, path, size, alpha=True, smooth=False):
+        """Retourne l'image redimensionnée (cache par taille cible)"""
+        size = (max(0, int(size[0])), max(0, int(size[1])))
+        key = (self.normalize(path), alpha, size, smooth)
+        surface = self.scaled_images.get(key)
+        if surface is None:
+            base = self.image(path, alpha)
+            if smooth:
+                surface = pygame.transform.smoothscale(base, size)
+            else:
+                surface = pygame.transform.scale(base, size)
+            self.scaled_images[key] = surface
+        return surface
+
+    def invalidate_scaled(self):
+        """Oublie les versions redimensionnées (appelé quand la fenêtre change de taille)"""
+        self.scaled_images.clear()
+
+    def clear(self):
+        """Vide tout le cache"""
+        self.paths.clear()
+        self.images.clear()
+        self.converted.clear()
+        self.scaled_images.clear()
+
+
+# Gestionnaire partagé par tout le jeu
+assets = AssetManager()
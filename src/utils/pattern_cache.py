@@ -0,0 +1,57 @@
+# src/utils/pattern_cache.py
+from collections import OrderedDict
+
+class PatternCache:
+    """
+    Cache LRU des templates de patterns d'attaque
+    Clé (pattern, paramètres de forme) : la géométrie d'un pattern (tables de
+    cos/sin, positions et vitesses unitaires) n'est calculée qu'une fois, puis
+    chaque salve la translate, la tourne et la met à l'échelle.
+    Les templates sont partagés et ne doivent pas être modifiés par l'appelant
+    """
+    def __init__(self, max_entries=64):
+        self.templates = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build, *args):
+        """Retourne le template de la clé, construit par build(*args) s'il est absent"""
+        template = self.templates.get(key)
+        if template is not None:
+            self.templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+        self.misses += 1
+        template = build(*args)
+        self.templates[key] = template
+
+        # Éviction du template le moins récemment utilisé
+        if len(self.templates) > self.max_entries:
+            self.templates.popitem(last=False)
+            self.evictions += 1
+        return template
+
+    def clear(self):
+        """Vide le cache (les compteurs sont gardés)"""
+        self.templates.clear()
+
+    def stats(self):
+        """Compteurs du cache (pour le profilage)"""
+        lookups = self.hits + self.misses
+        return {
+            "templates": len(self.templates),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def __len__(self):
+        return len(self.templates)
+
+
+# Cache partagé par tous les boss
+pattern_cache = PatternCache()
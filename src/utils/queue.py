@@ -1,5 +1,5 @@
 # src/utils/queue.py
-from random import choices
+from src.utils.rng import RngStreams
 
 class Queue:
     """
@@ -45,9 +45,10 @@ class WaveQueue:
         [15, 20, 20, 15, 10, 20],    # Vague 3
     ]
     
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, rng=None):
         self.waves = Queue()
         self.settings = settings
+        self.random = (rng if rng is not None else RngStreams()).waves  # Flux des vagues de la scène
     
     def generate_normal_wave(self, floor_number, wave_number):
         """Génère une vague d'ennemis normaux basée sur l'étage et le numéro de vague"""
@@ -61,11 +62,11 @@ class WaveQueue:
         wave_bonus = (wave_number - 1) * 2
         
         enemy_count = base_enemies + floor_bonus + wave_bonus
-        enemy_count = min(enemy_count, 15)  # Limiter à 15 ennemis max
+        enemy_count = min(enemy_count, getattr(self.settings, 'WAVE_MAX_ENEMIES', 15))  # 15 ennemis max par défaut
         
         enemies = []
         for _ in range(enemy_count):
-            enemy_type_index = choices(
+            enemy_type_index = self.random.choices(
                 population=range(len(self.ENEMY_TYPES)), 
                 weights=weights,
                 k=1
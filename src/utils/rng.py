@@ -0,0 +1,51 @@
+# src/utils/rng.py
+import random
+import hashlib
+
+
+def derive_seed(seed, key):
+    """
+    Graine 64 bits stable dérivée d'une seed et d'une clé
+    (blake2b : identique d'un lancement et d'une machine à l'autre, contrairement à hash())
+    """
+    digest = hashlib.blake2b(f"{seed}/{key}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def child_random(seed, key):
+    """Générateur indépendant pour une entité (ex. un boss et sa propre seed)"""
+    return random.Random(derive_seed(seed, key))
+
+
+class RngStreams:
+    """
+    Flux aléatoires nommés d'une partie, chacun avec sa graine dérivée de la seed de la partie
+    Chaque scène possède les siens et les passe à ses sous-systèmes : deux parties
+    d'un même processus ne tirent jamais dans les flux l'une de l'autre
+    """
+    def __init__(self, seed=0):
+        self.seed = seed
+        self.generators = {}
+        
+        # Flux de la simulation : chacun ne dépend que de la seed et de ses propres tirages
+        self.waves = self.stream("waves")  # Composition des vagues, positions d'apparition, seeds des boss
+        self.enemies = self.stream("enemies")  # Comportement des ennemis (pyromane)
+        self.weapon = self.stream("weapon")  # Dégâts de l'arme
+        self.perks = self.stream("perks")  # Perks proposés
+        self.bot = self.stream("bot")  # Choix automatiques de la simulation sans fenêtre
+        
+        # Flux cosmétique : particules et sons n'influencent jamais la partie
+        self.fx = self.stream("fx")
+    
+    def stream(self, name):
+        """Flux aléatoire d'un sous-système (créé au premier appel, resemé à chaque partie)"""
+        generator = self.generators.get(name)
+        if generator is None:
+            generator = self.generators[name] = random.Random(derive_seed(self.seed, name))
+        return generator
+    
+    def seed_all(self, seed):
+        """Resème tous les flux pour une nouvelle partie (les générateurs restent les mêmes objets)"""
+        self.seed = seed
+        for name, generator in self.generators.items():
+            generator.seed(derive_seed(seed, name))
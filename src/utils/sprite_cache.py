@@ -0,0 +1,77 @@
+# src/utils/sprite_cache.py
+from collections import OrderedDict
+import pygame
+
+class CircleSpriteCache:
+    """
+    Cache LRU de cercles transparents pré-rendus
+    Chaque sprite est une surface RGBA clé (rayon, couleur, palier d'alpha, épaisseur) :
+    un glow ou une particule devient un simple blit au lieu d'une surface créée par image
+    """
+    def __init__(self, max_bytes=8 * 1024 * 1024, alpha_step=8):
+        self.sprites = OrderedDict()
+        self.max_bytes = max_bytes  # Plafond mémoire (4 octets par pixel)
+        self.alpha_step = alpha_step  # Alpha arrondi par paliers pour limiter les variantes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _alpha_bucket(self, alpha):
+        bucket = int(round(alpha / self.alpha_step)) * self.alpha_step
+        return max(0, min(255, bucket))
+
+    def get(self, radius, color, alpha=255, width=0):
+        """Retourne le sprite du cercle (taille 2 * rayon), ou None si le rayon est nul"""
+        radius = int(radius)
+        if radius <= 0:
+            return None
+
+        key = (radius, tuple(color[:3]), self._alpha_bucket(alpha), width)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*key[1], key[2]), (radius, radius), radius, width)
+        self.sprites[key] = sprite
+        self.bytes += radius * radius * 16
+
+        # Éviction des sprites les moins récemment utilisés
+        while self.bytes > self.max_bytes and len(self.sprites) > 1:
+            (old_radius, _, _, _), _ = self.sprites.popitem(last=False)
+            self.bytes -= old_radius * old_radius * 16
+            self.evictions += 1
+        return sprite
+
+    def blit(self, screen, x, y, radius, color, alpha=255, width=0):
+        """Dessine le cercle centré en (x, y)"""
+        sprite = self.get(radius, color, alpha, width)
+        if sprite is not None:
+            radius = int(radius)
+            screen.blit(sprite, (int(x - radius), int(y - radius)))
+
+    def clear(self):
+        """Vide le cache (les compteurs sont gardés)"""
+        self.sprites.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Compteurs du cache (pour le profilage)"""
+        return {
+            "sprites": len(self.sprites),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def __len__(self):
+        return len(self.sprites)
+
+
+# Cache partagé par toutes les entités du jeu
+circle_cache = CircleSpriteCache()
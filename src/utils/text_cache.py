@@ -0,0 +1,58 @@
+# src/utils/text_cache.py
+from collections import OrderedDict
+
+class TextCache:
+    """
+    Cache LRU des textes rendus
+    Clé (police, texte, antialiasing, couleur, fond) : un texte qui ne change pas
+    n'est rendu qu'une fois. Les surfaces rendues sont partagées et ne doivent
+    pas être modifiées par l'appelant
+    """
+    def __init__(self, max_entries=512):
+        self.surfaces = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Même signature que pygame.font.Font.render, police en premier"""
+        key = (
+            font, text, antialias, tuple(color),
+            tuple(background) if background is not None else None
+        )
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+
+        # Éviction du texte le moins récemment utilisé
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Vide le cache (les compteurs sont gardés)"""
+        self.surfaces.clear()
+
+    def stats(self):
+        """Compteurs du cache (pour le profilage)"""
+        return {
+            "texts": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def __len__(self):
+        return len(self.surfaces)
+
+
+# Cache partagé par tout le jeu
+text_cache = TextCache()
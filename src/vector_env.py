@@ -0,0 +1,221 @@
+# src/vector_env.py
+"""
+Plusieurs environnements TowerEnv répartis sur des processus de travail
+Observations, récompenses, fins d'épisode et actions sont échangées par un bloc
+de mémoire partagée : le processus principal les lit sans copie ni pickle
+Mesure du débit : python -m src.vector_env --envs 8 --max-workers 4 --steps 2000
+"""
+import os
+import argparse
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from src.env import TowerEnv
+from src.utils.rng import derive_seed
+
+
+def episode_seed(seed, env_index, episode):
+    """Seed d'un épisode : ne dépend ni du nombre de processus ni de l'ordre d'exécution"""
+    return derive_seed(seed, f"env/{env_index}/{episode}") & 0xFFFFFFFF
+
+
+def _attach(name):
+    """Ouvre un bloc existant sans le confier au resource_tracker du processus de travail"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedBuffers:
+    """
+    Vues NumPy sur un bloc de mémoire partagée :
+    observations (envs, taille), récompenses, actions, terminé, tronqué
+    """
+    def __init__(self, shm, num_envs, observation_size):
+        self.shm = shm
+        offset = 0
+        views = {}
+        # Les champs de 4 octets d'abord : ils restent alignés
+        for name, dtype, shape in (
+            ("observations", np.float32, (num_envs, observation_size)),
+            ("rewards", np.float32, (num_envs,)),
+            ("actions", np.int32, (num_envs,)),
+            ("terminated", np.bool_, (num_envs,)),
+            ("truncated", np.bool_, (num_envs,)),
+        ):
+            views[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            offset += views[name].nbytes
+        self.observations = views["observations"]
+        self.rewards = views["rewards"]
+        self.actions = views["actions"]
+        self.terminated = views["terminated"]
+        self.truncated = views["truncated"]
+
+    @staticmethod
+    def size(num_envs, observation_size):
+        """Taille du bloc en octets"""
+        return num_envs * (observation_size * 4 + 4 + 4 + 1 + 1)
+
+
+def _worker(conn, shm_name, env_indices, num_envs, observation_size, seed, env_kwargs):
+    """
+    Boucle d'un processus de travail : fait avancer ses environnements à chaque
+    commande et écrit les résultats directement dans la mémoire partagée
+    Chaque environnement a sa scène et ses flux aléatoires : les regrouper dans un
+    même processus ne change aucun résultat
+    """
+    shm = _attach(shm_name)
+    buffers = SharedBuffers(shm, num_envs, observation_size)
+    envs = {i: TowerEnv(**env_kwargs) for i in env_indices}
+    episodes = dict.fromkeys(env_indices, 0)
+    try:
+        while True:
+            command = conn.recv()
+            if command == "step":
+                for i, env in envs.items():
+                    observation, reward, terminated, truncated, _ = env.step(int(buffers.actions[i]))
+                    buffers.rewards[i] = reward
+                    buffers.terminated[i] = terminated
+                    buffers.truncated[i] = truncated
+                    # Fin d'épisode : nouvelle partie aussitôt, sa première observation est renvoyée
+                    if terminated or truncated:
+                        episodes[i] += 1
+                        observation, _ = env.reset(episode_seed(seed, i, episodes[i]))
+                    buffers.observations[i] = observation
+            elif command == "reset":
+                for i, env in envs.items():
+                    episodes[i] = 0
+                    observation, _ = env.reset(episode_seed(seed, i, 0))
+                    buffers.observations[i] = observation
+                    buffers.rewards[i] = 0
+                    buffers.terminated[i] = False
+                    buffers.truncated[i] = False
+            elif command == "close":
+                break
+            conn.send(None)
+    finally:
+        del buffers
+        shm.close()
+
+
+class VectorTowerEnv:
+    """
+    `num_envs` environnements avancés en même temps sur `num_workers` processus
+    step(actions) écrit les actions dans la mémoire partagée, réveille tous les
+    processus et attend qu'ils aient fini : les tableaux retournés sont des vues
+    sur la mémoire partagée (réécrites au pas suivant : les copier pour les garder).
+    Un épisode terminé est relancé aussitôt avec la seed suivante de cet environnement
+    """
+    def __init__(self, num_envs, num_workers=None, seed=0, **env_kwargs):
+        self.num_envs = num_envs
+        self.num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_envs))
+        self.seed = seed
+        self.observation_size = TowerEnv.observation_size(**{
+            key: value for key, value in env_kwargs.items()
+            if key in ("n_enemies", "n_projectiles", "n_zones")
+        })
+        self.n_actions = TowerEnv.N_ACTIONS
+
+        self.shm = shared_memory.SharedMemory(create=True, size=SharedBuffers.size(num_envs, self.observation_size))
+        self.buffers = SharedBuffers(self.shm, num_envs, self.observation_size)
+
+        # Environnements répartis en tranches contiguës
+        # "spawn" : le processus principal peut déjà avoir des threads (SDL), fork serait risqué
+        context = mp.get_context("spawn")
+        self.connections = []
+        self.processes = []
+        self.closed = False
+        try:
+            for chunk in np.array_split(np.arange(num_envs), self.num_workers):
+                parent, child = context.Pipe()
+                process = context.Process(
+                    target=_worker,
+                    args=(child, self.shm.name, chunk.tolist(), num_envs, self.observation_size, seed, env_kwargs),
+                    daemon=True
+                )
+                process.start()
+                child.close()
+                self.connections.append(parent)
+                self.processes.append(process)
+        except BaseException:
+            # Sans cela le bloc de mémoire partagée resterait alloué
+            self.close()
+            raise
+
+    def _broadcast(self, command):
+        """Envoie la commande à tous les processus puis attend qu'ils aient tous fini"""
+        for conn in self.connections:
+            conn.send(command)
+        for conn in self.connections:
+            conn.recv()
+
+    def reset(self):
+        """Relance tous les environnements ; retourne les observations (vue partagée)"""
+        self._broadcast("reset")
+        return self.buffers.observations
+
+    def step(self, actions):
+        """Un pas de tous les environnements ; retourne (observations, récompenses, terminé, tronqué)"""
+        self.buffers.actions[:] = actions
+        self._broadcast("step")
+        buffers = self.buffers
+        return buffers.observations, buffers.rewards, buffers.terminated, buffers.truncated
+
+    def close(self):
+        """Arrête les processus et libère la mémoire partagée"""
+        if self.closed:
+            return
+        self.closed = True
+        for conn in self.connections:
+            try:
+                conn.send("close")
+            except OSError:
+                pass  # Processus déjà arrêté
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        del self.buffers
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def benchmark(num_envs, worker_counts, steps, seed=0):
+    """Pas d'environnement par seconde pour chaque nombre de processus (actions aléatoires)"""
+    results = {}
+    rng = np.random.default_rng(seed)
+    for workers in worker_counts:
+        with VectorTowerEnv(num_envs, workers, seed) as env:
+            env.reset()
+            start = time.perf_counter()
+            for _ in range(steps):
+                env.step(rng.integers(0, env.n_actions, num_envs))
+            elapsed = time.perf_counter() - start
+        results[workers] = round(num_envs * steps / elapsed)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Débit de l'environnement vectorisé de Tour Maudite")
+    parser.add_argument("--envs", type=int, default=8, help="Nombre d'environnements")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="Mesure de 1 à N processus")
+    parser.add_argument("--steps", type=int, default=2000, help="Pas par mesure")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.envs, range(1, args.max_workers + 1), args.steps, args.seed)
+    for workers, steps_per_second in results.items():
+        print(f"{workers} processus : {steps_per_second} pas/s")
+    return results
+
+
+if __name__ == "__main__":
+    main()
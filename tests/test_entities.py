@@ -1,8 +1,16 @@
 # tests/test_entities.py
+import pygame
+import random
+import numpy as np
 from src.entities.player import Player
 from src.entities.projectiles import Projectile
+from src.entities.projectile_batch import ProjectileBatch, SPECIAL_HOMING
+from src.entities.weapons import Weapon
+from src.systems.enemy_index import EnemyIndex
+from src.entities.projectile_renderer import ProjectileRenderer
 from src.entities.enemies.basic import Basic
 from src.entities.enemies.suicide import Suicide
+from src.entities.enemies.boss import RecursivePatternGenerator
 from src.entities.spawn_effect import SpawnEffect
 
 def test_player_movement():
@@ -92,31 +100,213 @@ def test_player_movement():
     assert player.keys_pressed['down'] == False
     
 def test_projectile_basic():
-    """Test des projectiles de base"""
+    """Test des fiches de projectile, copiées dans un lot"""
     class MockSettings:
         screen_width = 800
         screen_height = 600
     
-    settings = MockSettings()
-    
     # Test projectile normal
-    projectile = Projectile(100, 100, 5, 0, 10, settings)
+    projectile = Projectile(100, 100, 5, 0, 10)
     assert projectile.x == 100
     assert projectile.y == 100
     assert projectile.damage == 10
     assert projectile.lifetime == 90
-    assert projectile.is_alive() == True
-    
-    # Test déplacement
-    initial_x = projectile.x
-    projectile.update()
-    assert projectile.x == initial_x + 5
     
     # Test projectile multishot
-    multishot = Projectile(200, 200, 3, 3, 15, settings, color=(255, 0, 0), radius=7, is_multishot=True)
+    multishot = Projectile(200, 200, 3, 3, 15, color=(255, 0, 0), radius=7, is_multishot=True)
     assert multishot.is_multishot == True
     assert multishot.radius == 7
     assert multishot.color == (255, 0, 0)
+    
+    # Test déplacement, une fois la fiche copiée dans un lot
+    batch = ProjectileBatch(MockSettings())
+    batch.extend([projectile, multishot])
+    batch.update()
+    assert list(batch.x[:2]) == [105, 203]
+    assert list(batch.multishot[:2]) == [False, True]
+    assert tuple(batch.color[1]) == (255, 0, 0)
+
+def test_projectile_batch():
+    """Test du moteur de projectiles en tableaux"""
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+    
+    settings = MockSettings()
+    batch = ProjectileBatch(settings, capacity=2)
+    
+    # Émission en lot (avec agrandissement des tableaux)
+    assert batch.emit([100, 200, 300], 100, 5, 0, 10, radius=4) == 3
+    assert len(batch) == 3
+    assert batch.capacity >= 3
+    
+    # Déplacement vectorisé
+    batch.update()
+    assert list(batch.x[:3]) == [105, 205, 305]
+    assert batch.lifetime[0] == 89
+    
+    # Sortie d'écran
+    batch.emit(798, 300, 5, 0, 10)
+    batch.update()
+    assert len(batch) == 3
+    
+    # Rebond sur le bord avec perte d'énergie
+    bouncing = Projectile(795, 300, 10, 0, 10, radius=8)
+    bouncing.is_bouncing = True
+    bouncing.bounces_remaining = 2
+    batch.clear()
+    batch.append(bouncing)
+    batch.update()
+    assert batch.x[0] == 792
+    assert batch.dx[0] == -8
+    assert batch.bounces[0] == 1
+    
+    # Collisions et suppression
+    hits = batch.collide_circle(790, 300, 5)
+    assert list(hits) == [0]
+    batch.kill(hits)
+    batch.compact()
+    assert len(batch) == 0
+
+def test_projectile_batch_budget():
+    """Test du budget de projectiles : dégradation selon la politique"""
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+    
+    # Fusion : les projectiles de même direction deviennent un plus gros
+    batch = ProjectileBatch(MockSettings(), budget=2, policy="merge")
+    angles = np.repeat([0, np.pi / 2], 4)
+    assert batch.emit(400, 300, np.cos(angles) * 3, np.sin(angles) * 3, 10, radius=5) == 2
+    assert batch.budget_stats["merged"] == 6
+    assert list(batch.radius[:2]) == [10, 10] and list(batch.damage[:2]) == [10, 10]
+    assert np.allclose(batch.dx[:2], [3, 0]) and np.allclose(batch.dy[:2], [0, 3])
+    
+    # Plus de place : tout est ignoré
+    assert batch.emit(1, 1, 1, 0, 5) == 0
+    assert batch.budget_stats["dropped"] == 1
+    
+    # Ignorer : les plus faibles dégâts d'abord, dans l'ordre d'émission
+    batch = ProjectileBatch(MockSettings(), budget=2, policy="skip")
+    batch.emit([10, 20, 30, 40], 100, 1, 0, [3, 9, 1, 7])
+    assert list(batch.x[:2]) == [20, 40]
+    assert batch.budget_stats["skipped"] == 2
+    
+    # Traînées coupées au-delà de la limite
+    batch = ProjectileBatch(MockSettings(), trail_limit=2)
+    batch.emit([100, 200, 300], 100, 1, 0, 5)
+    for _ in range(3):
+        batch.update()
+    assert batch.trail_count[:3].max() == 0
+    assert batch.stats()["trailless_ticks"] == 3
+
+def test_projectile_renderer():
+    """Test du rendu groupé : même image que pygame.draw.circle"""
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+    
+    batch = ProjectileBatch(MockSettings())
+    batch.emit([100.7, 300, 500], [100, 200.2, 300], 4, 1, 10, radius=[5, 7, 5],
+               color=[(255, 255, 0), (255, 100, 100), (255, 255, 0)])
+    for _ in range(9):
+        batch.update()  # Crée des traînées
+    assert batch.trail_count[:3].max() > 0
+    
+    expected = pygame.Surface((800, 600))
+    for i in range(len(batch)):
+        size = max(1, int(batch.radius[i]) // 2)
+        for j in range(batch.trail_count[i]):
+            pygame.draw.circle(expected, batch.trail_color[i].tolist(),
+                               (int(batch.trail[i, j, 0]), int(batch.trail[i, j, 1])), size)
+    for i in range(len(batch)):
+        pygame.draw.circle(expected, batch.color[i].tolist(),
+                           (int(batch.x[i]), int(batch.y[i])), int(batch.radius[i]))
+    
+    renderer = ProjectileRenderer()
+    screen = pygame.Surface((800, 600))
+    renderer.draw(screen, (batch,))
+    assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(expected, "RGB")
+    
+    # Un sprite par couple (couleur, rayon)
+    assert renderer.blit_count == len(batch) + int(batch.trail_count[:3].sum())
+    assert len(renderer.sprites) == 4
+
+def test_weapon_targeting():
+    """Test du ciblage de l'arme : cibles distinctes du multishot et de l'arc, tirs à tête chercheuse"""
+    class MockSound:
+        def play(self):
+            pass
+    
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+        WEAPON_TARGETING_RANGE = 500
+        
+        def __init__(self):
+            self.sounds = {"Tire_1": MockSound()}
+            self.player_data = {"projectile_size": 10}
+    
+    class Entity:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+    
+    player_data = {"attack_speed": 2, "attack_damages": 20, "projectile_speed": 10, "stationary_threshold": 0}
+    player = Entity(400, 300)
+    enemies = [Entity(500, 300), Entity(400, 150), Entity(400, 480), Entity(1500, 300)]
+    
+    # L'index n'est reconstruit qu'à la première requête du tick
+    index = EnemyIndex()
+    index.invalidate(enemies)
+    assert index.builds == 0
+    weapon = Weapon(MockSettings(), player_data)
+    targets = weapon.find_targets(player, index, 4)
+    assert targets == enemies[:3]  # Le dernier est hors de portée
+    assert weapon.find_closest_enemy(player, index) is enemies[0]
+    assert index.builds == 1
+    
+    # Multishot : un projectile par cible, le premier part aussitôt
+    batch = ProjectileBatch(MockSettings())
+    weapon.multishot_count = 2
+    weapon._shoot_at_targets(player, targets, batch, index)
+    assert len(batch) == 1 and batch.dx[0] > 0 and batch.dy[0] == 0
+    queued = weapon.multishot_queue
+    assert [shot['target'] for shot in queued] == enemies[1:3]
+    assert queued[0]['dx'] == 0 and queued[0]['dy'] < 0
+    assert queued[1]['dx'] == 0 and queued[1]['dy'] > 0
+    
+    # Arc : le projectile de droite vise l'ennemi proche de son angle, celui de gauche garde le sien
+    side = Entity(400 + 100 * np.cos(0.2), 300 + 100 * np.sin(0.2))
+    index.invalidate([enemies[0], side])
+    arc = Weapon(MockSettings(), player_data)
+    arc.arc_shot = True
+    batch = ProjectileBatch(MockSettings())
+    arc._shoot_at_targets(player, [enemies[0]], batch, index)
+    angles = np.arctan2(batch.dy[:3], batch.dx[:3])
+    assert np.allclose(angles, [0, -arc.arc_angle, 0.2])
+    
+    # Tête chercheuse : chaque projectile poursuit sa cible
+    arc.homing_turn_rate = 0.06
+    batch = ProjectileBatch(MockSettings())
+    arc._shoot_at_targets(player, [enemies[0]], batch, index)
+    assert (batch.special[:3] == SPECIAL_HOMING).all()
+    assert [batch.targets[i] if i >= 0 else None for i in batch.target[:3]] == [enemies[0], None, side]
+    
+    # Les cibles qu'aucun projectile vivant ne poursuit sont oubliées
+    chased = [Entity(100 + 20 * i, 100) for i in range(20)]
+    for target in chased:
+        batch.emit(400, 500, 0, -1, 10, special='homing', turn_rate=0.06, target=target, lifetime=1)
+    batch.update()
+    batch.update()
+    assert len(batch) == 3 and batch.targets == [enemies[0], side]
+    assert [batch.targets[i] if i >= 0 else None for i in batch.target[:3]] == [enemies[0], None, side]
+    
+    # Multishot en arc à tête chercheuse : couleur commune, une cible par projectile
+    arc.multishot_count = 1
+    batch = ProjectileBatch(MockSettings())
+    arc._shoot_at_targets(player, [enemies[0], side], batch, index)
+    assert len(batch) == 3 and (batch.special[:3] == SPECIAL_HOMING).all()
 
 def test_enemy_basic():
     """Test des ennemis de base"""
@@ -227,11 +417,43 @@ def test_spawn_effect():
     position = spawn.get_position()
     assert position == (400, 300) 
         
+def test_boss_pattern_templates():
+    """Test des templates de patterns : même géométrie que les générateurs récursifs"""
+    def placed(items):
+        return np.array([item[1:5] for item in items])
+    
+    # Cercle récursif : rotation de angle_offset, mêmes tirages des projectiles spéciaux
+    template = RecursivePatternGenerator.circle_template(3)
+    assert len(template['x']) == 10 + 80 + 480
+    items = RecursivePatternGenerator.generate_circle_recursive(
+        400, 300, 3, 3, angle_offset=1.3, projectile_types=['homing', 'bouncing'], rng=random.Random(5)
+    )
+    assert np.allclose(np.stack(RecursivePatternGenerator.place(template, 400, 300, 1.3), axis=1), placed(items))
+    assert list(template['special']) == [item[6] is not None for item in items]
+    
+    # Spirale : rotation de current_time * 0.3
+    template = RecursivePatternGenerator.spiral_template(4, 5)
+    items = RecursivePatternGenerator.generate_spiral_arms(100, 50, 4, 5, current_time=2.5)
+    assert np.allclose(np.stack(RecursivePatternGenerator.place(template, 100, 50, 2.5 * 0.3), axis=1), placed(items))
+    
+    # Vague : la vitesse de chaque projectile varie avec le temps
+    template = RecursivePatternGenerator.wave_template(3, 6)
+    t = 7.1
+    items = RecursivePatternGenerator.generate_wave_pattern(200, 200, 3, 6, current_time=t)
+    speed = 3.0 + (template['phase_sin'] * np.cos(4 * t) + template['phase_cos'] * np.sin(4 * t)) * 0.5
+    assert np.allclose(np.stack(RecursivePatternGenerator.place(template, 200, 200, t, speed), axis=1), placed(items))
+    assert list(template['damage']) == [item[5] for item in items]
+
 # Exécuter tous les tests
 def fonction_test_entities():
     test_player_movement()
     test_projectile_basic()
+    test_projectile_batch()
+    test_projectile_batch_budget()
+    test_projectile_renderer()
+    test_weapon_targeting()
     test_enemy_basic()
     test_enemy_suicide()
     test_spawn_effect()
+    test_boss_pattern_templates()
     print("Tout les jeux de test des entitées fonctionnent !")
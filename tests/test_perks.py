@@ -71,6 +71,7 @@ def test_perks_special():
     class MockSettings:
         def __init__(self):
             self.sounds = {}
+            self.perks_only_once = []
     
     class MockPlayer:
         def __init__(self):
@@ -98,6 +99,11 @@ def test_perks_special():
     # Test multishot (niveau supplémentaire)
     perks.multishot()
     assert weapon.multishot_count == 2
+    
+    # Test tir à tête chercheuse (une seule fois)
+    perks.homing_shot()
+    assert weapon.homing_turn_rate > 0
+    assert "homing_shot" in settings.perks_only_once
 
 def test_perks_translation():
     """Test de la traduction des noms de perks"""
@@ -1,5 +1,27 @@
+import json
+import numpy as np
 from src.systems.wave_manager import WaveManager
 from src.systems.game_stats import GameStats
+from src.systems.spatial_grid import SpatialGrid
+from src.systems.fixed_timestep import FixedTimestep
+from src.systems.profiler import FrameProfiler
+from src.systems.replay import Replay, ReplayRecorder, EVENT_DASH, EVENT_PERK, state_digest
+from src.systems.combat_log import CombatLog
+from src.systems.autopilot import Autopilot
+from src.systems.particles import ParticleSystem
+from src.systems.emission_scheduler import EmissionScheduler
+from src.systems.enemy_index import EnemyIndex
+from src.systems.steering import SteeringSystem
+from src.systems.neighbor_grid import NeighborGrid
+from src.systems.ai_scheduler import AIScheduler
+from src.systems.entity_registry import EntityRegistry
+from src.entities.projectile_batch import ProjectileBatch
+from src.entities.projectiles import FireZone
+from src.entities.enemies.boss import Boss
+from src.headless import HeadlessGame
+from src.batch import run_batch, aggregate
+from src.env import TowerEnv
+from src.vector_env import VectorTowerEnv, episode_seed
 from src.perks.talents import Talents
 
 def test_game_stats():
@@ -122,10 +144,747 @@ def test_wave_state_transitions():
     # Test vérification boss
     assert manager.is_boss_wave_current() == False
     
+    # Le délai entre les vagues suit le temps de simulation
+    assert manager.update(1999) == False
+    assert manager.update(2000) == True
+    
+def test_fixed_timestep():
+    """Test de l'accumulateur de simulation à pas fixe"""
+    timestep = FixedTimestep(tick_rate=50, max_ticks_per_frame=3)
+    assert timestep.dt == 20
+    
+    # Le reste est gardé pour l'image suivante
+    assert timestep.advance(30) == 1
+    assert timestep.advance(10) == 1
+    assert timestep.advance(5) == 0
+    assert timestep.alpha() == 0.25
+    
+    # Rendu lent : le rattrapage est limité et le retard abandonné
+    assert timestep.advance(1000) == 3
+    assert timestep.dropped_ticks == 47
+    assert timestep.ticks == 5
+    assert timestep.accumulator < timestep.dt
+    
+def test_spatial_grid():
+    """Test de la grille de collisions"""
+    class MockEntity:
+        def __init__(self, x, y, radius):
+            self.x = x
+            self.y = y
+            self.radius = radius
+    
+    # Taille de cellule calculée à partir du plus grand rayon
+    assert SpatialGrid.cell_size_for(20) == 40
+    assert SpatialGrid.cell_size_for(2) == 16
+    
+    grid = SpatialGrid(SpatialGrid.cell_size_for(20))
+    near = MockEntity(105, 100, 5)
+    far = MockEntity(700, 500, 5)
+    border = MockEntity(82, 100, 5)  # Cellule voisine mais touche le cercle
+    grid.build([near, far, border])
+    assert len(grid) == 3
+    
+    # Les candidats proches sont trouvés dans l'ordre d'insertion
+    candidates = grid.query(100, 100, 20)
+    assert candidates == [near, border]
+    assert far not in candidates
+    
+    # Grille vidée
+    grid.clear()
+    assert grid.query(100, 100, 20) == []
+
+def test_headless_simulation():
+    """Test de la simulation sans fenêtre"""
+    game = HeadlessGame(seed=1, invincible=True)
+    report = game.run(600)
+    
+    # 10 secondes de jeu simulées sans rendu ni son
+    assert report["ticks"] == 600
+    assert report["game_over"] == False
+    assert report["floor"] >= 1
+    assert game.scene.current_time == 600 * game.timestep.dt
+    
+def test_interleaved_games():
+    """Test de deux parties dans un même processus : chaque scène tire dans ses propres flux"""
+    def digest(game):
+        return state_digest(game.scene)
+    
+    solo = []
+    for seed in (4, 5):
+        game = HeadlessGame(seed=seed, invincible=True, autopilot=True)
+        game.run(1500)
+        solo.append(digest(game))
+    
+    # Un tick chacune : mêmes parties que seules
+    games = [HeadlessGame(seed=seed, invincible=True, autopilot=True) for seed in (4, 5)]
+    for _ in range(1500):
+        for game in games:
+            game.update()
+    assert [digest(game) for game in games] == solo
+    
+def test_frame_profiler():
+    """Test du profileur par étape"""
+    profiler = FrameProfiler(window=4)
+    
+    # Désactivé : aucune mesure
+    assert profiler.start() == 0
+    assert profiler.lap("update", 0) == 0
+    profiler.end_frame()
+    assert profiler.summary() == {} and profiler.frames == 0
+    
+    # Durées injectées (ns) : les ticks d'une même image sont cumulés
+    profiler.toggle()
+    for frame in range(5):
+        profiler.frame_totals = {"update": (frame + 1) * 1_000_000, "update/enemies": 500_000}
+        if frame == 4:
+            profiler.frame_totals["draw"] = 2_000_000
+        profiler.end_frame()
+    
+    summary = profiler.summary()
+    # Fenêtre de 4 images : 2, 3, 4 et 5 ms
+    assert summary["update"]["mean"] == 3.5
+    assert summary["update"]["max"] == 5.0
+    assert summary["update"]["p95"] == 5.0
+    # Une étape absente d'une image compte pour 0
+    assert summary["draw"]["mean"] == 2.0
+    # Les sous-étapes ne comptent pas dans la durée de l'image
+    assert profiler.frame_summary()["max"] == 7.0
+    
+    # Désactiver oublie les mesures
+    profiler.toggle()
+    assert profiler.summary() == {} and not profiler.enabled
+
+def test_replay_playback():
+    """Test de l'enregistrement et de la relecture au bit près"""
+    with open("data/default_player_data.json", 'r', encoding='utf-8') as f:
+        player_data = json.load(f)
+    player_data["max_health"] = 10**6  # Le joueur survit aux 20 secondes
+    player_data["attack_damages"] = 500  # Montée de niveau (choix de perk) avant la fin
+    game = HeadlessGame(seed=7, player_data=player_data)
+    scene = game.scene
+    scene.recorder = ReplayRecorder(scene.global_seed, game.player_data, game.settings)
+    
+    # Entrées variées : déplacements, dash, perks choisis automatiquement
+    for tick in range(1200):
+        moving = tick < 300
+        scene.player.last_horizontal_key = ('left', 'right', None)[tick // 100] if moving else None
+        scene.player.keys_pressed['left'] = scene.player.last_horizontal_key == 'left'
+        scene.player.last_vertical_key = 'up' if moving and tick % 150 < 40 else None
+        if tick == 300:
+            scene.player.activate_dash()
+        game.update()
+    
+    recorder = scene.recorder
+    recorder.replay.digest = state_digest(scene)
+    
+    # Aller-retour par le format binaire (un octet par tick, compressé)
+    data = recorder.replay.to_bytes()
+    assert len(data) < 2000
+    replay = Replay.from_bytes(data)
+    assert len(replay) == 1200
+    assert replay.events == recorder.replay.events
+    assert {kind for _, kind, _, _ in replay.events} == {EVENT_DASH, EVENT_PERK}
+    
+    # La relecture retrouve exactement le même état final
+    playback = HeadlessGame(replay=replay)
+    report = playback.run()
+    assert report["replay_ticks"] == 1200
+    assert report["replay_match"] == True
+
+def test_batch_simulation():
+    """Test des simulations en lot et du journal de combat"""
+    log = CombatLog()
+    enemy = type("Enemy", (), {"type": "basic"})()
+    log.on_spawn(enemy, 60)
+    log.on_kill(enemy, 180)
+    log.on_damage("shooter", 10)
+    log.on_damage("feu", 0)  # Aucun PV perdu : ignoré
+    log.on_death()
+    assert log.time_to_kill(60) == {"basic": 2.0}
+    assert log.damage_taken == {"shooter": 10}
+    assert log.death_cause == "shooter"
+    
+    # Résultats reproductibles, une ligne par seed dans l'ordre
+    rows = run_batch(3, base_seed=5, ticks=600, workers=1)
+    assert [row["seed"] for row in rows] == [5, 6, 7]
+    assert rows == run_batch(3, base_seed=5, ticks=600, workers=1)
+    for row in rows:
+        assert row["ticks"] <= 600
+        assert row["death_cause"] != "" or not row["game_over"]
+    
+    summary = aggregate(rows)
+    assert summary["runs"] == 3
+    assert summary["floor_max"] >= 1
+
+def test_autopilot():
+    """Test du pilote automatique"""
+    game = HeadlessGame(seed=1, autopilot=True)
+    scene = game.scene
+    player = scene.player
+    
+    # Aucune menace : le bot reste immobile pour que l'arme tire
+    game.autopilot.update(scene)
+    assert game.autopilot.current == 0
+    assert player.last_horizontal_key is None and player.last_vertical_key is None
+    
+    # Un projectile arrive droit sur le joueur : le bot l'évite
+    scene.enemy_projectiles.emit(player.x + 120, player.y, -6, 0, 10)
+    health = player.health
+    for _ in range(40):
+        game.update()
+    assert player.health == health
+    assert player.last_horizontal_key is not None or player.last_vertical_key is not None or player.is_dashing
+    
+    # Beaucoup de projectiles : seuls les plus proches sont évalués
+    autopilot = Autopilot(max_projectiles=32)
+    scene.enemy_projectiles.emit(list(range(0, 800, 1)), 50, 0, 2, 10)
+    autopilot.update(scene)
+    assert len(scene.enemy_projectiles) > 32
+    assert autopilot.stats()["max"] > 0
+    
+    # Foule : 600 projectiles et 500 ennemis, seuls les plus proches sont évalués
+    from src.entities.enemies import Basic, Charger, Suicide, Shooter
+    crowd = HeadlessGame(seed=3).scene
+    classes = [Basic, Charger, Suicide, Shooter]
+    for i in range(500):
+        crowd.enemies.add(classes[i % 4]((i * 37) % 1200, (i * 53) % 700, crowd.settings))
+    crowd.enemy_projectiles.emit([(i * 7) % 1200 for i in range(600)], [(i * 11) % 700 for i in range(600)], 1, 1, 10)
+    assert len(crowd.enemy_projectiles) == 600
+    autopilot = Autopilot()
+    crowd.player.dash_cooldown = 10 ** 9  # Le bot reste dans la boucle de décision complète
+    crowd.player.is_dashing = False
+    autopilot.update(crowd)
+    assert autopilot.evaluated == (autopilot.max_projectiles, autopilot.max_enemies)
+    
+    # Simulation complète pilotée par le bot
+    report = HeadlessGame(seed=2, autopilot=True).run(600)
+    assert "autopilot_us" in report and "autopilot_budget_us" not in report
+    report = HeadlessGame(seed=2, autopilot=True, profile=True).run(60)
+    assert report["autopilot_budget_us"].startswith(str(Autopilot.BUDGET_US))
+
+def test_tower_env():
+    """Test de l'environnement d'apprentissage"""
+    env = TowerEnv(n_enemies=4, n_projectiles=8, n_zones=2)
+    observation, info = env.reset(seed=3)
+    assert observation.shape == env.observation_shape
+    assert observation.dtype == np.float32
+    assert info["floor"] == 1
+    
+    # Même seed et mêmes actions : mêmes observations (tableau rempli sur place)
+    actions = [i % env.n_actions for i in range(300)]
+    first = []
+    for action in actions:
+        result, reward, terminated, truncated, info = env.step(action)
+        assert result is observation
+        first.append(observation.copy())
+        if terminated:
+            assert reward < 0  # Pénalité de mort
+            break
+    
+    env.reset(seed=3)
+    for action, expected in zip(actions, first):
+        observation, *_ = env.step(action)
+        assert np.array_equal(observation, expected)
+    
+    # Les ennemis apparus sont observés, du plus proche au plus loin
+    present = env.enemy_obs[:, 6] == 1
+    distances = env.enemy_obs[present, 2]
+    assert np.all(np.diff(distances) >= 0)
+
+def test_vector_env():
+    """Test de l'environnement vectorisé en mémoire partagée"""
+    options = dict(n_enemies=4, n_projectiles=8, n_zones=2, max_ticks=250)
+    actions = np.arange(3) % TowerEnv.N_ACTIONS
+    steps = 400
+    runs = []
+    for workers in (1, 2):
+        # Un processus pour les trois environnements, puis deux processus (2 + 1)
+        with VectorTowerEnv(3, workers, seed=11, **options) as env:
+            assert len(env.processes) == workers
+            observations = env.reset()
+            assert observations.shape == (3, TowerEnv.observation_size(4, 8, 2))
+            rewards, history, ends = [], [], []
+            for step in range(steps):
+                observations, reward, terminated, truncated = env.step(actions)
+                rewards.append(reward.copy())
+                history.append(observations.copy())
+                ends.append(terminated | truncated)
+        runs.append((np.array(rewards), np.array(history), np.array(ends)))
+    rewards, history, ends = runs[0]
+    # Épisodes tronqués puis relancés automatiquement
+    assert ends.any(axis=0).all()
+    # Même résultat quel que soit le regroupement des environnements en processus
+    assert np.array_equal(runs[1][0], rewards) and np.array_equal(runs[1][1], history)
+    
+    # Chaque environnement donne exactement la même suite qu'un environnement seul
+    for i in range(3):
+        alone = TowerEnv(**options)
+        episode = 0
+        alone.reset(episode_seed(11, i, episode))
+        for step in range(steps):
+            observation, reward, terminated, truncated, _ = alone.step(int(actions[i]))
+            if terminated or truncated:
+                episode += 1
+                observation, _ = alone.reset(episode_seed(11, i, episode))
+            assert reward == rewards[step, i]
+            assert np.array_equal(observation, history[step, i])
+
+def test_particle_system():
+    """Test du système de particules en tableaux"""
+    import pygame
+    particles = ParticleSystem(capacity=2, gravity=0.5, growth=0.5)
+    
+    # Émission en lot (avec agrandissement des tableaux)
+    assert particles.emit([10, 20, 30], 100, dx=1, life=[1, 4, 4], fade=2, size=4, owner=[7, 8, 9]) == 3
+    assert len(particles) == 3 and particles.capacity >= 3
+    
+    # Intégration vectorisée : vitesse, gravité, durée de vie
+    dead = particles.update()
+    assert list(dead) == [7]
+    assert len(particles) == 2
+    # La dernière particule a pris la place de la morte
+    assert list(particles.x[:2]) == [31, 21]
+    assert list(particles.dy[:2]) == [0.5, 0.5]
+    assert particles.y[0] == 100
+    
+    # Estompage : la taille diminue et l'alpha suit la vie restante
+    particles.update()
+    particles.update()
+    assert list(particles.life[:2]) == [1, 1]
+    assert list(particles.size[:2]) == [2, 2]
+    
+    # Retrait des particules d'un seul propriétaire
+    particles.kill_owner(9)
+    assert len(particles) == 1 and particles.owner[0] == 8
+    
+    # Rendu groupé : un blit par particule visible
+    screen = pygame.Surface((200, 200))
+    particles.emit(50, 50, life=10, size=0, owner=1)
+    particles.draw(screen)
+    assert particles.blit_count == 1
+    assert screen.get_at((int(particles.x[0]), int(particles.y[0]))) != (0, 0, 0, 255)
+    particles.clear()
+    assert len(particles) == 0
+
+def test_fire_effects():
+    """Test des particules de zones de feu, propres à chaque scène"""
+    first = HeadlessGame(seed=1).scene
+    zone = FireZone(100, 100, first.settings, first.fire_effects)
+    first.fire_zones.append(zone)
+    assert len(first.fire_effects) == 75  # 40 flammes, 20 étincelles, 15 fumées
+    
+    # Une seconde scène (nouvelle partie) ne partage ni n'efface les effets de la première
+    second = HeadlessGame(seed=2).scene
+    assert len(second.fire_effects) == 0
+    assert len(first.fire_effects) == 75
+    FireZone(200, 200, second.settings, second.fire_effects)
+    assert len(second.fire_effects) == 75
+    
+    # Les flammes éteintes d'une zone active sont remplacées, puis retirées avec la zone
+    for _ in range(120):
+        first.fire_effects.update(first.fire_zones)
+    assert len(first.fire_effects.flames) == 40
+    zone.release_particles()
+    assert len(first.fire_effects) == 0
+    assert len(second.fire_effects) > 0
+    
+    # Sans effets, la zone n'a pas de particules
+    bare = FireZone(100, 100, first.settings)
+    assert bare.update() and bare.number == 0
+
+def test_emission_scheduler():
+    """Test de l'émission étalée : même géométrie qu'une émission en une seule image"""
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+    
+    # Salve de 300 projectiles, dont certains naissent ou sortent hors de l'écran
+    angles = np.linspace(0, 2 * np.pi, 300, endpoint=False)
+    x, y = 400 + 420 * np.cos(angles), 300 + 40 * np.sin(angles)
+    dx, dy = 3 * np.cos(angles), -3 * np.sin(angles)
+    
+    immediate = ProjectileBatch(MockSettings())
+    spread = ProjectileBatch(MockSettings())
+    scheduler = EmissionScheduler(budget=64)
+    scheduler.schedule(x, y, dx, dy, 5, 6, (255, 0, 0), origin=(400, 300))
+    assert len(scheduler) == 300
+    
+    # Même ordre que la scène : projectiles puis ennemis (qui émettent)
+    for tick in range(8):
+        immediate.update()
+        spread.update()
+        if tick == 0:
+            immediate.emit(x, y, dx, dy, 5, radius=6, color=(255, 0, 0))
+        assert scheduler.update(spread) <= 64
+    assert len(scheduler) == 0 and scheduler.max_delay == 4
+    
+    def state(batch):
+        n = batch.count
+        rows = np.stack([batch.x[:n], batch.y[:n], batch.dx[:n], batch.lifetime[:n]], axis=1)
+        return rows[np.lexsort(rows.T[::-1])]
+    
+    assert len(spread) == len(immediate) < 300
+    assert np.allclose(state(spread), state(immediate))
+
+def test_boss_volley_after_death():
+    """Test d'une salve étalée dont le boss meurt en cours d'émission"""
+    game = HeadlessGame(seed=3, invincible=True)
+    scene = game.scene
+    scene.emissions.budget = 8
+    boss = Boss(400, 150, scene.settings, 3, 7, emissions=scene.emissions)
+    boss.attack_cooldown = 10**6  # Une seule salve, lancée à la main
+    boss.player = scene.player
+    scene.enemies.add(boss)
+    boss.current_pattern = 'mixed'
+    boss._execute_pattern(scene.enemy_projectiles, boss.phases[0])
+    queued = len(scene.emissions)
+    assert queued > 16
+    
+    game.update()
+    assert scene.emissions.emitted == 8
+    
+    # Boss tué : le reste de la salve part quand même, au même rythme
+    scene.enemies.kill(boss.handle)
+    scene.enemies.flush()
+    emitted = [8]
+    while len(scene.emissions):
+        game.update()
+        emitted.append(scene.emissions.emitted)
+    assert sum(emitted) == queued and max(emitted) == 8
+    
+    # Les bosses nés d'une division planifient dans le même planificateur
+    clones = boss.division_system.create_division_bosses(boss)
+    assert all(clone.emissions is scene.emissions for clone in clones)
+
+def test_entity_registry():
+    """Test du registre d'entités à poignées générationnelles"""
+    class Entity:
+        def __init__(self, name, x=0, y=0):
+            self.name = name
+            self.x = x
+            self.y = y
+    
+    registry = EntityRegistry()
+    a, b, c = Entity("a"), Entity("b"), Entity("c")
+    for entity in (a, b, c):
+        registry.add(entity)
+    assert registry.add(a) == a.handle and len(registry) == 3
+    assert registry.get(b.handle) is b
+    
+    # Retrait différé : l'itération en cours n'est pas perturbée
+    for entity in registry:
+        if entity is not c:
+            registry.kill(entity.handle)
+    registry.kill(a.handle)  # Déjà tué : sans effet
+    assert len(registry) == 3
+    assert registry.flush() == 2
+    assert [entity.name for entity in registry] == ["c"]
+    
+    # Poignées périmées détectées, emplacement réutilisé avec une nouvelle génération
+    assert registry.get(a.handle) is None and b.handle not in registry
+    d = Entity("d")
+    registry.add(d)
+    assert registry.get(d.handle) is d and registry.get(b.handle) is None
+    assert registry.stats()["slots"] == 3
+    
+    # Une cible homing retirée n'est plus poursuivie (et n'est plus référencée)
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+    
+    target = Entity("cible", 400, 100)
+    registry.add(target)
+    batch = ProjectileBatch(MockSettings(), registry=registry)
+    batch.emit(100, 100, 2, 0, 5, special="homing", turn_rate=0.5, target=target)
+    assert batch.targets == [target.handle]
+    batch.update()
+    registry.remove(target.handle)
+    batch.update()
+    assert batch.target[0] == -1
+    
+    registry.clear()
+    assert len(registry) == 0 and registry.get(c.handle) is None
+
+def test_enemy_index():
+    """Test de l'index des plus proches ennemis (comparé à un parcours complet)"""
+    class Entity:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+    
+    rng = np.random.default_rng(3)
+    entities = [Entity(float(x), float(y)) for x, y in rng.uniform(-50, 900, (200, 2))]
+    entities.append(Entity(entities[0].x, entities[0].y))  # Égalité : le premier rangé gagne
+    index = EnemyIndex(cell_size=64)
+    index.build(entities)
+    
+    def brute(x, y):
+        d2 = [(e.x - x) ** 2 + (e.y - y) ** 2 for e in entities]
+        return sorted(range(len(entities)), key=lambda i: (d2[i], i)), d2
+    
+    for x, y in list(rng.uniform(-300, 1200, (40, 2))) + [(entities[0].x, entities[0].y)]:
+        order, d2 = brute(x, y)
+        assert index.k_nearest(x, y, 5) == [entities[i] for i in order[:5]]
+        in_range = [i for i in order if d2[i] < 150 ** 2]
+        assert index.nearest(x, y, 150) is (entities[in_range[0]] if in_range else None)
+        found, found_d2 = index.query_radius(x, y, 100)
+        assert found.tolist() == sorted(i for i in order if d2[i] <= 100 ** 2)
+        assert np.allclose(found_d2, [d2[i] for i in found.tolist()])
+    
+    index.build([])
+    assert index.nearest(0, 0) is None and index.within(0, 0, 50) == []
+
+def test_steering_system():
+    """Test du déplacement groupé des ennemis (identique au déplacement un par un)"""
+    from src.entities.enemies import Basic, Charger, Suicide, Shooter, Pyromane, Boss
+    
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+        RED = (255, 0, 0)
+        sounds = {}
+    
+    class MockPlayer:
+        x = 400
+        y = 300
+        size = 20
+    
+    def spawn():
+        classes = [Basic, Charger, Suicide, Shooter, Pyromane]
+        enemies = [classes[i % 5](x, y, MockSettings()) for i, (x, y) in
+                   enumerate([(10, 10), (790, 590), (400, 560), (120, 300), (560, 300), (400, 330), (380, 90)])]
+        enemies.append(Boss(420, 310, MockSettings(), global_seed=1))
+        for i, enemy in enumerate(enemies):
+            if hasattr(enemy, 'circle_angle'):
+                enemy.circle_angle = i * 0.7
+        return enemies
+    
+    batched, single = spawn(), spawn()
+    steering = SteeringSystem()
+    player = MockPlayer()
+    for _ in range(40):
+        steering.update(batched, player)
+        for enemy in single:
+            enemy.move(player)
+    assert [(e.x, e.y) for e in batched] == [(e.x, e.y) for e in single]
+    assert steering.group_sizes == {"seek": 5, "kite": 1, "orbit": 1, "keep_distance": 1}
+    
+    # Le shooter tient sa distance, le boss recule, le basique reste dans l'écran
+    shooter, boss = batched[3], batched[7]
+    assert shooter.attack_range - shooter.kite_band - shooter.speed <= shooter.to_player[2]
+    assert ((boss.x - player.x) ** 2 + (boss.y - player.y) ** 2) ** 0.5 > 40
+    assert all(e.radius <= e.x <= 800 - e.radius for e in batched if e.screen_margin is not None)
+    
+    # Un suicide qui explose ne bouge plus ; seuls les ennemis de mêlée proches sont en contact
+    suicide = batched[2]
+    suicide.is_exploding = True
+    position = (suicide.x, suicide.y)
+    steering.update(batched, player)
+    assert (suicide.x, suicide.y) == position and steering.group_sizes["seek"] == 4
+    contacts = steering.contacts(player)
+    for enemy, contact in zip(batched, contacts.tolist()):
+        touching = ((enemy.x - player.x) ** 2 + (enemy.y - player.y) ** 2) ** 0.5 < enemy.radius + player.size
+        assert contact or not (touching and enemy.melee)
+        assert enemy.melee or not contact
+
+def test_neighbor_grid():
+    """Test des paires de voisins de la grille vectorisée"""
+    rng = np.random.default_rng(3)
+    xs = rng.uniform(0, 400, 60)
+    ys = rng.uniform(0, 300, 60)
+    grid = NeighborGrid(cell_size=50, per_cell=60)
+    grid.build(xs, ys)
+    assert len(grid) == 60
+    found = set(zip(*[a.tolist() for a in grid.pairs()]))
+    
+    # Sans plafond atteint : toutes les paires à moins d'une cellule, symétriques
+    close = {(i, j) for i in range(60) for j in range(60)
+             if i != j and (xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2 < 50 ** 2}
+    assert close <= found
+    assert all((j, i) in found for i, j in found)
+    
+    # Tous dans la même cellule : au plus per_cell voisins lus par point
+    grid = NeighborGrid(cell_size=64, per_cell=4)
+    grid.build(np.full(100, 10.0), np.full(100, 10.0))
+    i, j = grid.pairs()
+    assert np.bincount(i, minlength=100).max() <= 4
+    assert not np.any(i == j)
+    grid.build(np.empty(0), np.empty(0))
+    assert grid.pairs()[0].size == 0
+
+def test_enemy_separation():
+    """Test de la séparation des ennemis qui se chevauchent"""
+    from src.entities.enemies import Basic, Boss
+    
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+        RED = (255, 0, 0)
+        sounds = {}
+    
+    class MockPlayer:
+        x = 400
+        y = 300
+        size = 20
+    
+    # Ennemis empilés au même point, loin du joueur
+    player = MockPlayer()
+    enemies = [Basic(100, 100, MockSettings()) for _ in range(6)]
+    steering = SteeringSystem(separation=0.5, max_push=3)
+    steering.update(enemies, player)
+    # Plafond de 4 voisins par cellule : les deux derniers ne se voient pas entre eux
+    assert steering.separated == 15 - 1
+    for _ in range(30):
+        steering.update(enemies, player)
+    spread = max(e.x for e in enemies) - min(e.x for e in enemies)
+    assert spread > 2 * enemies[0].radius
+    assert len({(e.x, e.y) for e in enemies}) == 6
+    
+    # Le boss ne cède pas : seul le basique s'écarte
+    boss = Boss(400, 100, MockSettings(), global_seed=1)
+    basic = Basic(400, 100, MockSettings())
+    reference = Boss(400, 100, MockSettings(), global_seed=1)
+    steering.update([boss, basic], player)
+    reference.move(player)
+    assert (boss.x, boss.y) == (reference.x, reference.y)
+    assert ((basic.x - boss.x) ** 2 + (basic.y - boss.y) ** 2) > 0
+    
+    # Sans séparation, les ennemis restent empilés
+    stacked = [Basic(100, 100, MockSettings()) for _ in range(3)]
+    SteeringSystem().update(stacked, player)
+    assert len({(e.x, e.y) for e in stacked}) == 1
+
+def test_ai_scheduler():
+    """Test de la répartition des réflexions des ennemis sur plusieurs ticks"""
+    from src.entities.enemies import Basic, Shooter, Destructeur
+    
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+        RED = (255, 0, 0)
+        sounds = {}
+    
+    class MockPlayer:
+        x = 400
+        y = 300
+    
+    counted = []
+    class CountingShooter(Shooter):
+        def think(self, player, fire_zones=None, pending_zones=None):
+            counted.append(self)
+            super().think(player, fire_zones, pending_zones)
+    
+    # Premier passage : tous réfléchissent, puis chacun une fois tous les 4 ticks
+    shooters = [CountingShooter(100, 100, MockSettings()) for _ in range(8)]
+    enemies = shooters + [Basic(100, 100, MockSettings())]
+    scheduler = AIScheduler(interval=4)
+    assert scheduler.update(enemies, MockPlayer()) == 8
+    assert sorted(e.think_slot for e in shooters) == [0, 0, 1, 1, 2, 2, 3, 3]
+    counted.clear()
+    per_tick = [scheduler.update(enemies, MockPlayer()) for _ in range(8)]
+    assert per_tick == [2] * 8
+    assert all(counted.count(e) == 2 for e in shooters)
+    
+    # La décision est gardée entre deux réflexions
+    shooter = shooters[0]
+    shooter.to_player = (0.0, 250.0, 250.0)
+    shooter.think(MockPlayer())
+    assert shooter.can_shoot
+    destructeur = Destructeur(100, 100, MockSettings())
+    destructeur.to_player = (0.0, 500.0, 500.0)
+    scheduler.update([destructeur], MockPlayer())
+    assert not destructeur.in_range
+    
+    # Budget épuisé : une seule réflexion par tick, les reportés passent en premier
+    scheduler = AIScheduler(interval=1, budget_ms=0)
+    late = [CountingShooter(100, 100, MockSettings()) for _ in range(3)]
+    counted.clear()
+    assert [scheduler.update(late, MockPlayer()) for _ in range(3)] == [1, 1, 1]
+    assert counted == late
+    assert scheduler.deferred == 2 and scheduler.deferrals == 6
+    stats = scheduler.stats()
+    assert stats["shooter"]["thinks"] == 3 and stats["shooter"]["max_us"] >= stats["shooter"]["mean_us"]
+    
+    scheduler.reset()
+    assert scheduler.tick == 0 and scheduler.stats() == {}
+    
+    # Après un reset, les survivants sont renumérotés et leurs reports oubliés
+    scheduler = AIScheduler(interval=4)
+    survivors = [CountingShooter(100, 100, MockSettings()) for _ in range(3)]
+    scheduler.update([CountingShooter(100, 100, MockSettings())] + survivors, MockPlayer())
+    assert [e.think_slot for e in survivors] == [1, 2, 3]
+    survivors[2].think_deferred = 50
+    scheduler.reset()
+    counted.clear()
+    assert scheduler.update(survivors, MockPlayer()) == 3
+    assert [e.think_slot for e in survivors] == [0, 1, 2]
+    assert all(e.think_deferred is None for e in survivors)
+
+def test_pyromane_think_timing():
+    """Test du rythme des flaques du pyromane, à chaque tick ou réparti par l'AIScheduler"""
+    from src.entities.enemies import Pyromane
+    
+    class MockSettings:
+        screen_width = 800
+        screen_height = 600
+        RED = (255, 0, 0)
+        sounds = {}
+    
+    class MockPlayer:
+        x = 400
+        y = 300
+    
+    def placements(scheduler=None, ticks=700):
+        pyromane = Pyromane(100, 100, MockSettings())
+        fire_zones, pending = [], []
+        found = []
+        for tick in range(ticks):
+            placed = len(pending)
+            if scheduler is None:
+                pyromane.update(MockPlayer(), fire_zones, pending)
+            else:
+                pyromane.move(MockPlayer())
+                scheduler.update([pyromane], MockPlayer(), fire_zones, pending)
+                pyromane.act(MockPlayer(), fire_zones=fire_zones, pending_zones=pending)
+            if len(pending) > placed:
+                found.append(tick)
+        return pyromane.fire_zone_rate + 1, found
+    
+    # À chaque tick : une attaque tous les fire_zone_rate + 1 ticks
+    period, ticks = placements()
+    assert ticks == [0, period, 2 * period, 3 * period]
+    
+    # Réflexion tous les 4 ticks : au plus 3 ticks de retard, sans dérive
+    scheduler = AIScheduler(interval=4)
+    period, ticks = placements(scheduler)
+    assert len(ticks) == 4
+    assert all(k * period <= tick < k * period + 4 for k, tick in enumerate(ticks))
+
 # Exécuter tous les tests
 def fonction_test_systems():
     test_game_stats()
     test_talents_basic()
     test_wave_state_transitions()
+    test_fixed_timestep()
+    test_spatial_grid()
+    test_headless_simulation()
+    test_interleaved_games()
+    test_frame_profiler()
+    test_replay_playback()
+    test_batch_simulation()
+    test_autopilot()
+    test_tower_env()
+    test_vector_env()
+    test_particle_system()
+    test_fire_effects()
+    test_emission_scheduler()
+    test_boss_volley_after_death()
+    test_entity_registry()
+    test_enemy_index()
+    test_steering_system()
+    test_neighbor_grid()
+    test_enemy_separation()
+    test_ai_scheduler()
+    test_pyromane_think_timing()
     print("Tout les jeux de test des systèmes fonctionnent !")
 
@@ -1,4 +1,9 @@
 from src.utils.queue import Queue, WaveQueue
+from src.utils.sprite_cache import CircleSpriteCache
+from src.utils.assets import AssetManager
+from src.utils.text_cache import TextCache
+from src.utils.pattern_cache import PatternCache
+from src.utils import rng
 
 def test_queue_op():
     """Test des opérations de base de la file"""
@@ -109,6 +114,136 @@ def test_wave_queue_remaining():
     wave1 = wave_queue.get_next_wave()
     assert wave_queue.get_remaining_waves_count() == 2
 
+def test_circle_sprite_cache():
+    """Test du cache de cercles pré-rendus"""
+    cache = CircleSpriteCache(max_bytes=3 * 10 * 10 * 16, alpha_step=8)
+    
+    # Même rayon, couleur et palier d'alpha : un seul sprite
+    sprite = cache.get(10, (255, 0, 0), 100)
+    assert sprite.get_size() == (20, 20)
+    assert cache.get(10.6, (255, 0, 0, 50), 98) is sprite
+    assert cache.hits == 1 and cache.misses == 1
+    
+    # Rayon nul : rien à dessiner
+    assert cache.get(0, (255, 0, 0)) is None
+    
+    # Plafond mémoire : le moins récemment utilisé est évincé
+    cache.get(10, (0, 255, 0))
+    cache.get(10, (0, 0, 255))
+    cache.get(10, (255, 0, 0), 100)  # Redevient le plus récent
+    cache.get(10, (255, 255, 255))
+    assert len(cache) == 3
+    assert cache.evictions == 1
+    assert cache.get(10, (255, 0, 0), 100) is sprite
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+def test_asset_manager():
+    """Test du gestionnaire d'images"""
+    manager = AssetManager()
+    
+    # Chemins Windows et casse du nom de fichier corrigés
+    assert manager.normalize(r"assets\images\cadre.png") == "assets/images/cadre.png"
+    assert manager.normalize("assets/images/perks_icons/Heal_icon.png") == "assets/images/perks_icons/Heal_Icon.png"
+    
+    # Une seule lecture sur le disque pour le même fichier
+    image = manager.image(r"assets\images\cadre.png")
+    assert manager.image("assets/images/cadre.png") is image
+    assert manager.loads == 1
+    
+    # Versions redimensionnées gardées par taille, oubliées au redimensionnement
+    scaled = manager.scaled("assets/images/cadre.png", (200, 50))
+    assert scaled.get_size() == (200, 50)
+    assert manager.scaled("assets/images/cadre.png", (200, 50)) is scaled
+    manager.invalidate_scaled()
+    assert manager.scaled("assets/images/cadre.png", (200, 50)) is not scaled
+    assert manager.loads == 1
+
+def test_text_cache():
+    """Test du cache de textes rendus"""
+    class MockFont:
+        def __init__(self):
+            self.renders = 0
+        
+        def render(self, text, antialias, color, background=None):
+            self.renders += 1
+            return (text, tuple(color))
+    
+    font = MockFont()
+    cache = TextCache(max_entries=2)
+    
+    # Un texte identique n'est rendu qu'une fois
+    surface = cache.render(font, "Score: 10", True, (255, 255, 255))
+    assert cache.render(font, "Score: 10", True, [255, 255, 255]) is surface
+    assert font.renders == 1
+    assert cache.hits == 1 and cache.misses == 1
+    
+    # Une autre couleur est un autre rendu
+    cache.render(font, "Score: 10", True, (255, 0, 0))
+    assert font.renders == 2
+    
+    # Éviction LRU au-delà de la taille maximale
+    cache.render(font, "Score: 20", True, (255, 255, 255))
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    cache.render(font, "Score: 10", True, (255, 255, 255))
+    assert font.renders == 4
+
+def test_pattern_cache():
+    """Test du cache de templates de patterns"""
+    builds = []
+    def build(count):
+        builds.append(count)
+        return {'count': count}
+    
+    cache = PatternCache(max_entries=2)
+    
+    # Un template n'est construit qu'une fois par clé
+    template = cache.get(('burst', 8), build, 8)
+    assert cache.get(('burst', 8), build, 8) is template
+    assert builds == [8]
+    
+    # Éviction LRU au-delà de la taille maximale
+    cache.get(('burst', 10), build, 10)
+    cache.get(('burst', 8), build, 8)  # Redevient le plus récent
+    cache.get(('burst', 12), build, 12)
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get(('burst', 8), build, 8) is template
+    
+    stats = cache.stats()
+    assert stats["hits"] == 3 and stats["misses"] == 3
+    assert stats["hit_rate"] == 0.5
+
+def test_rng_streams():
+    """Test des flux aléatoires indépendants par sous-système"""
+    # Graine dérivée stable (indépendante du lancement de Python)
+    assert rng.derive_seed(42, "waves") == rng.derive_seed(42, "waves")
+    assert rng.derive_seed(42, "waves") != rng.derive_seed(42, "fx")
+    assert rng.derive_seed(42, "waves") != rng.derive_seed(43, "waves")
+    
+    # Même seed : mêmes tirages
+    streams = rng.RngStreams(42)
+    first = [streams.waves.random() for _ in range(5)]
+    waves = streams.waves
+    streams.seed_all(42)
+    assert streams.waves is waves  # Resemé sur place : les sous-systèmes gardent leur générateur
+    
+    # Les tirages cosmétiques ne changent pas ceux de la partie
+    for _ in range(100):
+        streams.fx.random()
+    assert [streams.waves.random() for _ in range(5)] == first
+    
+    # Les flux d'une autre partie (autre scène) sont indépendants
+    other = rng.RngStreams(42)
+    for _ in range(100):
+        other.waves.random()
+    streams.seed_all(42)
+    assert [streams.waves.random() for _ in range(5)] == first
+    
+    # Un flux créé après le semis suit la seed courante
+    assert streams.stream("test") is streams.stream("test")
+    assert streams.stream("test").random() == rng.RngStreams(42).stream("test").random()
+    assert rng.child_random(7, "boss/1").random() == rng.child_random(7, "boss/1").random()
+
 # Exécuter tous les tests
 def fonction_test_utils():
     test_queue_op()
@@ -116,4 +251,9 @@ def fonction_test_utils():
     test_queue_mixed_types()
     test_queue_limite()
     test_wave_queue_remaining()
+    test_circle_sprite_cache()
+    test_asset_manager()
+    test_text_cache()
+    test_pattern_cache()
+    test_rng_streams()
     print("Tout les jeux de test des utilitaires fonctionnent !")